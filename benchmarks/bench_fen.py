@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+# Measures FEN parsing and writing rates, in FENs/sec, over positions
+# taken from seeded random play.
+# Usage: python -m benchmarks.bench_fen [--positions N] [--repeat R]
+
+import argparse
+import random
+import sys
+import time
+
+from src.board import Board
+from src.controller import RandomPlayer
+from src.game_state import GameState
+from src.geometry import Geometry as G
+
+
+def get_fens(position_count: int, seed=0):
+    random.seed(seed)
+    fens = []
+    board = Board()
+    while len(fens) < position_count:
+        # Start a new Game when one ends (including by a draw), or runs long.
+        if (board.game_state not in (GameState.Unstarted, GameState.InPlay)
+                or board.halfmove_count >= 200):
+            board = Board()
+        board.move_make(RandomPlayer.choose_move(board))
+        fens.append(board.get_fen())
+    return fens
+
+
+def get_rate(func, items, repeat: int) -> float:
+    time_start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            func(item)
+    return repeat * len(items) / (time.perf_counter() - time_start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark FEN parsing and writing')
+    parser.add_argument('--positions', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    RandomPlayer.is_verbose = False
+    fens = get_fens(args.positions)
+    fen_boards = [fen.split()[0] for fen in fens]
+    boards = [Board(fen) for fen in fens]
+
+    rates = {
+        'parse_fen_board_pieces': get_rate(G.fen_board_to_pieces, fen_boards, args.repeat),
+        'parse_fen_board_layout_dict': get_rate(G.fen_board_to_layout_dict, fen_boards, args.repeat),
+        'board_from_fen': get_rate(Board, fens, args.repeat),
+        'board_to_fen': get_rate(Board.get_fen, boards, args.repeat),
+        }
+    for name, rate in rates.items():
+        print(f'{name:30s} {rate:12,.0f} FENs/sec')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+# Measures the time taken to import each of the package's entry-point
+# modules, using "python -X importtime" in a fresh interpreter per run,
+# and reports the slowest imports beneath each one. Each module's time is
+# the minimum over the runs, after one untimed run that writes bytecode.
+# Usage: python -m benchmarks.bench_import [--repeat R] [--top N]
+#            [--budget-ms MS] [--json] [module ...]
+# With --budget-ms, the exit status is nonzero if any module's import
+# takes longer than the budget.
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# The modules imported by short-lived tools. src.board alone is what a
+# "load a FEN, list the legal moves" script needs.
+DEFAULT_MODULES = [
+        'src.board',
+        'src.pgn',
+        'src.game',
+        'src.match',
+        'src.uci',
+        'src.server',
+        ]
+
+# (module name, self time in us, cumulative time in us)
+ImportTime = Tuple[str, int, int]
+
+
+# Parses the stderr of "python -X importtime", whose lines have the form
+#   import time: <self us> | <cumulative us> | <indented module name>
+def parse_import_times(text: str) -> List[ImportTime]:
+    result = []
+    for line in text.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header line
+        result.append((fields[2].strip(), int(fields[0]), int(fields[1])))
+    return result
+
+
+def get_import_times(module: str) -> List[ImportTime]:
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                          capture_output=True, text=True, env=env, check=True)
+    return parse_import_times(proc.stderr)
+
+
+# Returns (total ms, {imported module name: self ms}), each the minimum over runs.
+def measure(module: str, repeat: int) -> Tuple[float, Dict[str, float]]:
+    get_import_times(module)
+    total_us = None
+    self_us: Dict[str, int] = {}
+    for _ in range(repeat):
+        import_times = get_import_times(module)
+        cumulative = next(cum for name, _, cum in reversed(import_times) if name == module)
+        total_us = cumulative if total_us is None else min(total_us, cumulative)
+        for name, self_time, _ in import_times:
+            self_us[name] = min(self_us.get(name, self_time), self_time)
+    return total_us / 1000, {name: us / 1000 for name, us in self_us.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark module import times')
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=5,
+                        help='Number of slowest imports (by self time) to list per module')
+    parser.add_argument('--budget-ms', type=float,
+                        help='Fail if any module takes longer than this to import')
+    parser.add_argument('--json', action='store_true', help='Write results as JSON')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for module in args.modules:
+        total_ms, self_ms = measure(module, args.repeat)
+        top = sorted(self_ms.items(), key=lambda item: item[1], reverse=True)[:args.top]
+        results[module] = {'total_ms': round(total_ms, 2), 'module_count': len(self_ms),
+                           'top_self_ms': {name: round(ms, 2) for name, ms in top}}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for module, result in results.items():
+            print(f'{module:20s} {result["total_ms"]:8.2f} ms  '
+                  + f'({result["module_count"]} modules imported)')
+            for name, ms in result['top_self_ms'].items():
+                print(f'    {name:36s} {ms:8.2f} ms')
+
+    if args.budget_ms is not None:
+        over = [module for module, result in results.items()
+                if result['total_ms'] > args.budget_ms]
+        if over:
+            print(f'Over the {args.budget_ms} ms budget: {", ".join(over)}', file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+# A suite of micro- and macro-benchmarks, with results written as JSON, so
+# that runs on different commits can be compared.
+# Usage: python -m benchmarks.suite [--out results.json] [--compare base.json]
+#            [--only name,...] [--positions N] [--games N] [--repeat R]
+#
+# The inputs are taken from the PGN files in data/pgn, not from random
+# play, so they don't change when move generation order does:
+#   * positions: every POSITION_STRIDE-th position of the replayed games
+#   * tokens: the movetext tokens of the games
+# Each benchmark is run --repeat times (macro-benchmarks, --macro-repeat
+# times), and its best time is reported, as a rate in its own unit.
+# Progress, and any comparison, are written to stderr.
+# Games with movetext that doesn't resolve to exactly one legal move (or
+# that continues after the Board finds the Game over) are replayed up to
+# that move; PGN files that don't parse are skipped. Both are counted in
+# the results, since they change what is measured.
+
+import argparse
+from dataclasses import dataclass, field
+import glob
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from src.board import Board
+from src.game_state import GameState
+from src.move import Move
+from src.pgn import Pgn, GameSpec, MOVE_TEXT_TO_RESULT
+
+POSITION_STRIDE = 7
+NON_MOVE_TEXTS = set(MOVE_TEXT_TO_RESULT) | {'', '...'}
+IN_PLAY_STATES = (GameState.Unstarted, GameState.InPlay)
+
+
+@dataclass
+class Corpus:
+    # (lang, GameSpec)
+    game_specs: List[Tuple[str, GameSpec]] = field(default_factory=list)
+    # (lang, movetext token)
+    tokens: List[Tuple[str, str]] = field(default_factory=list)
+    fens: List[str] = field(default_factory=list)
+    boards: List[Board] = field(default_factory=list)
+    # (Board, its legal Moves), for make/undo
+    moves_legal: List[Tuple[Board, List[Move]]] = field(default_factory=list)
+    files_skipped: List[str] = field(default_factory=list)
+    games_incomplete: int = 0
+
+
+def get_pgn_lang(path: str) -> str:
+    return 'hu' if path.endswith('_hu.pgn') else 'en'
+
+
+def get_move_texts(game_spec: GameSpec) -> List[str]:
+    return [move_text for move_text in Pgn.move_lines_to_move_texts(game_spec[1])
+            if move_text not in NON_MOVE_TEXTS]
+
+
+# Replays a Game's movetext, calling on_board (if given) after each move.
+# Returns the number of moves made, and whether the whole Game was replayed.
+def replay(game_spec: GameSpec, lang: str, on_board: Callable[[Board], None]=None) -> Tuple[int, bool]:
+    board = Board()
+    move_count = 0
+    for move_text in get_move_texts(game_spec):
+        if board.get_game_state() not in IN_PLAY_STATES:
+            return move_count, False
+        try:
+            move_spec = Pgn.move_text_to_move_spec(move_text, lang)
+        except ValueError:
+            return move_count, False
+        moves = board.get_moves_matching(move_spec, move_text)
+        if len(moves) != 1:
+            return move_count, False
+        board.move_make(moves[0])
+        move_count += 1
+        if on_board is not None:
+            on_board(board)
+    return move_count, True
+
+
+def get_corpus(pgn_dir: str, position_count: int, game_count: int) -> Corpus:
+    corpus = Corpus()
+    for path in sorted(glob.glob(os.path.join(pgn_dir, '*.pgn'))):
+        lang = get_pgn_lang(path)
+        try:
+            game_specs = Pgn.pgn_lines_to_game_specs(Pgn.get_pgn_lines(path))
+        except ValueError:
+            corpus.files_skipped.append(os.path.basename(path))
+            continue
+        if game_count:
+            game_specs = game_specs[:game_count]
+        for game_spec in game_specs:
+            corpus.game_specs.append((lang, game_spec))
+            corpus.tokens.extend((lang, move_text) for move_text in get_move_texts(game_spec))
+
+    positions_seen = [0]
+    def on_board(board: Board):
+        positions_seen[0] += 1
+        if (positions_seen[0] % POSITION_STRIDE == 0
+                and len(corpus.boards) < position_count
+                and board.get_game_state() in IN_PLAY_STATES):
+            corpus.boards.append(board.clone())
+    for lang, game_spec in corpus.game_specs:
+        _, is_complete = replay(game_spec, lang, on_board)
+        if not is_complete:
+            corpus.games_incomplete += 1
+    corpus.fens = [board.get_fen() for board in corpus.boards]
+    corpus.moves_legal = [(board, board.get_moves_legal()) for board in corpus.boards]
+    return corpus
+
+
+# ========================================
+# SECTION: BENCHMARKS
+# ========================================
+# Each benchmark does its work over the Corpus once, and returns the
+# number of operations done (in the benchmark's unit).
+
+def bench_moves_legal(corpus: Corpus) -> int:
+    for board in corpus.boards:
+        board.get_moves_legal()
+    return len(corpus.boards)
+
+
+def bench_moves_pseudolegal(corpus: Corpus) -> int:
+    for board in corpus.boards:
+        board.get_moves_pseudolegal()
+    return len(corpus.boards)
+
+
+def bench_moves_packed(corpus: Corpus) -> int:
+    buf = Move.new_buffer()
+    for board in corpus.boards:
+        board.fill_moves_pseudolegal(buf)
+    return len(corpus.boards)
+
+
+def get_make_undo_bench(do_partial_only: bool) -> Callable[[Corpus], int]:
+    def bench_make_undo(corpus: Corpus) -> int:
+        count = 0
+        for board, moves in corpus.moves_legal:
+            for move in moves:
+                board.move_make(move, do_partial_only)
+                board.move_undo(do_partial_only)
+            count += len(moves)
+        return count
+    return bench_make_undo
+
+
+def bench_zobrist_hash(corpus: Corpus) -> int:
+    for board in corpus.boards:
+        board.get_zobrist_hash()
+    return len(corpus.boards)
+
+
+# Pgn caches parsed MoveSpecs, so the parser itself is timed directly.
+def bench_move_spec_parse(corpus: Corpus) -> int:
+    parse = Pgn._move_text_to_move_spec_cached.__wrapped__  # pylint: disable=protected-access
+    for lang, token in corpus.tokens:
+        parse(token, lang)
+    return len(corpus.tokens)
+
+
+def bench_move_spec_cached(corpus: Corpus) -> int:
+    for lang, token in corpus.tokens:
+        Pgn.move_text_to_move_spec(token, lang)
+    return len(corpus.tokens)
+
+
+def bench_fen_round_trip(corpus: Corpus) -> int:
+    for fen in corpus.fens:
+        if Board(fen).get_fen() != fen:
+            raise ValueError(f'FEN round trip failed: {fen}')
+    return len(corpus.fens)
+
+
+def bench_pgn_replay(corpus: Corpus) -> int:
+    return sum(replay(game_spec, lang)[0] for lang, game_spec in corpus.game_specs)
+
+
+# name -> (function, unit, is_macro)
+BENCHMARKS: Dict[str, Tuple[Callable[[Corpus], int], str, bool]] = {
+        'moves_legal':       (bench_moves_legal, 'positions', False),
+        'moves_pseudolegal': (bench_moves_pseudolegal, 'positions', False),
+        'moves_packed':      (bench_moves_packed, 'positions', False),
+        'make_undo':         (get_make_undo_bench(False), 'moves', False),
+        'make_undo_partial': (get_make_undo_bench(True), 'moves', False),
+        'zobrist_hash':      (bench_zobrist_hash, 'positions', False),
+        'move_spec_parse':   (bench_move_spec_parse, 'tokens', False),
+        'move_spec_cached':  (bench_move_spec_cached, 'tokens', False),
+        'fen_round_trip':    (bench_fen_round_trip, 'FENs', False),
+        'pgn_replay':        (bench_pgn_replay, 'moves', True),
+        }
+
+
+def run_bench(func: Callable[[Corpus], int], corpus: Corpus, repeat: int) -> Tuple[int, float]:
+    best_secs = None
+    for _ in range(repeat):
+        time_start = time.perf_counter()
+        op_count = func(corpus)
+        secs = time.perf_counter() - time_start
+        best_secs = secs if best_secs is None else min(best_secs, secs)
+    return op_count, best_secs
+
+
+# ========================================
+# SECTION: RESULTS
+# ========================================
+def get_git_commit() -> str:
+    try:
+        proc = subprocess.run(['git', 'describe', '--always', '--dirty'],
+                              capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)))
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return proc.stdout.strip()
+
+
+def print_comparison(results: Dict, base_results: Dict, out=sys.stderr) -> None:
+    print(f'{"benchmark":20s} {"base":>14s} {"this":>14s}  change', file=out)
+    for name, result in results['benchmarks'].items():
+        base = base_results['benchmarks'].get(name)
+        if base is None:
+            continue
+        ratio = result['rate'] / base['rate']
+        print(f'{name:20s} {base["rate"]:14,.0f} {result["rate"]:14,.0f}  {ratio - 1:+7.1%}',
+              file=out)
+    if results['corpus'] != base_results['corpus']:
+        print('Warning: The corpora differ, so the results may not be comparable.', file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the benchmark suite')
+    parser.add_argument('--out', help='Path of the JSON results file (default: stdout)')
+    parser.add_argument('--compare', help='Path of an earlier JSON results file to compare with')
+    parser.add_argument('--only', help='Comma-separated names of the benchmarks to run')
+    parser.add_argument('--positions', type=int, default=1000)
+    parser.add_argument('--games', type=int, default=0,
+                        help='Number of Games to use from each PGN file (default: all)')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--macro-repeat', type=int, default=1)
+    parser.add_argument('--pgn-dir', default=os.path.join(
+                        os.getenv('GLINSKI_HOME', '.'), 'data', 'pgn'))
+    args = parser.parse_args(argv)
+
+    names = args.only.split(',') if args.only else list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error(f'Unknown benchmark: {name}')
+
+    corpus = get_corpus(args.pgn_dir, args.positions, args.games)
+    results = {
+            'commit': get_git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'corpus': {
+                'games': len(corpus.game_specs),
+                'games_incomplete': corpus.games_incomplete,
+                'files_skipped': corpus.files_skipped,
+                'positions': len(corpus.boards),
+                'tokens': len(corpus.tokens),
+                },
+            'benchmarks': {},
+            }
+    for name in names:
+        func, unit, is_macro = BENCHMARKS[name]
+        repeat = args.macro_repeat if is_macro else args.repeat
+        op_count, secs = run_bench(func, corpus, repeat)
+        results['benchmarks'][name] = {
+                'unit': unit, 'count': op_count, 'repeat': repeat,
+                'best_secs': round(secs, 6), 'rate': round(op_count / secs, 1),
+                }
+        print(f'{name:20s} {op_count / secs:14,.0f} {unit}/sec', file=sys.stderr)
+
+    results_str = json.dumps(results, indent=2)
+    if args.out:
+        with open(args.out, 'w') as f:
+            f.write(results_str + '\n')
+    else:
+        print(results_str)
+    if args.compare:
+        with open(args.compare) as f:
+            print_comparison(results, json.load(f))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+from typing import List, Optional, Tuple
+
+from bitarray.util import count_and
+
+from src.bitboard import BitBoard, BITBOARD_SPACES
+from src.geometry import Geometry as G
+from src.geometry import Npos
+from src.piece import Piece
+from src.piece_type import PieceType, PIECE_TYPES, PIECE_TYPE_COUNT
+from src.player import Player, PLAYERS, PLAYER_COUNT
+
+
+# The spaces each Player's Pieces attack, as bitboards, for evaluation
+# terms that are popcounts of attack masks (mobility, center control,
+# King zone attacks, and hanging Pieces), rather than counts of generated
+# Moves. A Piece attacks the spaces it could capture on, whatever occupies
+# them, so a Piece that is attacked by its own side is defended. Pawns
+# attack only their capture spaces, and e.p. is ignored.
+#
+# The masks are precomputed from the Geometry leap and ray tables:
+#   * leapers (King, Knight) and Pawns: one mask per space
+#   * sliders: for each ray from each space, a mask of its first k+1
+#     spaces, for each k, so that a ray is masked up to its first blocker
+#     with a single OR.
+# The tables below are indexed by PieceType.value (or Player.value), then
+# by npos, with None marking a PieceType that has no such table.
+
+def get_mask(nposs) -> BitBoard:
+    result = BitBoard(G.SPACE_COUNT)
+    for npos in nposs:
+        result |= BITBOARD_SPACES[npos]
+    return result
+
+
+def get_ray_prefix_masks(ray: Tuple[Npos, ...]) -> Tuple[BitBoard, ...]:
+    return tuple(get_mask(ray[:k + 1]) for k in range(len(ray)))
+
+
+LEAP_MASKS_BY_PT: Tuple[Optional[Tuple[BitBoard, ...]], ...] = tuple(
+        None if leaps is None else tuple(get_mask(leaps[npos]) for npos in range(G.SPACE_COUNT))
+        for leaps in G.LEAPS_BY_PT)
+
+RAY_PREFIX_MASKS_BY_PT: Tuple[Optional[Tuple[Tuple[Tuple[BitBoard, ...], ...], ...]], ...] = tuple(
+        None if rays is None else tuple(
+                tuple(get_ray_prefix_masks(ray) for ray in rays[npos])
+                for npos in range(G.SPACE_COUNT))
+        for rays in G.RAYS_BY_PT)
+
+PAWN_ATTACK_MASKS: Tuple[Tuple[BitBoard, ...], ...] = tuple(
+        tuple(get_mask(capts[npos]) for npos in range(G.SPACE_COUNT))
+        for capts in (G.LEAP_PAWN_CAPT_BLACK, G.LEAP_PAWN_CAPT_WHITE))
+
+
+KING_VALUE = PieceType.King.value
+PAWN_VALUE = PieceType.Pawn.value
+
+# Indexed by Piece.code - 1: the leap (or Pawn capture) masks of the
+# Pieces that have them, or None for sliders
+LEAP_MASKS_BY_CODE: Tuple[Optional[Tuple[BitBoard, ...]], ...] = tuple(
+        PAWN_ATTACK_MASKS[player.value] if pt == PieceType.Pawn else LEAP_MASKS_BY_PT[pt.value]
+        for player in PLAYERS for pt in PIECE_TYPES)
+
+
+class AttackMap:
+    # Lists below are indexed by Player.value.
+    #   * occupied: the spaces occupied by the Player's Pieces
+    #   * attacks: the spaces attacked by any of the Player's Pieces
+    #   * mobility: indexed by PieceType.value, the number of spaces not
+    #     occupied by the Player's own Pieces that each PieceType attacks,
+    #     summed over the Player's Pieces of that PieceType (except Pawns)
+    #   * king_npos: the location of the Player's King, or None
+    def __init__(self, pieces: List[Optional[Piece]]):
+        self.occupied = [BitBoard(G.SPACE_COUNT) for _ in range(PLAYER_COUNT)]
+        self.attacks = [BitBoard(G.SPACE_COUNT) for _ in range(PLAYER_COUNT)]
+        self.mobility = [[0] * PIECE_TYPE_COUNT for _ in range(PLAYER_COUNT)]
+        self.king_npos: List[Optional[Npos]] = [None] * PLAYER_COUNT
+
+        # Player and PieceType values are derived from Piece.code, since
+        # reading Enum values is comparatively slow.
+        placed = [(npos, piece.code - 1) for npos, piece in enumerate(pieces) if piece is not None]
+        for npos, code_ind in placed:
+            self.occupied[code_ind // PIECE_TYPE_COUNT][npos] = 1
+        for npos, code_ind in placed:
+            p_val, pt_val = divmod(code_ind, PIECE_TYPE_COUNT)
+            leap_masks = LEAP_MASKS_BY_CODE[code_ind]
+            if leap_masks is not None:
+                mask = leap_masks[npos]
+                if pt_val == PAWN_VALUE:
+                    self.attacks[p_val] |= mask
+                    continue
+                if pt_val == KING_VALUE:
+                    self.king_npos[p_val] = npos
+            else:
+                mask = self.get_slider_attacks(pieces, npos, pt_val)
+            self.attacks[p_val] |= mask
+            self.mobility[p_val][pt_val] += mask.count() - count_and(mask, self.occupied[p_val])
+
+    # The spaces of the Player's Pieces that the opponent attacks, and that
+    # the Player doesn't defend
+    def get_hanging(self, player: Player) -> BitBoard:
+        p_val = player.value
+        o_val = player.opponent().value
+        return self.occupied[p_val] & self.attacks[o_val] & ~self.attacks[p_val]
+
+    @classmethod
+    def get_slider_attacks(cls, pieces: List[Optional[Piece]], npos: Npos,
+            pt_val: int) -> BitBoard:
+        result = BitBoard(G.SPACE_COUNT)
+        for ray, prefix_masks in zip(G.RAYS_BY_PT[pt_val][npos],
+                                     RAY_PREFIX_MASKS_BY_PT[pt_val][npos]):
+            k = 0
+            for k, ray_npos in enumerate(ray):
+                if pieces[ray_npos] is not None:
+                    break  # Can't see past piece
+            result |= prefix_masks[k]
+        return result
+
+    @classmethod
+    def get_piece_attacks(cls, pieces: List[Optional[Piece]], npos: Npos,
+            piece: Piece) -> BitBoard:
+        leap_masks = LEAP_MASKS_BY_CODE[piece.code - 1]
+        if leap_masks is not None:
+            return leap_masks[npos]
+        return cls.get_slider_attacks(pieces, npos, piece.pt.value)
@@ -92,7 +92,7 @@ BB_COURT_WHITE = (BB_C1
         | BB_E3 | BB_E2 | BB_E1
         | BB_F4 | BB_F3 | BB_F2 | BB_F1
         | BB_G3 | BB_G2 | BB_G1
-        | BB_H2 | BB_H2
+        | BB_H2 | BB_H1
         | BB_I1)
 
 # ========================================
@@ -2,35 +2,53 @@
 # by Jay M. Coskey, 2026
 # pylint: disable=fixme, too-many-instance-attributes, too-many-public-methods
 
-from bitarray import bitarray
 from collections import Counter
-from copy import copy, deepcopy
 import math
 import os
+import struct
 from typing import Dict, Iterable, Iterator, List, Union
 
 from src.bitboard import BB_COURT_BLACK, BB_COURT_WHITE
 from src.bitboard import BB_PAWN_HOME_BLACK, BB_PAWN_HOME_WHITE
 from src.bitboard import BB_PAWN_PROMO_BLACK, BB_PAWN_PROMO_WHITE
 from src.bitboard import BITBOARD_FILES
-from src.board_color import BoardColor
+from src.board_color import BoardColor, BOARD_COLOR_COUNT
 from src.board_error_flags import BoardErrorFlags
-from src.board_error_flags import MissingKingException, PawnOnBackRankException
+from src.board_error_flags import MissingKingException
 from src.board_state import BoardState
 from src.game_state import GameState
 from src.geometry import Geometry as G
 from src.geometry import LayoutDict, Npos
 from src.hex_pos import HexPos
 from src.hex_vec import HexVec
-from src.move import Move
-from src.move_spec import MoveSpec
-from src.piece import Piece
+from src.material import MAJOR_OR_PAWN_PTS, NO_CHECKMATE_MATERIAL_KEYS, NPOS_TO_BOARD_COLOR_VALUE
+from src.move import Move, MoveBuffer
+from src.move import PACKED_CAPTURE_SHIFT, PACKED_EP_FLAG, PACKED_PROMOTION_SHIFT
+from src.move import PACKED_PT_SHIFT, PACKED_TO_SHIFT
+from src.piece import Piece, CODE_TO_PIECE, PLAYER_PT_TO_FEN_SYMBOL
 from src.piece_type import PieceType
 from src.piece_type import PIECE_TYPES, PIECE_TYPE_COUNT, PROMO_PTS
-from src.player import Player, PLAYER_COUNT
+from src.player import Player, PLAYERS, PLAYER_COUNT
 from src.zobrist import ZobristHash, ZOBRIST_TABLE
 
 
+# Board.to_bytes() format: 46 bytes of piece codes, two per byte
+# (high nibble first, padded to an even count), followed by
+#   (cur_player.value, ep_target or 0xFF, nonprogress count, halfmove_count).
+BYTES_PIECES_SIZE = (G.SPACE_COUNT + 1) // 2
+BYTES_STATE_FORMAT = '<BBHH'
+BYTES_SIZE = BYTES_PIECES_SIZE + struct.calcsize(BYTES_STATE_FORMAT)
+BYTES_EP_NONE = 0xFF
+
+# Bits of packed Moves (see src.move), for Board.fill_moves_pseudolegal()
+PAWN_VALUE = PieceType.Pawn.value
+PROMOTION_BITS = tuple((pt.value + 1) << PACKED_PROMOTION_SHIFT for pt in PROMO_PTS)
+# Indexed by Piece.code - 1: the bits of a capture of that Piece
+CAPTURE_BITS_BY_CODE = tuple((pt.value + 1) << PACKED_CAPTURE_SHIFT
+                             for _ in PLAYERS for pt in PIECE_TYPES)
+EP_CAPTURE_BITS = ((PAWN_VALUE + 1) << PACKED_CAPTURE_SHIFT) | PACKED_EP_FLAG
+
+
 class Board:
     # ========================================
     # SECTION: CONSTRUCTOR
@@ -43,12 +61,10 @@ class Board:
     def __init__(self, layout:Union[str, LayoutDict]=None):
         self.do_check_repetition = True
         if layout is None:
-            layout_dict = deepcopy(G.INIT_LAYOUT_DICT)
-            self.init_layout(layout_dict)
+            self.pieces = list(G.INIT_PIECES)
             self.init_defaults()
         elif type(layout) == dict:
-            layout_dict = deepcopy(layout)
-            self.init_layout(layout_dict)
+            self.init_layout(layout)  # The layout is only read, so it isn't copied.
             self.init_defaults()
         elif type(layout) == str:
             fen_parts = layout.split()
@@ -57,77 +73,160 @@ class Board:
                     + f'to be a FEN string with {len(fen_parts)} parts. '
                     + 'It should have 1 or 6.')
                 raise ValueError(f'Board constructor: {msg}')
+            # FEN part #1 (Board layout) is parsed directly into self.pieces.
+            self.pieces = G.fen_board_to_pieces(fen_parts[0])
             if len(fen_parts) == 1:
-                fen_board_str = fen_parts[0]
-                layout_dict = G.fen_board_to_layout_dict(fen_board_str)
-                self.init_layout(layout_dict)
                 self.init_defaults()
-            else:  # len(layout_chunks) == 6, so layout should be a full FEN string
-                (fen_board_str, cur_player, ep_tgt_str,
-                        nonprogress_ctr, fullmove_count,
-                        halfmove_count) = Pgn.fen_to_fen_info(layout_fen)
-                nones = [None] * (self.halfmove_count + 1)
-                ind = self.halfmove_count
-
-                # FEN part #1 (Board layout)
-                layout_dict = G.fen_board_to_layout_dict(fen_board_str)
-                self.init_layout(layout_dict)
-
-                self.cur_player = cur_player  # FEN part #2
-
-                # FEN part #3 regards castling, which is not allowed in Glinski's hexagonal chess.
-
-                self.halfmove_count = halfmove_count  # FEN part #6
-
-                self.history_ep_target = copy(nones)
-                self.history_ep_target[ind] = None if ep_tgt_str == '-' else G.alg_to_npos(ep_tgt_str)  # FEN part #4
-
-                self.history_nonprogress_halfmove_count[ind] = int(nonprogress_str)  # FEN part #5
-
-                self.history_move = copy(nones)
-                self.history_zobrist_hash = copy(nones)
-
-                self.history_is_check = copy(nones)
-                self.history_is_checkmate = copy(nones)
-                self.history_is_repetition_3x = copy(nones)
-                self.history_is_repetition_5x = copy(nones)
-                self.history_is_stalemate = copy(nones)
-
+            else:  # len(fen_parts) == 6, so layout should be a full FEN string
+                self.init_defaults(*self.fen_parts_to_state(fen_parts))
                 self.set_game_state(GameState.InPlay)
         else:
-            ValueError('Board constructor arg has unrecognized type: '
+            raise ValueError('Board constructor arg has unrecognized type: '
                 + f'{type(layout)}: {layout}')
 
-    def init_defaults(self) -> None:
+    # Returns (cur_player, halfmove_count, ep_target, nonprogress_count)
+    #   from FEN parts #2 through #6.
+    # FEN part #3 regards castling, which is not allowed in Glinski's hexagonal chess.
+    @classmethod
+    def fen_parts_to_state(cls, fen_parts: List[str]):
+        _, player_str, _, ep_str, nonprogress_str, fullmove_str = fen_parts
+        if player_str == 'w':
+            cur_player = Player.White
+        elif player_str == 'b':
+            cur_player = Player.Black
+        else:
+            raise ValueError(f'Invalid FEN string: Unrecognized Player {player_str}')
+        halfmove_count = (2 * (int(fullmove_str) - 1)
+                + (1 if cur_player == Player.Black else 0))
+        ep_target = None if ep_str == '-' else G.alg_to_npos(ep_str)
+        return cur_player, halfmove_count, ep_target, int(nonprogress_str)
+
+    # When a Board is created from a FEN string, its history is unknown,
+    #   so entries before halfmove_count are None.
+    def init_defaults(self, cur_player=Player.White, halfmove_count=0,
+            ep_target=None, nonprogress_count=0) -> None:
         # Board layout is addressed elsewhere.
+        nones = [None] * halfmove_count
+
         ####################
         # Info that is provided by a FEN string.
         ####################
-        self.cur_player = Player.White
-        self.halfmove_count = 0
-        self.history_nonprogress_halfmove_count = [0]
-        self.history_ep_target = [None]  # Pawns destinations used for en passant capture
+        self.cur_player = cur_player
+        self.halfmove_count = halfmove_count
+        self.history_nonprogress_halfmove_count = nones + [nonprogress_count]
+        self.history_ep_target = nones + [ep_target]  # Pawns destinations used for en passant capture
 
         ####################
         # Info not provided by a FEN string
         ####################
         self.set_game_state(GameState.Unstarted)
 
-        self.history_move = [None]  # The move resulting in the current Board position
-        self.history_zobrist_hash = [self.get_zobrist_hash()]
+        self.history_move = nones + [None]  # The move resulting in the current Board position
+        self.history_zobrist_hash = nones + [self.get_zobrist_hash()]
+
+        # The number of times each Zobrist hash in history_zobrist_hash occurs,
+        # and the greatest such number so far, maintained by move_make/move_undo.
+        self.zobrist_hash_counts = Counter([self.history_zobrist_hash[-1]])
+        self.history_max_repetition_count = nones + [1]
 
         # Note: Tracking computed values avoids recomputation upon rewind/ffwd.
         # Note: No storage is needed for the non-progress states
         #   (for the 50- & 75-move rules), since they just echo
         #   the non-progress counter.
-        self.history_is_check = [False]
-        self.history_is_checkmate = [False]
-        self.history_is_repetition_3x = [False]
-        self.history_is_repetition_5x = [False]
-        self.history_is_stalemate = [False]
+        self.history_is_check = nones + [False]
+        self.history_is_checkmate = nones + [False]
+        self.history_is_repetition_3x = nones + [False]
+        self.history_is_repetition_5x = nones + [False]
+        self.history_is_stalemate = nones + [False]
+
+        self.init_material_counts()
+
+    # Copies only the position and the state needed to continue play:
+    #   pieces, Player to move, e.p. target, counters, and Zobrist hash.
+    # With copy_history=False, earlier history entries are None,
+    #   as for a Board created from a FEN string, so repetitions of
+    #   earlier positions aren't detected.
+    # Moves and Pieces are shared, since neither is modified once made.
+    def clone(self, copy_history=False) -> 'Board':
+        board = Board.__new__(Board)
+        board.do_check_repetition = self.do_check_repetition
+        board.pieces = self.pieces.copy()
+        board.cur_player = self.cur_player
+        board.halfmove_count = self.halfmove_count
+        board.game_state = self.game_state
+        board.material_counts = self.material_counts.copy()
+        board.bishop_color_counts = self.bishop_color_counts.copy()
+        board.pawn_zobrist_hash = self.pawn_zobrist_hash
+        if hasattr(self, 'board_state'):
+            board.board_state = self.board_state
+
+        if copy_history:
+            board.history_nonprogress_halfmove_count = self.history_nonprogress_halfmove_count.copy()
+            board.history_ep_target = self.history_ep_target.copy()
+            board.history_move = self.history_move.copy()
+            board.history_zobrist_hash = self.history_zobrist_hash.copy()
+            board.zobrist_hash_counts = self.zobrist_hash_counts.copy()
+            board.history_max_repetition_count = self.history_max_repetition_count.copy()
+            board.history_is_check = self.history_is_check.copy()
+            board.history_is_checkmate = self.history_is_checkmate.copy()
+            board.history_is_repetition_3x = self.history_is_repetition_3x.copy()
+            board.history_is_repetition_5x = self.history_is_repetition_5x.copy()
+            board.history_is_stalemate = self.history_is_stalemate.copy()
+            return board
+
+        ind = self.halfmove_count
+        nones = [None] * ind
+        board.history_nonprogress_halfmove_count = nones + [self.history_nonprogress_halfmove_count[ind]]
+        board.history_ep_target = nones + [self.history_ep_target[ind]]
+        board.history_move = nones + [self.history_move[ind]]
+        board.history_zobrist_hash = nones + [self.history_zobrist_hash[ind]]
+        board.zobrist_hash_counts = Counter([self.history_zobrist_hash[ind]])
+        board.history_max_repetition_count = nones + [self.history_max_repetition_count[ind]]
+        board.history_is_check = nones + [self.history_is_check[ind]]
+        board.history_is_checkmate = nones + [self.history_is_checkmate[ind]]
+        board.history_is_repetition_3x = nones + [self.history_is_repetition_3x[ind]]
+        board.history_is_repetition_5x = nones + [self.history_is_repetition_5x[ind]]
+        board.history_is_stalemate = nones + [self.history_is_stalemate[ind]]
+        return board
+
+    # A fixed-size (52-byte) encoding of the position and the state needed
+    #   to continue play, for use as a dict key, or to pass a Board between
+    #   processes without pickling its history. See BYTES_STATE_FORMAT.
+    def to_bytes(self) -> bytes:
+        codes = [0 if piece is None else piece.code for piece in self.pieces]
+        codes.append(0)
+        ep_target = self.ep_target
+        return (bytes([codes[k] << 4 | codes[k + 1] for k in range(0, len(codes) - 1, 2)])
+                + struct.pack(BYTES_STATE_FORMAT, self.cur_player.value,
+                        BYTES_EP_NONE if ep_target is None else ep_target,
+                        self.nonprogress_halfmove_count, self.halfmove_count))
+
+    # As with a FEN string, the resulting Board's history is unknown.
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Board':
+        if len(data) != BYTES_SIZE:
+            raise ValueError(f'Board.from_bytes: Expected {BYTES_SIZE} bytes, got {len(data)}')
+        pieces = []
+        try:
+            for byte in data[:BYTES_PIECES_SIZE]:
+                pieces.append(CODE_TO_PIECE[byte >> 4])
+                pieces.append(CODE_TO_PIECE[byte & 0x0F])
+        except IndexError as e:
+            raise ValueError('Board.from_bytes: Unrecognized piece code') from e
+        pieces.pop()
+        player_value, ep_target, nonprogress_count, halfmove_count = struct.unpack(
+                BYTES_STATE_FORMAT, data[BYTES_PIECES_SIZE:])
+        board = Board.__new__(Board)
+        board.do_check_repetition = True
+        board.pieces = pieces
+        board.init_defaults(Player(player_value), halfmove_count,
+                None if ep_target == BYTES_EP_NONE else ep_target, nonprogress_count)
+        board.set_game_state(GameState.InPlay)
+        return board
 
     def init_layout(self, layout_dict: LayoutDict) -> None:
         self.pieces = [None for k in range(G.SPACE_COUNT)]
+        self.init_material_counts()
         for player in layout_dict.keys():
             for pt in layout_dict[player].keys():
                 for pos in layout_dict[player][pt]:
@@ -219,32 +318,27 @@ class Board:
         return f'{fen} {player} {castling} {ep} {nonprogress} {fullmove}'
 
     def get_fen_board(self) -> str:
-        result = ''
-        blank_count = 0
-
+        file_strs = []
         npos = 0
-        file_count = len(G.RANK_COUNT_PER_FILE)
-        for file_num in range(file_count):
-            for _ in range(G.RANK_COUNT_PER_FILE[file_num]):
-                cur_piece = self.get_piece_at(npos)
-                npos += 1
-                if cur_piece:
-                    if blank_count > 0:
-                        result += str(blank_count)
-                        blank_count = 0
-                    result += str(cur_piece)
-                else:
+        for rank_count in G.RANK_COUNT_PER_FILE:
+            file_str = ''
+            blank_count = 0
+            for piece in self.pieces[npos:npos + rank_count]:
+                if piece is None:
                     blank_count += 1
+                    continue
+                if blank_count > 0:
+                    file_str += str(blank_count)
+                    blank_count = 0
+                file_str += PLAYER_PT_TO_FEN_SYMBOL[(piece.player, piece.pt)]
             if blank_count > 0:
-                result += str(blank_count)
-                blank_count = 0
-            if file_num < file_count - 1:
-                result += '/'
-        return result
+                file_str += str(blank_count)
+            file_strs.append(file_str)
+            npos += rank_count
+        return '/'.join(file_strs)
 
     def get_king_npos(self, player: Player) -> Npos:
-        for npos in range(G.SPACE_COUNT):
-            piece = self.get_piece_at(npos)
+        for npos, piece in enumerate(self.pieces):
             if piece and piece.player == player and piece.pt == PieceType.King:
                 return npos
         # Missing King
@@ -264,8 +358,9 @@ class Board:
             layout_dict[player][pt].append(G.npos_to_pos(npos))
         return layout_dict
 
+    # Pieces are immutable (and shared; see CODE_TO_PIECE), so no copy is needed.
     def get_piece_at(self, npos: Npos) -> Piece:
-        return copy(self.pieces[npos])
+        return self.pieces[npos]
 
     def get_pieces_at_file(self, f: str,
             player:Player=None, pt:PieceType=None) -> Iterable[Piece]:
@@ -305,9 +400,8 @@ class Board:
     # All such values are XORed together to form the final result.
     def get_zobrist_hash(self) -> ZobristHash:
         result = 0
-        for npos in range(G.SPACE_COUNT):
-            piece = self.get_piece_at(npos)
-            if not self.is_empty(npos):
+        for npos, piece in enumerate(self.pieces):
+            if piece is not None:
                 p_val = piece.player.value
                 pt_val = piece.pt.value
                 zobrist_index = (npos * PLAYER_COUNT * PIECE_TYPE_COUNT
@@ -315,10 +409,18 @@ class Board:
                 result ^= ZOBRIST_TABLE[zobrist_index]
         return result
 
+    # The hash of the Pawns alone, as maintained in pawn_zobrist_hash.
+    def get_pawn_zobrist_hash(self) -> ZobristHash:
+        result = 0
+        for npos, piece in enumerate(self.pieces):
+            if piece is not None and piece.pt == PieceType.Pawn:
+                result ^= ZOBRIST_TABLE[npos * PLAYER_COUNT * PIECE_TYPE_COUNT + piece.code - 1]
+        return result
+
     # --------------------
 
     def is_empty(self, npos: Npos):
-        return self.get_piece_at(npos) is None
+        return self.pieces[npos] is None
 
     def is_ep_target(self, npos: Npos):
         return npos == self.ep_target
@@ -366,17 +468,26 @@ class Board:
         self.piece_add_at(npos, player, pt)
 
     def piece_add_at(self, npos: Npos, player: Player, pt: PieceType) -> None:
-        self.pieces[npos] = Piece(player, pt)
+        piece = Piece(player, pt)
+        self.pieces[npos] = piece
+        self.material_count_add(npos, piece, 1)
 
     def piece_move(self, fr_npos: Npos, to_npos: Npos) -> None:
         assert self.is_empty(to_npos)
-        self.pieces[to_npos] = self.pieces[fr_npos]
+        piece = self.pieces[fr_npos]
+        self.pieces[to_npos] = piece
         assert not self.is_empty(to_npos)
         self.pieces[fr_npos] = None
         assert self.is_empty(fr_npos)
+        if piece.pt == PieceType.Pawn:
+            code_ind = piece.code - 1
+            self.pawn_zobrist_hash ^= (
+                    ZOBRIST_TABLE[fr_npos * PLAYER_COUNT * PIECE_TYPE_COUNT + code_ind]
+                    ^ ZOBRIST_TABLE[to_npos * PLAYER_COUNT * PIECE_TYPE_COUNT + code_ind])
 
     def piece_remove(self, npos: Npos) -> None:
         assert self.get_pt_at(npos) != PieceType.King
+        self.material_count_add(npos, self.pieces[npos], -1)
         self.pieces[npos] = None
 
     def piece_set_pt(self, npos: Npos, pt: PieceType) -> None:
@@ -384,6 +495,49 @@ class Board:
         self.piece_remove(npos)
         self.piece_add_at(npos, player, pt)
 
+    # --------------------
+    # Material counts are maintained by piece_add_at() and piece_remove(),
+    #   so material-based draws can be detected without scanning the Board.
+    #   * material_counts: indexed by Piece.code - 1
+    #   * bishop_color_counts: indexed by Player.value * 3 + BoardColor.value
+    # (Bishops never change color, so piece_move() needn't update them.)
+    # The Pawn Zobrist hash is maintained alongside them (and by piece_move()).
+    # It hashes the Pawns alone, with the same ZOBRIST_TABLE entries as
+    #   get_zobrist_hash(), to key tables of Pawn structure evaluations,
+    #   which change less often than the position does.
+
+    def init_material_counts(self) -> None:
+        self.material_counts = [0] * (PLAYER_COUNT * PIECE_TYPE_COUNT)
+        self.bishop_color_counts = [0] * (PLAYER_COUNT * BOARD_COLOR_COUNT)
+        self.pawn_zobrist_hash = 0
+        for npos, piece in enumerate(self.pieces):
+            if piece is not None:
+                self.material_count_add(npos, piece, 1)
+
+    def material_count_add(self, npos: Npos, piece: Piece, count: int) -> None:
+        self.material_counts[piece.code - 1] += count
+        if piece.pt == PieceType.Bishop:
+            self.bishop_color_counts[piece.player.value * BOARD_COLOR_COUNT
+                    + NPOS_TO_BOARD_COLOR_VALUE[npos]] += count
+        elif piece.pt == PieceType.Pawn:
+            # XOR both adds and removes a Pawn.
+            self.pawn_zobrist_hash ^= ZOBRIST_TABLE[npos * PLAYER_COUNT * PIECE_TYPE_COUNT + piece.code - 1]
+
+    # Returns the minor material key of the position (see src.material),
+    #   or None if either Player has a Pawn, Queen, or Rook.
+    def get_minor_material_key(self):
+        counts = self.material_counts
+        key = []
+        for player_value in range(PLAYER_COUNT):
+            base = player_value * PIECE_TYPE_COUNT
+            for pt in MAJOR_OR_PAWN_PTS:
+                if counts[base + pt.value]:
+                    return None
+            color_base = player_value * BOARD_COLOR_COUNT
+            key.append((counts[base + PieceType.Knight.value],)
+                    + tuple(self.bishop_color_counts[color_base:color_base + BOARD_COLOR_COUNT]))
+        return tuple(key)
+
     # ========================================
     # SECTION: PIECE MOVEMENT
     # ========================================
@@ -414,163 +568,86 @@ class Board:
             result = G.LEAP_PAWN_HOP_WHITE[npos]
         return result
 
+    # The King's position is found once, rather than after each trial move.
     def get_moves_legal(self) -> Iterable[Move]:
         result = []
+        mover = self.cur_player
+        opponent = mover.opponent()
+        king_npos = self.get_king_npos(mover)
         for move in self.get_moves_pseudolegal():
-            player = self.cur_player
             self.move_make(move, do_partial_only=True)
-            if not self.is_king_attacked():
+            target_npos = move.to_npos if move.fr_npos == king_npos else king_npos
+            if not self.is_npos_attacked(target_npos, opponent):
                 result.append(move)
             self.move_undo(do_partial_only=True)
         return result
 
+    # Stops at the first legal move found.
+    def has_moves_legal(self) -> bool:
+        mover = self.cur_player
+        opponent = mover.opponent()
+        king_npos = self.get_king_npos(mover)
+        for npos, piece in enumerate(self.pieces):
+            if not piece or piece.player != mover:
+                continue
+            for move in self.get_moves_pseudolegal_from(npos):
+                self.move_make(move, do_partial_only=True)
+                target_npos = move.to_npos if move.fr_npos == king_npos else king_npos
+                is_legal = not self.is_npos_attacked(target_npos, opponent)
+                self.move_undo(do_partial_only=True)
+                if is_legal:
+                    return True
+        return False
+
     # Move specifications (in text, or in a MoveSpec object) can be:
     #   * unambiguous (e.g., Nb2e4)
     #   * ambiguous without board context (e.g., dxe5)
-    # If a move is written without a PieceType or starting position
-    #   (e.g., b5), and both a Pawn and another PieceType could have
-    #   moved there, we should probably give priority to the Pawn.
-    # Possible alternate approach: Find all legal moves, and( apply filter.
+    # Matching is done against a MoveIndex of this position's legal moves,
+    # so a Piece that is pinned does not make a move specification ambiguous.
+    # To resolve more than one MoveSpec in the same position, build the
+    # MoveIndex once and call its get_moves_matching() directly.
     # Note: The "move_text" arg is not needed, but can be helpful for debugging.
-    def get_moves_matching(self, ms: MoveSpec, move_text) -> Iterable[Move]:  # pylint: disable=unused-argument
-        moves = []
-
-        if ms.fr_file and ms.fr_rank and ms.to_file and ms.to_rank:
-            fr_npos = G.alg_to_npos(ms.fr_file + str(ms.fr_rank))
-            to_npos = G.alg_to_npos(ms.to_file + str(ms.to_rank))
-            move = Move(fr_npos, to_npos, ms.promotion_pt)
-            move.pt = ms.pt
-            move.is_capture = ms.is_capture
-            move.is_check = ms.checkness_str and ms.checkness_str == '+'
-            move.is_checkmate = ms.checkness_str and ms.checkness_str == '#'
-            if ms.promotion_pt:
-                move.promotion_pt = ms.promotion_pt
-                assert move.pt == PieceType.Pawn
-            move.is_checkmate = ms.checkness_str and ms.checkness_str == '#'
-            if move.pt == PieceType.Pawn and move.to_npos == self.ep_target:
-                to_file_char = G.npos_to_file_char(to_npos)
-                fr_file_char = G.npos_to_file_char(fr_npos)
-                if to_file_char != fr_file_char:
-                    move.ep_target = self.ep_target
-            # TODO: move_eval
-            return [move]
-        if ms.to_file and ms.to_rank:
-            # We know the moving Piece's destination
-            to_npos = G.alg_to_npos(ms.to_file + str(ms.to_rank))
-            moves = self.get_moves_to(to_npos)
-            if not moves:
-                return []
-
-            # Filter on PieceType. The Piece on the Board matches the spec.
-            moves = [move for move in moves
-                    if (self.get_pt_at(move.fr_npos) == ms.pt)
-                    or (ms.pt is None
-                        and self.get_pt_at(move.fr_npos) == PieceType.Pawn)]
-            if not moves:
-                return []
-
-            if ms.is_capture:
-                opponent = self.cur_player.opponent()
-                moves = [move for move in moves
-                        if ((self.get_piece_at(move.to_npos)
-                            and self.get_player_at(move.to_npos) == opponent)
-                            or (move.to_npos == self.ep_target
-                                and self.is_empty(self.ep_target)))
-                            ]
-                if not moves:
-                    return []
-
-            if ms.fr_file:
-                moves = [move for move in moves
-                        if G.npos_to_file_char(move.fr_npos) == ms.fr_file]
-                if not moves:
-                    return []
-
-            if ms.fr_rank:
-                moves = [move for move in moves
-                        if G.npos_to_rank(move.fr_npos) == ms.fr_rank]
-                if not moves:
-                    return []
-
-            if ms.promotion_pt:
-                moves = [move for move in moves
-                        if move.promotion_pt == ms.promotion_pt]
-                for move in moves:
-                    assert move.pt == PieceType.Pawn
-                    assert self.is_in_pawn_promo_zone(to_npos)
-            return moves
-
-        if (ms.pt is None and ms.fr_file and ms.is_capture and ms.to_file
-                and (not ms.fr_rank and not ms.to_rank)):
-            bb_file = BITBOARD_FILES[G.FILE_CHAR_TO_HEX0[ms.fr_file] + 5]
-            for fr_npos in bb_file.search(bitarray('1')):
-                if self.is_empty(fr_npos):
-                    continue
-                fr_piece = self.get_piece_at(fr_npos)
-                if (self.get_player_at(fr_npos) != self.cur_player
-                        or self.get_pt_at(fr_npos) != PieceType.Pawn):
-                    continue
-                if self.is_in_pawn_promo_zone(fr_npos):
-                    raise PawnOnBackRankException(f'Pawn on back rank at {G.npos_to_alg(fr_npos)}')
-
-                for to_npos in self.get_leap_pawn_capt(fr_npos):
-                    if G.npos_to_file_char(to_npos) != ms.to_file:
-                        continue
-                    move = Move(fr_npos, to_npos, ms.promotion_pt or None)
-                    move.pt = PieceType.Pawn
-                    move.is_capture = True
-                    move.is_check = ms.checkness_str and ms.checkness_str == '+'
-                    move.is_checkmate = ms.checkness_str and ms.checkness_str == '#'
-                    move.ep_target = to_npos if self.ep_target == to_npos else None
-                    # TODO: Set move_eval
-                    moves.append(move)
-            return moves
-        raise NotImplementedError('board.get_moves_matching(). Move pattern not recognized')
+    # MoveIndex (with MoveSpec) is imported only when needed,
+    # since tools that only generate moves never use it.
+    def get_moves_matching(self, ms: 'MoveSpec', move_text) -> Iterable[Move]:  # pylint: disable=unused-argument
+        from src.move_index import MoveIndex  # pylint: disable=import-outside-toplevel
+        return MoveIndex(self).get_moves_matching(ms, move_text)
 
     def get_moves_pseudolegal(self) -> Iterable[Move]:
         moves = []
-        for npos in range(G.SPACE_COUNT):
-            piece = self.get_piece_at(npos)
+        for npos, piece in enumerate(self.pieces):
             if piece and piece.player == self.cur_player:
                 moves.extend(self.get_moves_pseudolegal_from(npos))
         return moves
 
     def get_moves_pseudolegal_from(self, npos: Npos) -> Iterable[Move]:
-        piece = self.get_piece_at(npos)
+        piece = self.pieces[npos]
         if piece is None or piece.player != self.cur_player:
             return []
-        pt = piece.pt
-        if pt in [PieceType.King, PieceType.Knight]:
-            moves = self.get_moves_pseudolegal_leaper(npos, pt)
-        elif PieceType.is_slider_type(pt):
-            moves = self.get_moves_pseudolegal_slider(npos, pt)
-        else:  # pt == Piece.Pawn
-            moves = self.get_moves_pseudolegal_pawn(npos)
-        return moves
+        return MOVE_GENERATORS_BY_PT[piece.pt.value](self, npos, piece.pt)
 
     def get_moves_pseudolegal_leaper(self, npos: Npos, pt: PieceType) -> Iterator[Move]:
-        if pt == PieceType.King:
-            leaps_npos = G.LEAPS_KING[npos]
-        else:
-            assert pt == PieceType.Knight
-            leaps_npos = G.LEAPS_KNIGHT[npos]
-
-        for to_npos in leaps_npos:
-            if self.is_empty(to_npos):
+        pieces = self.pieces
+        mover = self.cur_player
+        for to_npos in G.LEAPS_BY_PT[pt.value][npos]:
+            to_piece = pieces[to_npos]
+            if to_piece is None:
                 move = Move(npos, to_npos, None)
                 move.pt = pt
                 yield move
-            elif self.get_player_at(to_npos) == self.cur_player.opponent():
+            elif to_piece.player != mover:
                 move = Move(npos, to_npos, None)
                 move.pt = pt
-                move.capt_pt = self.get_pt_at(to_npos)
+                move.capture_pt = to_piece.pt
                 yield move
 
     # Note: In the case of Pawn promotion, this routine returns one
     #       Move for each possible PieceType used in the promotion.
-    def get_moves_pseudolegal_pawn(self, npos: Npos) -> Iterator[Move]:
+    # The pt argument is there only to match the other move generators.
+    def get_moves_pseudolegal_pawn(self, npos: Npos,
+            pt: PieceType=PieceType.Pawn) -> Iterator[Move]:  # pylint: disable=unused-argument
         fwd1_npos = self.get_leap_pawn_adv(npos)
-        fwd1_piece = self.get_piece_at(fwd1_npos)
+        fwd1_piece = self.pieces[fwd1_npos]
         if not fwd1_piece:  # ADV1
             if self.is_in_pawn_promo_zone(fwd1_npos):
                 for promo_pt in PROMO_PTS:
@@ -578,10 +655,12 @@ class Board:
                     move.pt = PieceType.Pawn
                     yield move
             else:
-                yield Move(npos, fwd1_npos, None)  # ADV1 w/o promotion
+                move = Move(npos, fwd1_npos, None)  # ADV1 w/o promotion
+                move.pt = PieceType.Pawn
+                yield move
             if self.is_in_pawn_home_zone(npos):
                 fwd2_npos = self.get_leap_pawn_hop(npos)
-                fwd2_piece = self.get_piece_at(fwd2_npos)
+                fwd2_piece = self.pieces[fwd2_npos]
                 if not fwd2_piece:  # ADV2
                     move = Move(npos, fwd2_npos, None)  # ADV2 w/o promotion
                     move.pt = PieceType.Pawn
@@ -595,51 +674,122 @@ class Board:
                 move.ep_target = self.ep_target
                 yield move
             else:
-                capt_piece = self.get_piece_at(capt_npos)
+                capt_piece = self.pieces[capt_npos]
                 if capt_piece and capt_piece.player == self.cur_player.opponent():
                     if self.is_in_pawn_promo_zone(capt_npos):
                         for promo_pt in PROMO_PTS:
                             move = Move(npos, capt_npos, promo_pt)  # Capture with PROMOTION
+                            move.pt = PieceType.Pawn
                             move.capture_pt = capt_piece.pt
                             yield move
                     else:
                         move = Move(npos, capt_npos, None)  # Capture w/o promotion
+                        move.pt = PieceType.Pawn
                         move.capture_pt = capt_piece.pt
                         yield move
 
     def get_moves_pseudolegal_slider(self, npos: Npos, pt: PieceType) -> Iterator[Move]:
-        rays = G.get_rays(npos, pt)
-        for ray in rays:
+        pieces = self.pieces
+        mover = self.cur_player
+        for ray in G.RAYS_BY_PT[pt.value][npos]:
             for to_npos in ray:
-                if self.is_empty(to_npos):
+                to_piece = pieces[to_npos]
+                if to_piece is None:
                     move = Move(npos, to_npos)
                     move.pt = pt
                     yield move
                     continue
-                else:
-                    if self.get_player_at(to_npos) == self.cur_player.opponent():
-                        # Capture opponent's piece
-                        move = Move(npos, to_npos)
-                        move.pt = pt
-                        move.capture_pt = self.get_pt_at(to_npos)
-                        yield move
+                if to_piece.player != mover:
+                    # Capture opponent's piece
+                    move = Move(npos, to_npos)
+                    move.pt = pt
+                    move.capture_pt = to_piece.pt
+                    yield move
                 break # Can't slide past piece
 
-    # TODO: Check for move legality
-    def get_moves_to(self, to_npos: Npos) -> Iterable[Move]:
-        result = []
-
-        for fr_npos in range(G.SPACE_COUNT):
-            if self.is_empty(fr_npos):
-                continue
-            if self.get_player_at(fr_npos) != self.cur_player:
+    # Writes this position's pseudolegal Moves, packed (see src.move), to
+    #   buf, in the same order as get_moves_pseudolegal(), and returns
+    #   their count. buf is reused rather than reallocated (see
+    #   Move.new_buffer()), and entries past the count are left as they were.
+    # This does the work of the move generators above, inline, without
+    #   Move objects or generators. Player and PieceType values are derived
+    #   from Piece.code, since reading Enum values is comparatively slow.
+    def fill_moves_pseudolegal(self, buf: MoveBuffer) -> int:
+        pieces = self.pieces
+        mover = self.cur_player
+        ep_target = self.ep_target
+        if mover == Player.Black:
+            pawn_adv, pawn_hop = G.LEAP_PAWN_ADV_BLACK, G.LEAP_PAWN_HOP_BLACK
+            pawn_capt, pawn_promo = G.LEAP_PAWN_CAPT_BLACK, BB_PAWN_PROMO_BLACK
+        else:
+            pawn_adv, pawn_hop = G.LEAP_PAWN_ADV_WHITE, G.LEAP_PAWN_HOP_WHITE
+            pawn_capt, pawn_promo = G.LEAP_PAWN_CAPT_WHITE, BB_PAWN_PROMO_WHITE
+        count = 0
+        for npos, piece in enumerate(pieces):
+            if piece is None or piece.player != mover:
                 continue
-            moves = self.get_moves_pseudolegal_from(fr_npos)
-            for move in moves:
-                if move.to_npos == to_npos:
-                    move.pt = self.get_pt_at(fr_npos)
-                    result.append(move)
-        return result
+            pt_val = (piece.code - 1) % PIECE_TYPE_COUNT
+            base = npos | (pt_val << PACKED_PT_SHIFT)
+            leaps = G.LEAPS_BY_PT[pt_val]
+            if leaps is not None:
+                for to_npos in leaps[npos]:
+                    to_piece = pieces[to_npos]
+                    if to_piece is None:
+                        buf[count] = base | (to_npos << PACKED_TO_SHIFT)
+                        count += 1
+                    elif to_piece.player != mover:
+                        buf[count] = (base | (to_npos << PACKED_TO_SHIFT)
+                                | CAPTURE_BITS_BY_CODE[to_piece.code - 1])
+                        count += 1
+            elif pt_val == PAWN_VALUE:
+                to_npos = pawn_adv[npos]
+                if pieces[to_npos] is None:
+                    if pawn_promo[to_npos]:
+                        for promotion_bits in PROMOTION_BITS:
+                            buf[count] = base | (to_npos << PACKED_TO_SHIFT) | promotion_bits
+                            count += 1
+                    else:
+                        buf[count] = base | (to_npos << PACKED_TO_SHIFT)
+                        count += 1
+                    to_npos = pawn_hop[npos]
+                    if to_npos is not None and pieces[to_npos] is None:
+                        buf[count] = base | (to_npos << PACKED_TO_SHIFT)
+                        count += 1
+                for to_npos in pawn_capt[npos]:
+                    if to_npos == ep_target:
+                        buf[count] = base | (to_npos << PACKED_TO_SHIFT) | EP_CAPTURE_BITS
+                        count += 1
+                        continue
+                    to_piece = pieces[to_npos]
+                    if to_piece is None or to_piece.player == mover:
+                        continue
+                    capture_bits = CAPTURE_BITS_BY_CODE[to_piece.code - 1]
+                    if pawn_promo[to_npos]:
+                        for promotion_bits in PROMOTION_BITS:
+                            buf[count] = (base | (to_npos << PACKED_TO_SHIFT)
+                                    | capture_bits | promotion_bits)
+                            count += 1
+                    else:
+                        buf[count] = base | (to_npos << PACKED_TO_SHIFT) | capture_bits
+                        count += 1
+            else:
+                for ray in G.RAYS_BY_PT[pt_val][npos]:
+                    for to_npos in ray:
+                        to_piece = pieces[to_npos]
+                        if to_piece is None:
+                            buf[count] = base | (to_npos << PACKED_TO_SHIFT)
+                            count += 1
+                            continue
+                        if to_piece.player != mover:
+                            buf[count] = (base | (to_npos << PACKED_TO_SHIFT)
+                                    | CAPTURE_BITS_BY_CODE[to_piece.code - 1])
+                            count += 1
+                        break  # Can't slide past piece
+        return count
+
+    def get_moves_to(self, to_npos: Npos) -> Iterable[Move]:
+        from src.move_index import MoveIndex  # pylint: disable=import-outside-toplevel
+        return MoveIndex(self).get_moves_to(to_npos)
 
     # This is used to obtain the location of a Pawn being
     # captured by en passant, given the e.p. target space.
@@ -665,14 +815,38 @@ class Board:
         mover = self.cur_player
         opponent = mover.opponent()
         king_npos = self.get_king_npos(opponent)
-        for attacker_npos in range(G.SPACE_COUNT):
-            if (not self.is_empty(attacker_npos)
-                    and self.get_player_at(attacker_npos) == mover):
-                moves = self.get_moves_pseudolegal_from(attacker_npos)
-                attacks = [attack for attack in moves
-                            if attack.to_npos == king_npos]
-                if attacks:
-                    return True
+        return self.is_npos_attacked(king_npos, mover)
+
+    # Determine whether any of the attacker's pieces could capture onto npos,
+    # by looking outward from npos (along rays, leaps, and Pawn capture
+    # directions) instead of generating all of the attacker's moves.
+    def is_npos_attacked(self, npos: Npos, attacker: Player) -> bool:
+        pieces = self.pieces
+        for leap_npos in G.LEAPS_KNIGHT[npos]:
+            piece = pieces[leap_npos]
+            if piece and piece.pt == PieceType.Knight and piece.player == attacker:
+                return True
+        for leap_npos in G.LEAPS_KING[npos]:
+            piece = pieces[leap_npos]
+            if piece and piece.pt == PieceType.King and piece.player == attacker:
+                return True
+        pawn_attackers = (G.LEAP_PAWN_ATTACKERS_BLACK[npos]
+                if attacker == Player.Black else G.LEAP_PAWN_ATTACKERS_WHITE[npos])
+        for pawn_npos in pawn_attackers:
+            piece = pieces[pawn_npos]
+            if piece and piece.pt == PieceType.Pawn and piece.player == attacker:
+                return True
+        for rays, slider_pt in [(G.RAYS_ROOK[npos], PieceType.Rook),
+                                (G.RAYS_BISHOP[npos], PieceType.Bishop)]:
+            for ray in rays:
+                for ray_npos in ray:
+                    piece = pieces[ray_npos]
+                    if piece is None:
+                        continue
+                    if (piece.player == attacker
+                            and piece.pt in (slider_pt, PieceType.Queen)):
+                        return True
+                    break  # Can't see past piece
         return False
 
     # Check whether cur_player's King is being attacked.
@@ -746,7 +920,7 @@ class Board:
 
         # Phase 4: Check for end of Game
 
-        board_state = self.compute_board_state()
+        board_state = self.compute_board_state(next_ep_target)
 
         if board_state == BoardState.Check:
             self.notify_player(self.cur_player.opponent(), 'Check')
@@ -767,8 +941,7 @@ class Board:
                 (not move.is_progress() and self.nonprogress_halfmove_count == 149)
                 or
                 (self.do_check_repetition
-                    and (len([z for z in self.history_zobrist_hash
-                        if z == next_zobrist_hash]) == 4))
+                    and self.zobrist_hash_counts[next_zobrist_hash] == 4)
                 )
         if is_pending_draw:
             self.game_state = GameState.Draw
@@ -776,8 +949,10 @@ class Board:
         # Phase 5: Update counters & history
         #
         self.history_zobrist_hash.append(next_zobrist_hash)
-        zobrist_counter = Counter(self.history_zobrist_hash)
-        max_reps = max(zobrist_counter.values())
+        self.zobrist_hash_counts[next_zobrist_hash] += 1
+        max_reps = max(self.history_max_repetition_count[-1],
+                self.zobrist_hash_counts[next_zobrist_hash])
+        self.history_max_repetition_count.append(max_reps)
         next_is_board_repetition_3x = max_reps >= 3
         next_is_board_repetition_5x = max_reps >= 5
         next_nonprogress_count = (0 if move.is_progress()
@@ -813,13 +988,14 @@ class Board:
         assert self.is_empty(move.fr_npos)
         self.piece_move(move.to_npos, move.fr_npos)
         assert not self.is_empty(move.fr_npos)
+        if move.promotion_pt:
+            self.piece_set_pt(move.fr_npos, PieceType.Pawn)
 
         # Restore captured piece, if any
         if move.capture_pt:
             if move.ep_target:
-                ep_tgt_npos = self.history_ep_target[-2]
-                captured_pawn_npos = self.ep_target_to_captured_pawn_npos(ep_tgt_npos)
-                self.piece_add_at(ep_tgt_npos, opponent, PieceType.Pawn)
+                captured_pawn_npos = self.ep_target_to_captured_pawn_npos(move.ep_target, mover)
+                self.piece_add_at(captured_pawn_npos, opponent, PieceType.Pawn)
             else:
                 self.piece_add_at(move.to_npos, opponent, move.capture_pt)
 
@@ -834,7 +1010,11 @@ class Board:
         self.history_ep_target.pop()
         self.history_move.pop()
         self.history_nonprogress_halfmove_count.pop()
-        self.history_zobrist_hash.pop()
+        zobrist_hash = self.history_zobrist_hash.pop()
+        self.zobrist_hash_counts[zobrist_hash] -= 1
+        if self.zobrist_hash_counts[zobrist_hash] == 0:
+            del self.zobrist_hash_counts[zobrist_hash]
+        self.history_max_repetition_count.pop()
 
         self.history_is_check.pop()
         self.history_is_checkmate.pop()
@@ -847,6 +1027,7 @@ class Board:
         assert len(self.history_move) == self.halfmove_count + 1
         assert len(self.history_nonprogress_halfmove_count) == self.halfmove_count + 1
         assert len(self.history_zobrist_hash) == self.halfmove_count + 1
+        assert len(self.history_max_repetition_count) == self.halfmove_count + 1
         assert len(self.history_is_check) == self.halfmove_count + 1
         assert len(self.history_is_checkmate) == self.halfmove_count + 1
         assert len(self.history_is_repetition_3x) == self.halfmove_count + 1
@@ -866,25 +1047,23 @@ class Board:
 
     # This is called from move_make, after piece movement,
     #   but before history updates.
-    def compute_board_state(self) -> BoardState:
-        result = BoardState.Normal
-        moves = self.get_moves_pseudolegal()
-        if self.is_king_attacked():
-            is_escapable = False
-            for protect_move in self.get_moves_pseudolegal():
-                self.move_make(protect_move, do_partial_only=True)
-                if not self.is_king_attacked():
-                    is_escapable = True
-                self.move_undo(do_partial_only=True)
-                if is_escapable:
-                    break
-            if is_escapable:
-                result = BoardState.Check
-            else:
-                result = BoardState.Checkmate
-        elif len(moves) == 0:
-            result = BoardState.Stalemate
-        return result
+    # The opponent's replies are found by temporarily passing the turn
+    #   (Player and e.p. target) to the opponent.
+    def compute_board_state(self, next_ep_target: Npos=None) -> BoardState:
+        mover = self.cur_player
+        is_check = self.is_king_attacked()
+
+        self.cur_player = mover.opponent()
+        self.history_ep_target.append(next_ep_target)
+        self.halfmove_count += 1
+        has_reply = self.has_moves_legal()
+        self.halfmove_count -= 1
+        self.history_ep_target.pop()
+        self.cur_player = mover
+
+        if has_reply:
+            return BoardState.Check if is_check else BoardState.Normal
+        return BoardState.Checkmate if is_check else BoardState.Stalemate
 
     # To simplify testing of 50-move and 75-move rules
     def disable_check_repetition(self) -> None:
@@ -897,63 +1076,36 @@ class Board:
         return self.game_state
 
     def get_max_repetition_count(self) -> int:
-        return max(Counter(self.history_zobrist_hash).values())
+        return self.history_max_repetition_count[-1]
+
+    # The number of times the current position has occurred, for use in search.
+    # A position can't recur across an irreversible move (a capture or Pawn move),
+    # so only the halfmoves counted by the non-progress counter are scanned,
+    # stepping back two at a time, so that the same Player is to move.
+    def get_repetition_count_since_progress(self) -> int:
+        hashes = self.history_zobrist_hash
+        cur_ind = self.halfmove_count
+        zobrist_hash = hashes[cur_ind]
+        earliest_ind = max(0, cur_ind - self.nonprogress_halfmove_count)
+        result = 1
+        for ind in range(cur_ind - 2, earliest_ind - 1, -2):
+            if hashes[ind] == zobrist_hash:
+                result += 1
+        return result
 
+    # Since stalemate is a partial win, a position is only dead if neither
+    #   checkmate nor stalemate can be reached, and no material alone makes
+    #   that so (see src.material). Other dead positions (e.g., with Pawns
+    #   permanently blocked) are not detected, so this is never true, and
+    #   move_make() and the search don't check it.
     def is_condition_dead_position(self):
-        raise NotImplementedError('board.is_condition_dead_position()')
+        return False
 
+    # True if neither Player could ever checkmate the other, whatever moves
+    #   are made, given the material on the Board. See src.material.
+    #   Such positions aren't drawn, since stalemate may still be reached.
     def is_condition_insufficient_material(self):
-        def get_pt_histo(player, Player):
-            pt_histo = [0] * 6
-            for npos in range(G.SPACE_COUNT):
-                piece = self.pieces[npos]
-                if piece:
-                    if piece.player == player:
-                        pt_histo[piece.pt.value] += 1
-
-        # Turns a vector of length-6 integers (digits 0-9) into an int.
-        # Example: [1, 1, 2, 3, 1, 6] -> 112316
-        # Since the first digit of pt_histo_* represent the count of Kings,
-        # there should always be a leading '1'.
-        def pt_histo_to_pt_sig(vec: List[int]):
-            sig = 0
-            for k in range(6):
-                sig += vec[k] * 10**(5-k)
-
-        pt_histo_black = get_pt_histo(Player.Black)
-        pt_sig_black = histo_to_sig(pt_histo_black)
-
-        pt_histo_white = get_pt_histo(Player.White)
-        pt_sig_white = histo_to_sig(pt_histo_white)
-
-        # K vs K
-        if pt_sig_black == 100_000 and pt_sig_white == 100_000:
-            return True
-
-        # KB vs K
-        if ((pt_sig_black == 100_100 and pt_sig_white == 100_000)
-                or (pt_sig_black == 100_000 and pt_sig_white == 100_100)):
-            return True
-
-        # KN vs K
-        if ((pt_sig_black == 100_010 and pt_sig_white == 100_000)
-                or (pt_sig_black == 100_000 and pt_sig_white == 100_010)):
-            return True
-
-        # KNN vs K
-        if ((pt_sig_black == 100_020 and pt_sig_white == 100_000)
-                or (pt_sig_black == 100_000 and pt_sig_white == 100_020)):
-            return True
-
-        # KB vs K
-        if ((pt_sig_black == 100_100 and pt_sig_white == 100_000)
-                or (pt_sig_black == 100_000 and pt_sig_white == 100_100)):
-            return True
-
-        # KBB vs K
-        if ((pt_sig_black == 100_200 and pt_sig_white == 100_000)
-                or (pt_sig_black == 100_000 and pt_sig_white == 100_200)):
-            return True
+        return self.get_minor_material_key() in NO_CHECKMATE_MATERIAL_KEYS
 
     def set_board_state(self, board_state) -> None:
         self.board_state = board_state
@@ -1009,6 +1161,17 @@ class Board:
         pass
         # print(f'Attention {player}: {msg}')
 
+    # ========================================
+    # SECTION: INSTRUMENTATION
+    # ========================================
+    # A snapshot of the process-wide counts and phase timings kept while
+    # instrumentation is enabled (see src.board_stats). When it is off,
+    # Board's methods aren't wrapped, so it costs nothing.
+    @classmethod
+    def stats(cls) -> Dict:
+        from src.board_stats import BoardStats  # pylint: disable=import-outside-toplevel
+        return BoardStats.snapshot()
+
     # ========================================
     # SECTION: PUZZLE SUPPORT
     # ========================================
@@ -1154,7 +1317,7 @@ class Board:
         ep_tgt = self.ep_target
         ep_str = (f'{G.npos_to_alg(ep_tgt) if ep_tgt else "None"}')
         opp_name = self.cur_player.opponent().name
-        rep_count = f'{max(Counter(self.history_zobrist_hash).values())}'
+        rep_count = f'{self.get_max_repetition_count()}'
         print(f'1/2-moves={self.halfmove_count}. '
                 + f'{opp_name}\'s last move: {self.last_move}. '
                 + f'{self.cur_player.name}\'s turn. '
@@ -1178,55 +1341,40 @@ class Board:
             king_check_npos=None, king_checkmate_npos=None) -> str:
         SVG_PLAYER_KEYS = { Player.Black: 'black', Player.White: 'white' }
         layout_dict = self.get_layout_dict()
-        result = '\tLAYOUT = {\n'
+        lines = ['\tLAYOUT = {\n']
         for player in PLAYERS:
-            result += '\t\t"' + SVG_PLAYER_KEYS[player] + '": {\n'
+            lines.append('\t\t"' + SVG_PLAYER_KEYS[player] + '": {\n')
             for pt in PIECE_TYPES:
                 pos_str = ', '.join([G.pos_to_alg(pos).upper()
                     for pos in layout_dict[player][pt]])
-                result += f'\t\t\t"{pt}": [{pos_str}],\n'
-            result += '\t\t},\n'
-
-        from_coords_str = f'{G.npos_to_alg(fr_npos).upper() if fr_npos else "null"}'
-        to_coords_str = f'{G.npos_to_alg(to_npos).upper() if to_npos else "null"}'
-        check_str = f'{G.npos_to_alg(king_check_npos).upper() if king_check_npos else "null"}'
-        checkmate_str = f'{G.npos_to_alg(king_checkmate_npos).upper() if king_checkmate_npos else "null"}'
-
-        result += '\t}\n'
-        result += f'\tFROM_COORDS = {from_coords_str}\n'
-        result += f'\tTO_COORDS = {to_coords_str}\n'
-        result += '\n'
-        result += f'\tKING_CHECK_COORDS = {check_str}\n'
-        result += f'\tKING_CHECKMATE_COORDS = {checkmate_str}\n'
-        return result
+                lines.append(f'\t\t\t"{pt}": [{pos_str}],\n')
+            lines.append('\t\t},\n')
+
+        def get_coords_str(npos):
+            return 'null' if npos is None else G.npos_to_alg(npos).upper()
+
+        lines.append('\t}\n')
+        lines.append(f'\tFROM_COORDS = {get_coords_str(fr_npos)}\n')
+        lines.append(f'\tTO_COORDS = {get_coords_str(to_npos)}\n')
+        lines.append('\n')
+        lines.append(f'\tKING_CHECK_COORDS = {get_coords_str(king_check_npos)}\n')
+        lines.append(f'\tKING_CHECKMATE_COORDS = {get_coords_str(king_checkmate_npos)}\n')
+        return ''.join(lines)
 
     # This interpolates the output of svg_get_layout_dict_str() into
     # an SVG template file to create the content of an SVG file
     # that can be stored to disk and used standalone, or in a
     # slideshow or animation.
+    # The template is read from disk only once per process (see SvgTemplate).
+    # To render all the positions of a Game, see src.svg_render.
     # Note: The selenium package can open "data URLs", so this SVG
     #   content can be used even without ever being saved to disk.
     def svg_get_str(self, fr_npos:Npos=None, to_npos:Npos=None,
             king_check_npos:Npos=None, king_checkmate_npos=None) -> str:
-        glinski_home = os.getenv('GLINSKI_HOME')
-        template_svg_dir = '/assets/'
-        svg_fname = 'glinski_game.svg'
-        svg_path = glinski_home + template_svg_dir + svg_fname
-
-        is_echoing = True
-        result = ''
-        layout_str = self.svg_get_layout_dict_str(fr_npos, to_npos)
-        with open(svg_path, 'r') as f:
-            svg_lines = f.readlines()
-        for svg_line in svg_lines:
-            if 'END_LAYOUT' in svg_line:
-                result += layout_str
-                is_echoing = True
-            if is_echoing:
-                result += svg_line
-            if 'BEGIN_LAYOUT' in svg_line:
-                is_echoing = False
-        return result
+        from src.svg_template import SvgTemplate  # pylint: disable=import-outside-toplevel
+        layout_str = self.svg_get_layout_dict_str(fr_npos, to_npos,
+                king_check_npos, king_checkmate_npos)
+        return SvgTemplate.get().render(layout_str)
 
     # Write an SVG file of the form
     #   <gamename>_<halfmovecount><suffix>.svg
@@ -1253,3 +1401,15 @@ class Board:
         with open(out_path, 'w') as f:
             f.write(svg_content)
 
+
+
+# Board's move generator for each PieceType, indexed by PieceType.value
+# (see Board.get_moves_pseudolegal_from()).
+MOVE_GENERATORS_BY_PT = tuple({
+        PieceType.King:   Board.get_moves_pseudolegal_leaper,
+        PieceType.Queen:  Board.get_moves_pseudolegal_slider,
+        PieceType.Rook:   Board.get_moves_pseudolegal_slider,
+        PieceType.Bishop: Board.get_moves_pseudolegal_slider,
+        PieceType.Knight: Board.get_moves_pseudolegal_leaper,
+        PieceType.Pawn:   Board.get_moves_pseudolegal_pawn,
+        }[pt] for pt in PIECE_TYPES)
@@ -3,6 +3,8 @@
 
 from enum import Enum
 
+BOARD_COLOR_COUNT = 3
+
 
 class BoardColor(Enum):
     Medium = 0
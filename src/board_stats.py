@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import cProfile
+import functools
+import time
+from typing import Callable, Dict, Iterable, List
+
+from src.board import Board
+
+
+# Optional instrumentation of Board: counts of the work done by each Board
+# (moves made and unmade, moves generated, attack checks, and hash
+# computations), and the time spent in each phase of move_make().
+#
+# Instrumentation is off by default, and then costs nothing: Board's
+# methods are left as they are. BoardStats.enable() replaces the methods
+# listed below, on the Board class (so on every Board, including clones),
+# with wrappers that count and time them, and disable() restores them.
+# The counts are process-wide, and are read with Board.stats().
+#
+# Times are per method, wherever it is called from. For example, the
+# zobrist_hash phase includes hashes computed by a search, as well as those
+# computed by move_make(). The end_of_game phase (compute_board_state())
+# includes the partial moves it makes to find the opponent's replies.
+#
+# Hooks (see BoardHook) are called at the beginning and end of each phase,
+# e.g., to profile only one phase (see ProfileHook), or to mark the windows
+# in which an external sampling profiler (such as perf) should record.
+
+# Board method name -> phase name, for the timed methods
+PHASES = {
+        'move_make':           'move_make',
+        'compute_board_state': 'end_of_game',
+        'get_zobrist_hash':    'zobrist_hash',
+        }
+
+# Board method name -> counter name, for methods counted by call
+CALL_COUNTERS = {
+        'has_moves_legal':        'has_moves_legal_calls',
+        'is_npos_attacked':       'attack_checks',
+        'get_zobrist_hash':       'hash_computations',
+        'fill_moves_pseudolegal': 'moves_packed_calls',
+        }
+
+# Board method name -> (call counter name, move counter name),
+# for move generators, which also count the Moves they return
+MOVEGEN_COUNTERS = {
+        'get_moves_pseudolegal': ('moves_pseudolegal_calls', 'moves_pseudolegal'),
+        'get_moves_legal':       ('moves_legal_calls', 'moves_legal'),
+        }
+
+COUNTER_NAMES = (['moves_made', 'moves_made_partial', 'moves_unmade', 'moves_unmade_partial']
+        + list(CALL_COUNTERS.values())
+        + [name for names in MOVEGEN_COUNTERS.values() for name in names])
+
+
+class BoardHook:
+    def on_phase_begin(self, phase: str) -> None:
+        pass
+
+    def on_phase_end(self, phase: str, secs: float) -> None:
+        pass
+
+
+# Profiles only the time spent in one phase (including any nested calls).
+class ProfileHook(BoardHook):
+    def __init__(self, phase: str, profile: cProfile.Profile=None):
+        if phase not in PHASES.values():
+            raise ValueError(f'Unknown phase: {phase}')
+        self.phase = phase
+        self.profile = profile if profile is not None else cProfile.Profile()
+        self.depth = 0
+
+    def on_phase_begin(self, phase: str) -> None:
+        if phase == self.phase:
+            if self.depth == 0:
+                self.profile.enable()
+            self.depth += 1
+
+    def on_phase_end(self, phase: str, secs: float) -> None:
+        if phase == self.phase:
+            self.depth -= 1
+            if self.depth == 0:
+                self.profile.disable()
+
+
+class BoardStats:
+    counts: Dict[str, int] = dict.fromkeys(COUNTER_NAMES, 0)
+    phase_calls: Dict[str, int] = dict.fromkeys(PHASES.values(), 0)
+    phase_secs: Dict[str, float] = dict.fromkeys(PHASES.values(), 0.0)
+    hooks: List[BoardHook] = []
+    # Board method name -> the method replaced by enable()
+    originals: Dict[str, Callable] = {}
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return bool(cls.originals)
+
+    @classmethod
+    def reset(cls) -> None:
+        for counter_dict in (cls.counts, cls.phase_calls):
+            for name in counter_dict:
+                counter_dict[name] = 0
+        for name in cls.phase_secs:
+            cls.phase_secs[name] = 0.0
+
+    @classmethod
+    def snapshot(cls) -> Dict:
+        return {
+                'enabled': cls.is_enabled(),
+                'counts': dict(cls.counts),
+                'phase_calls': dict(cls.phase_calls),
+                'phase_secs': dict(cls.phase_secs),
+                }
+
+    # ========================================
+    # SECTION: WRAPPERS
+    # ========================================
+    @classmethod
+    def wrap_move_make(cls, func: Callable) -> Callable:
+        counts = cls.counts
+        @functools.wraps(func)
+        def move_make(self, move, do_partial_only: bool=False):
+            counts['moves_made_partial' if do_partial_only else 'moves_made'] += 1
+            return func(self, move, do_partial_only)
+        return move_make
+
+    @classmethod
+    def wrap_move_undo(cls, func: Callable) -> Callable:
+        counts = cls.counts
+        @functools.wraps(func)
+        def move_undo(self, do_partial_only: bool=False):
+            counts['moves_unmade_partial' if do_partial_only else 'moves_unmade'] += 1
+            return func(self, do_partial_only)
+        return move_undo
+
+    @classmethod
+    def wrap_call_counter(cls, func: Callable, counter_name: str) -> Callable:
+        counts = cls.counts
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            counts[counter_name] += 1
+            return func(*args, **kwargs)
+        return wrapper
+
+    @classmethod
+    def wrap_movegen_counter(cls, func: Callable, call_counter_name: str,
+            move_counter_name: str) -> Callable:
+        counts = cls.counts
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            moves = func(*args, **kwargs)
+            counts[call_counter_name] += 1
+            counts[move_counter_name] += len(moves)
+            return moves
+        return wrapper
+
+    @classmethod
+    def wrap_phase(cls, func: Callable, phase: str) -> Callable:
+        phase_calls = cls.phase_calls
+        phase_secs = cls.phase_secs
+        hooks = cls.hooks
+        perf_counter = time.perf_counter
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            for hook in hooks:
+                hook.on_phase_begin(phase)
+            time_start = perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                secs = perf_counter() - time_start
+                phase_calls[phase] += 1
+                phase_secs[phase] += secs
+                for hook in hooks:
+                    hook.on_phase_end(phase, secs)
+        return wrapper
+
+    # ========================================
+    # SECTION: ENABLING
+    # ========================================
+    # Hooks given here replace any given earlier. Counts are kept until
+    # reset(), so that they can be read after disable().
+    @classmethod
+    def enable(cls, hooks: Iterable[BoardHook]=()) -> None:
+        cls.hooks[:] = hooks
+        if cls.is_enabled():
+            return
+        wrapped: Dict[str, Callable] = {}
+        def get_func(name: str) -> Callable:
+            return wrapped.get(name, getattr(Board, name))
+        wrapped['move_make'] = cls.wrap_move_make(get_func('move_make'))
+        wrapped['move_undo'] = cls.wrap_move_undo(get_func('move_undo'))
+        for name, counter_name in CALL_COUNTERS.items():
+            wrapped[name] = cls.wrap_call_counter(get_func(name), counter_name)
+        for name, (call_counter_name, move_counter_name) in MOVEGEN_COUNTERS.items():
+            wrapped[name] = cls.wrap_movegen_counter(get_func(name),
+                    call_counter_name, move_counter_name)
+        for name, phase in PHASES.items():
+            wrapped[name] = cls.wrap_phase(get_func(name), phase)
+
+        for name, func in wrapped.items():
+            cls.originals[name] = Board.__dict__[name]
+            setattr(Board, name, func)
+
+    @classmethod
+    def disable(cls) -> None:
+        for name, func in cls.originals.items():
+            setattr(Board, name, func)
+        cls.originals.clear()
+        cls.hooks.clear()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import argparse
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+from typing import BinaryIO, Dict, Iterable, List, Tuple, Union
+
+from src.board import Board
+from src.controller import Controller, RandomPlayer
+from src.game import Game
+from src.game_archive import GameArchive
+from src.move import Move
+from src.move_alternative import MoveAlternative
+from src.pgn import RESULT_TO_SCORE
+from src.player import Player
+from src.zobrist import ZobristHash
+
+
+# An opening book maps Board positions to the moves played from them in a
+# corpus of Games (e.g., the files in data/pgn), along with how often each
+# move was played, and how well it scored for the Player who made it.
+#
+# Book file layout (all integers little-endian):
+#   * Header:  magic (4 bytes), version (uint16), entry count (uint32)
+#   * Entries: one per (position, move), sorted by Zobrist hash,
+#              and then by descending count:
+#       Zobrist hash (uint64), packed move (uint16; see GameArchive),
+#       count (uint32), mean score for the moving Player (float32; NaN if unknown)
+#
+# Since entries have a fixed size, lookup is a binary search over the
+# memory-mapped file, with no parsing of the file as a whole.
+#
+# Note: The Zobrist hash doesn't include the Player to move or the e.p.
+#   target, so a position can share entries with the same piece layout with
+#   the other Player to move, or with different e.p. rights. Such entries
+#   (and any due to hash collisions) are skipped unless they are legal moves.
+BOOK_MAGIC = b'GLBK'
+BOOK_VERSION = 1
+
+HEADER_STRUCT = struct.Struct('<4sHI')
+ENTRY_STRUCT = struct.Struct('<QHIf')
+
+DEFAULT_MAX_PLIES = 20
+
+# (packed_move, count, score)
+BookEntry = Tuple[int, int, float]
+
+
+class BookBuilder:
+    def __init__(self, max_plies=DEFAULT_MAX_PLIES):
+        self.max_plies = max_plies
+        self.game_count = 0
+        # (zobrist_hash, packed_move) -> [count, score total, scored count]
+        self.stats: Dict[Tuple[ZobristHash, int], List] = {}
+
+    # Counts packed_move as played by player from the position with this hash.
+    # white_score is None if the Game's result is unknown.
+    def add_entry(self, zobrist_hash: ZobristHash, player: Player, packed_move: int,
+            white_score: float=None) -> None:
+        stat = self.stats.setdefault((zobrist_hash, packed_move), [0, 0.0, 0])
+        stat[0] += 1
+        if white_score is not None:
+            stat[1] += white_score if player == Player.White else 1 - white_score
+            stat[2] += 1
+
+    def add_moves(self, moves: Iterable[Move], white_score: float=None) -> None:
+        self.game_count += 1
+        board = Board()
+        for move in moves:
+            if board.halfmove_count >= self.max_plies:
+                break
+            self.add_entry(board.zobrist_hash, board.cur_player, GameArchive.move_pack(move),
+                    white_score)
+            board.move_make(move)
+
+    def add_game(self, game: Game) -> None:
+        result = game.attrs.get('Result', game.get_scores_str())
+        self.add_moves(game.board.history_move[1:], RESULT_TO_SCORE.get(result))
+
+    # Replays a GameArchive record without constructing a Game, in a single
+    #   pass. Partial moves don't record the Zobrist hash history, so the
+    #   hash is computed from the Board.
+    def add_archive_record(self, attrs, packed_moves) -> None:
+        self.game_count += 1
+        white_score = RESULT_TO_SCORE.get(attrs.get('Result'))
+        board = Board()
+        for packed_move in packed_moves[:self.max_plies]:
+            self.add_entry(board.get_zobrist_hash(), board.cur_player, packed_move, white_score)
+            board.move_make(GameArchive.packed_move_to_move(board, packed_move), do_partial_only=True)
+
+    # Returns (zobrist_hash, packed_move, count, score) tuples, in file order.
+    def get_entries(self) -> List[Tuple[ZobristHash, int, int, float]]:
+        entries = [(zobrist_hash, packed_move, count,
+                    score_total / scored_count if scored_count else math.nan)
+                   for (zobrist_hash, packed_move), (count, score_total, scored_count)
+                   in self.stats.items()]
+        entries.sort(key=lambda entry: (entry[0], -entry[2], entry[1]))
+        return entries
+
+    def write(self, f: BinaryIO) -> int:
+        entries = self.get_entries()
+        f.write(HEADER_STRUCT.pack(BOOK_MAGIC, BOOK_VERSION, len(entries)))
+        for entry in entries:
+            f.write(ENTRY_STRUCT.pack(*entry))
+        return len(entries)
+
+    def write_path(self, path: str) -> int:
+        with open(path, 'wb') as f:
+            return self.write(f)
+
+
+class Book:
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.entry_count = HEADER_STRUCT.unpack_from(self.mm, 0)
+        if magic != BOOK_MAGIC:
+            self.mm.close()
+            raise ValueError(f'Not an opening book (magic={magic})')
+        if version != BOOK_VERSION:
+            self.mm.close()
+            raise ValueError(f'Unsupported opening book version: {version}')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        self.mm.close()
+
+    def get_entry(self, ind: int) -> Tuple[ZobristHash, int, int, float]:
+        return ENTRY_STRUCT.unpack_from(self.mm, HEADER_STRUCT.size + ind * ENTRY_STRUCT.size)
+
+    # Returns the index of the first entry with a hash >= zobrist_hash.
+    def find_first(self, zobrist_hash: ZobristHash) -> int:
+        lo, hi = 0, self.entry_count
+        mm = self.mm
+        while lo < hi:
+            mid = (lo + hi) // 2
+            (mid_hash,) = struct.unpack_from('<Q', mm, HEADER_STRUCT.size + mid * ENTRY_STRUCT.size)
+            if mid_hash < zobrist_hash:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    # Returns the entries for this hash, by descending count.
+    def get_entries(self, zobrist_hash: ZobristHash) -> List[BookEntry]:
+        entries = []
+        for ind in range(self.find_first(zobrist_hash), self.entry_count):
+            entry_hash, packed_move, count, score = self.get_entry(ind)
+            if entry_hash != zobrist_hash:
+                break
+            entries.append((packed_move, count, score))
+        return entries
+
+    # Returns the entries for this position whose moved piece belongs
+    #   to the Player to move, and whose destination doesn't.
+    def get_entries_for_board(self, board: Board) -> List[BookEntry]:
+        result = []
+        for entry in self.get_entries(board.zobrist_hash):
+            fr_npos, to_npos, _ = GameArchive.move_unpack(entry[0])
+            fr_piece = board.pieces[fr_npos]
+            to_piece = board.pieces[to_npos]
+            if (fr_piece is None or fr_piece.player != board.cur_player
+                    or (to_piece is not None and to_piece.player == board.cur_player)):
+                continue
+            result.append(entry)
+        return result
+
+    # Returns (Move, count, score) for each book move in this position
+    #   that is legal. Legal moves are only generated if there are entries.
+    def get_moves(self, board: Board) -> List[Tuple[Move, int, float]]:
+        entries = self.get_entries_for_board(board)
+        if not entries:
+            return []
+        legal_keys = {(move.fr_npos, move.to_npos, move.promotion_pt)
+                      for move in board.get_moves_legal()}
+        result = []
+        for packed_move, count, score in entries:
+            move = GameArchive.packed_move_to_move(board, packed_move)
+            if (move.fr_npos, move.to_npos, move.promotion_pt) in legal_keys:
+                result.append((move, count, score))
+        return result
+
+    # Chooses a legal book move at random, weighted by count, or returns None.
+    def choose_move(self, board: Board, rng=random) -> Union[Move, None]:
+        moves = self.get_moves(board)
+        if not moves:
+            return None
+        return rng.choices([move for move, _, _ in moves],
+                           weights=[count for _, count, _ in moves])[0]
+
+
+# Plays from the book at book_path (by default, $GLINSKI_BOOK) while
+# it has moves for the position, and then defers to the fallback Controller.
+class BookPlayer(Controller):
+    book_path = os.getenv('GLINSKI_BOOK')
+    book: Book = None
+    fallback: Controller = RandomPlayer
+
+    @classmethod
+    def get_book(cls) -> Union[Book, None]:
+        if cls.book is None and cls.book_path:
+            cls.book = Book(cls.book_path)
+        return cls.book
+
+    @classmethod
+    def choose_move(cls, board: Board) -> Union[Move, MoveAlternative]:
+        book = cls.get_book()
+        move = book.choose_move(board) if book else None
+        if move is None:
+            return cls.fallback.choose_move(board)
+        return move
+
+    @classmethod
+    def do_accept_offer_draw(cls, board: Board) -> bool:
+        return cls.fallback.do_accept_offer_draw(board)
+
+
+# Input paths can be PGN files (*.pgn) or game archives (see GameArchive).
+def build_paths(builder: BookBuilder, paths: Iterable[str], lang='en') -> None:
+    for path in paths:
+        if path.endswith('.pgn'):
+            for game in GameArchive.pgn_to_games(path, lang):
+                builder.add_game(game)
+        else:
+            with open(path, 'rb') as f:
+                for attrs, packed_moves in GameArchive.read_records(f):
+                    builder.add_archive_record(attrs, packed_moves)
+
+
+# Usage: python -m src.book [--plies N] <output.glbk> <input.pgn|input.glnk> ...
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build an opening book from PGN files or game archives')
+    parser.add_argument('--lang', default='en', help='Language of PGN piece symbols (en or hu)')
+    parser.add_argument('--plies', type=int, default=DEFAULT_MAX_PLIES,
+                        help='Number of halfmoves per Game to include')
+    parser.add_argument('book_path')
+    parser.add_argument('input_paths', nargs='+')
+    args = parser.parse_args(argv)
+    builder = BookBuilder(args.plies)
+    build_paths(builder, args.input_paths, args.lang)
+    entry_count = builder.write_path(args.book_path)
+    print(f'Wrote {entry_count} entries from {builder.game_count} games to {args.book_path}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -248,13 +248,17 @@ class HumanPlayer(Controller):
         return response[0].upper() == 'Y'
 
 
+# Set is_verbose = False to suppress the progress indicator printed per move.
 class RandomPlayer(Controller):
+    is_verbose = True
+
     @classmethod
     def choose_move(cls, board: Board) -> Union[Move, MoveAlternative]:
         moves = board.get_moves_legal()
         assert moves, f'RandomPlayer {board.cur_player.name} has no moves'
         choice_index = randint(0, len(moves) - 1)
-        print('*', end='')
+        if cls.is_verbose:
+            print('*', end='')
         return moves[choice_index]
 
     @classmethod
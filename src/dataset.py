@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import argparse
+import glob
+import sys
+from typing import Dict, Iterable, Iterator
+
+import numpy as np
+
+from src.board import Board
+from src.game import Game, GAME_STATE_TO_SCORES_VALS
+from src.game_archive import GameArchive
+from src.game_state import GameState
+from src.geometry import Geometry as G
+from src.pgn import RESULT_TO_SCORE
+from src.piece_type import PIECE_TYPE_COUNT
+from src.player import PLAYER_COUNT
+
+
+# A position dataset holds Board positions as dense NumPy arrays,
+# for use in training (e.g., a neural network evaluation function).
+# Positions are buffered in fixed-size chunks, and each full chunk is
+# written to its own .npz file, so memory use is bounded by the chunk size.
+#
+# Arrays in each chunk file (N = number of positions in the chunk):
+#   * codes:   int8[N, 91]      0 for an empty space, else a piece code
+#              (or, with planes=True, planes: uint8[N, 12, 91] bit planes)
+#   * player:  int8[N]          side to move (Player.value)
+#   * ep:      int8[N]          e.p. target npos, or -1
+#   * result:  float32[N]       White's final score, or NaN if unknown
+#
+# Piece codes are those of Piece.code: 1 + plane, where
+#   plane = Player.value * 6 + PieceType.value.
+PLANE_COUNT = PLAYER_COUNT * PIECE_TYPE_COUNT
+
+# White's score for each finished GameState
+GAME_STATE_TO_SCORE = {game_state: float(white_score)
+                       for game_state, (white_score, _) in GAME_STATE_TO_SCORES_VALS.items()}
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+class DatasetWriter:
+    def __init__(self, path_prefix: str, chunk_size=DEFAULT_CHUNK_SIZE,
+            planes=False, compress=False):
+        self.path_prefix = path_prefix
+        self.chunk_size = chunk_size
+        self.planes = planes
+        self.compress = compress
+
+        self.chunk_count = 0
+        self.position_count = 0
+
+        self.codes = np.zeros((chunk_size, G.SPACE_COUNT), dtype=np.int8)
+        self.player = np.zeros(chunk_size, dtype=np.int8)
+        self.ep = np.zeros(chunk_size, dtype=np.int8)
+        self.result = np.zeros(chunk_size, dtype=np.float32)
+        self.chunk_len = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # ========================================
+
+    @classmethod
+    def board_to_codes(cls, board: Board) -> list:
+        return [0 if piece is None else piece.code for piece in board.pieces]
+
+    # Converts int8[N, 91] piece codes to uint8[N, 12, 91] bit planes.
+    @classmethod
+    def codes_to_planes(cls, codes: np.ndarray) -> np.ndarray:
+        plane_codes = np.arange(1, PLANE_COUNT + 1, dtype=np.int8)
+        return (codes[:, np.newaxis, :] == plane_codes[np.newaxis, :, np.newaxis]).astype(np.uint8)
+
+    @classmethod
+    def get_score(cls, attrs: Dict[str, str], game_state: GameState=None) -> float:
+        if game_state in GAME_STATE_TO_SCORE:
+            return GAME_STATE_TO_SCORE[game_state]
+        return RESULT_TO_SCORE.get(attrs.get('Result'), np.nan)
+
+    # ========================================
+
+    def add_board(self, board: Board, score: float) -> None:
+        k = self.chunk_len
+        self.codes[k] = self.board_to_codes(board)
+        self.player[k] = board.cur_player.value
+        self.ep[k] = -1 if board.ep_target is None else board.ep_target
+        self.result[k] = score
+        self.chunk_len += 1
+        self.position_count += 1
+        if self.chunk_len == self.chunk_size:
+            self.flush()
+
+    # Adds the position before each move, and the final position.
+    # Moves are replayed with do_partial_only=True, since only piece
+    # locations, the Player to move, and the e.p. target are recorded.
+    def add_moves(self, moves, score: float) -> None:
+        board = Board()
+        self.add_board(board, score)
+        for move in moves:
+            board.move_make(move, do_partial_only=True)
+            self.add_board(board, score)
+
+    def add_game(self, game: Game) -> None:
+        score = self.get_score(game.attrs, game.game_state)
+        self.add_moves(game.board.history_move[1:], score)
+
+    # Replays a GameArchive record without constructing a Game.
+    def add_archive_record(self, attrs, packed_moves) -> None:
+        score = self.get_score(attrs)
+        board = Board()
+        self.add_board(board, score)
+        for packed_move in packed_moves:
+            move = GameArchive.packed_move_to_move(board, packed_move)
+            board.move_make(move, do_partial_only=True)
+            self.add_board(board, score)
+
+    def flush(self) -> None:
+        if self.chunk_len == 0:
+            return
+        n = self.chunk_len
+        arrays = {
+            'player': self.player[:n],
+            'ep': self.ep[:n],
+            'result': self.result[:n],
+            }
+        if self.planes:
+            arrays['planes'] = self.codes_to_planes(self.codes[:n])
+        else:
+            arrays['codes'] = self.codes[:n]
+        path = f'{self.path_prefix}-{self.chunk_count:05d}.npz'
+        if self.compress:
+            np.savez_compressed(path, **arrays)
+        else:
+            np.savez(path, **arrays)
+        self.chunk_count += 1
+        self.chunk_len = 0
+
+    def close(self) -> None:
+        self.flush()
+
+
+# Yields the arrays of each chunk file written by a DatasetWriter, in order.
+def read_chunks(path_prefix: str) -> Iterator[Dict[str, np.ndarray]]:
+    for path in sorted(glob.glob(f'{path_prefix}-[0-9][0-9][0-9][0-9][0-9].npz')):
+        with np.load(path) as chunk:
+            yield dict(chunk)
+
+
+# Input paths can be PGN files (*.pgn) or game archives (see GameArchive).
+def export_paths(writer: DatasetWriter, paths: Iterable[str], lang='en') -> None:
+    for path in paths:
+        if path.endswith('.pgn'):
+            for game in GameArchive.pgn_to_games(path, lang):
+                writer.add_game(game)
+        else:
+            with open(path, 'rb') as f:
+                for attrs, packed_moves in GameArchive.read_records(f):
+                    writer.add_archive_record(attrs, packed_moves)
+
+
+# Usage: python -m src.dataset [--planes] <output_prefix> <input.pgn|input.glnk> ...
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export Board positions as NumPy arrays')
+    parser.add_argument('--lang', default='en', help='Language of PGN piece symbols (en or hu)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--planes', action='store_true', help='Write 12x91 bit planes')
+    parser.add_argument('--compress', action='store_true')
+    parser.add_argument('output_prefix')
+    parser.add_argument('input_paths', nargs='+')
+    args = parser.parse_args(argv)
+    with DatasetWriter(args.output_prefix, args.chunk_size,
+            planes=args.planes, compress=args.compress) as writer:
+        export_paths(writer, args.input_paths, args.lang)
+    print(f'Wrote {writer.position_count} positions in {writer.chunk_count} chunks')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
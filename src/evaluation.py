@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+from typing import Dict
+
+from bitarray.util import count_and
+
+from src.attack_map import AttackMap, LEAP_MASKS_BY_PT
+from src.bitboard import BB_COURT_BLACK, BB_COURT_WHITE, BITBOARD_RINGS
+from src.board import Board
+from src.pawn_structure import PawnStructure
+from src.piece_type import PieceType, PIECE_TYPES
+from src.player import Player, PLAYERS
+from src.zobrist import ZobristHash
+
+
+# Static evaluation of a Board position, in centipawns, from the point of
+# view of the Player to move (as negamax search expects).
+#
+# Material is read from Board.material_counts, which make/undo maintain,
+# so it costs a dozen multiplications rather than a scan of the Board.
+# Pawn structure (see src.pawn_structure) costs a scan, so it is cached in a
+# pawn table keyed by Board.pawn_zobrist_hash, which make/undo also maintain.
+# Pawns move rarely compared to other Pieces, so most lookups hit. Like the
+# search's transposition table, the pawn table is cleared when full.
+# Activity terms are popcounts of the attack masks of an AttackMap (see
+# src.attack_map), so no Moves are generated to count them:
+#   * mobility: spaces attacked that aren't occupied by one's own Pieces
+#   * center control: spaces attacked in the innermost rings
+#   * King zone attacks: spaces attacked next to the enemy King, or in its
+#     court, while it is still there
+#   * hanging Pieces: Pieces attacked by the enemy, and not defended
+PIECE_VALUES = {
+        PieceType.King:   0,
+        PieceType.Queen:  900,
+        PieceType.Rook:   500,
+        PieceType.Bishop: 300,
+        PieceType.Knight: 300,
+        PieceType.Pawn:   100,
+        }
+
+# Indexed by Piece.code - 1 (i.e., as Board.material_counts). White's
+# pieces count positively, and Black's negatively.
+CODE_VALUES = tuple((PIECE_VALUES[pt] if player == Player.White else -PIECE_VALUES[pt])
+                    for player in PLAYERS for pt in PIECE_TYPES)
+
+# Indexed by PieceType.value. Pawn mobility is left to pawn structure.
+MOBILITY_WEIGHTS = tuple({PieceType.Queen: 2, PieceType.Rook: 3,
+                          PieceType.Bishop: 4, PieceType.Knight: 4}.get(pt, 0)
+                         for pt in PIECE_TYPES)
+
+# (ring, weight per attacked space in it)
+CENTER_RING_WEIGHTS = tuple(zip(BITBOARD_RINGS[:3], (6, 4, 2)))
+
+KING_ZONE_WEIGHT = 5
+
+# Indexed by PieceType.value
+HANGING_PENALTIES = tuple(PIECE_VALUES[pt] // 8 for pt in PIECE_TYPES)
+
+# Indexed by Player.value, then by the King's npos
+KING_ZONE_MASKS = tuple(
+        tuple((king_mask | court) if court[npos] else king_mask
+              for npos, king_mask in enumerate(LEAP_MASKS_BY_PT[PieceType.King.value]))
+        for court in (BB_COURT_BLACK, BB_COURT_WHITE))
+
+DEFAULT_PAWN_TABLE_MAX_SIZE = 100_000
+
+
+class Evaluator:
+    def __init__(self, pawn_table_max_size=DEFAULT_PAWN_TABLE_MAX_SIZE):
+        self.pawn_table_max_size = pawn_table_max_size
+        self.pawn_table: Dict[ZobristHash, int] = {}
+        self.pawn_probe_count = 0
+        self.pawn_hit_count = 0
+
+    def evaluate_material(self, board: Board) -> int:
+        return sum(value * count for value, count in zip(CODE_VALUES, board.material_counts))
+
+    def evaluate_pawns(self, board: Board) -> int:
+        self.pawn_probe_count += 1
+        key = board.pawn_zobrist_hash
+        score = self.pawn_table.get(key)
+        if score is not None:
+            self.pawn_hit_count += 1
+            return score
+        score = PawnStructure.evaluate(board.pieces)
+        if len(self.pawn_table) >= self.pawn_table_max_size:
+            self.pawn_table.clear()
+        self.pawn_table[key] = score
+        return score
+
+    def evaluate_activity(self, board: Board) -> int:
+        attack_map = AttackMap(board.pieces)
+        score = 0
+        for player in PLAYERS:
+            p_val = player.value
+            o_val = player.opponent().value
+            attacks = attack_map.attacks[p_val]
+            term = sum(weight * count for weight, count
+                       in zip(MOBILITY_WEIGHTS, attack_map.mobility[p_val]))
+            for ring, weight in CENTER_RING_WEIGHTS:
+                term += weight * count_and(attacks, ring)
+            king_npos = attack_map.king_npos[o_val]
+            if king_npos is not None:
+                term += KING_ZONE_WEIGHT * count_and(attacks, KING_ZONE_MASKS[o_val][king_npos])
+            for npos in attack_map.get_hanging(player).search(1):
+                term -= HANGING_PENALTIES[board.pieces[npos].pt.value]
+            score += term if player == Player.White else -term
+        return score
+
+    def evaluate(self, board: Board) -> int:
+        score = (self.evaluate_material(board) + self.evaluate_pawns(board)
+                 + self.evaluate_activity(board))
+        return score if board.cur_player == Player.White else -score
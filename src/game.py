@@ -2,16 +2,28 @@
 # by Jay M. Coskey, 2026
 
 from collections import OrderedDict
-from typing import Tuple
+from typing import Dict, Tuple
 
 from src.board import Board
 from src.controller import Controller
 from src.controller import HumanPlayer, RandomPlayer
 from src.game_state import GameState
 from src.move import Move
+from src.move_alternative import MoveAlternative
 from src.player import Player
 
 
+# The (White, Black) scores of each finished GameState. Stalemating the
+# opponent is worth 3/4 of a point.
+GAME_STATE_TO_SCORES_VALS: Dict[GameState, Tuple[float, float]] = {
+        GameState.WinBlack: (0, 1),
+        GameState.WinWhite: (1, 0),
+        GameState.WinBlackStalemate: (0.25, 0.75),
+        GameState.WinWhiteStalemate: (0.75, 0.25),
+        GameState.Draw: (0.5, 0.5),
+        }
+
+
 # Note three possible roles for a class Game.
 #   (a) Complete state: A Game is played from beginning to end.
 #       from loaded PGN file.
@@ -25,6 +37,7 @@ class Game:
         self.attrs: OrderedDict[str, str] = None
         self.board: Board = None
         self.controllers: Dict[Player, Controller] = None
+        self.is_quiet = False
 
         for option, val in kwargs.items():
             if option == 'fen':
@@ -39,6 +52,10 @@ class Game:
             if option == 'pgn_text':
                 # TODO: Initialize Game with pgn_text
                 continue
+            if option == 'quiet':
+                # Suppress printing of the Game summary.
+                self.is_quiet = val
+                continue
             if option == 'players':
                 valid_chars = 'hr'
                 CHAR_TO_CONTROLLER = {
@@ -106,25 +123,17 @@ class Game:
             return "0-1"
         if self.game_state == GameState.WinWhite:
             return "1-0"
-        if self.game_state == GameState.WinStalemateBlack:
+        if self.game_state == GameState.WinBlackStalemate:
             return "1/4-3/4"
-        if self.game_state == GameState.WinStalemateWhite:
+        if self.game_state == GameState.WinWhiteStalemate:
             return "3/4-1/4"
         if self.game_state == GameState.Draw:
             return "1/2-1/2"
         return "(Score TBD)"
 
     def get_scores_vals(self) -> Tuple[float, float]:
-        if self.game_state == GameState.WinBlack:
-            return (0, 1)
-        if self.game_state == GameState.WinWhite:
-            return (1, 0)
-        if self.game_state == GameState.WinStalemateBlack:
-            return (0.25, 0.75)
-        if self.game_state == GameState.WinStalemateWhite:
-            return (0.75, 0.25)
-        if self.game_state == GameState.Draw:
-            return (0.5, 0.5)
+        if self.game_state in GAME_STATE_TO_SCORES_VALS:
+            return GAME_STATE_TO_SCORES_VALS[self.game_state]
         raise RuntimeError('Should not get score values fro unfinished game')
 
     def play(self):
@@ -143,22 +152,26 @@ class Game:
                     self.board.set_game_state(GameState.Draw)
                     break
                 if choice == MoveAlternative.OfferDraw:
-                    opp_controller = self.controllers[self.board.cur_player.opponent]
-                    response = opp_controller.do_accept_offer_draw()
+                    opp_controller = self.controllers[self.board.cur_player.opponent()]
+                    response = opp_controller.do_accept_offer_draw(self.board)
                     if response:
                         self.board.set_game_state(GameState.Draw)
                     continue
                 if choice == MoveAlternative.Resign:
-                    game_state = (GameState.WinBlack
+                    # The Player resigning loses.
+                    game_state = (GameState.WinWhite
                             if self.board.cur_player == Player.Black
-                            else GameState.WinWhite)
+                            else GameState.WinBlack)
                     self.board.set_game_state(game_state)
                     break
             else:
-                ValueError('Unknown type returned from Controller.choose_move()')
+                raise ValueError('Unknown type returned from Controller.choose_move()')
 
         # TODO: Notify players of outcome.
-        # TODO: Refactor this Game summary into a method.
+        if not self.is_quiet:
+            self.print_summary()
+
+    def print_summary(self):
         game_state = self.board.game_state
         if game_state == GameState.Draw:
             print('Game is a draw.')
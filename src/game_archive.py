@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import argparse
+from collections import OrderedDict
+import io
+import struct
+import sys
+from typing import BinaryIO, Iterable, Iterator, List
+
+from src.board import Board
+from src.game import Game
+from src.move import Move
+from src.pgn import Pgn
+from src.piece_type import PieceType, PROMO_PTS
+
+
+# A GameArchive is a compact binary file of Games, which can be replayed
+# without movetext parsing or move disambiguation.
+#
+# File layout (all integers little-endian):
+#   * Header:  magic (4 bytes), version (uint16), game count (uint32),
+#              offset of game index (uint64)
+#   * Games:   one record per Game (see below)
+#   * Index:   one uint64 file offset per Game record
+#
+# Game record layout:
+#   * tag count (uint16), then for each tag pair:
+#       key length (uint8), key (UTF-8), value length (uint16), value (UTF-8)
+#   * move count (uint16), then one packed move (uint16) per halfmove
+#
+# Packed move layout (16 bits):  fffffff ttttttt pp
+#   * f: fr_npos (7 bits; 91 spaces)
+#   * t: to_npos (7 bits)
+#   * p: index into PROMO_PTS (2 bits). This is only meaningful when a Pawn
+#        moves into its promotion zone. Otherwise, it is zero.
+# All other Move attributes (e.g., PieceType, capture, e.p. target) are
+# recovered from the Board as the Game is replayed.
+ARCHIVE_MAGIC = b'GLNK'
+ARCHIVE_VERSION = 1
+
+HEADER_STRUCT = struct.Struct('<4sHIQ')
+OFFSET_STRUCT = struct.Struct('<Q')
+COUNT_STRUCT = struct.Struct('<H')
+KEY_LEN_STRUCT = struct.Struct('<B')
+
+
+class GameArchive:
+    # ========================================
+    # SECTION: MOVE PACKING
+    # ========================================
+
+    @classmethod
+    def move_pack(cls, move: Move) -> int:
+        promo_ind = PROMO_PTS.index(move.promotion_pt) if move.promotion_pt else 0
+        return (move.fr_npos << 9) | (move.to_npos << 2) | promo_ind
+
+    # Returns (fr_npos, to_npos, promo_ind)
+    @classmethod
+    def move_unpack(cls, packed_move: int):
+        return (packed_move >> 9, (packed_move >> 2) & 0x7F, packed_move & 0x3)
+
+    # ========================================
+    # SECTION: WRITING
+    # ========================================
+
+    @classmethod
+    def game_to_bytes(cls, game: Game) -> bytes:
+        buf = io.BytesIO()
+        buf.write(COUNT_STRUCT.pack(len(game.attrs)))
+        for key, val in game.attrs.items():
+            key_bytes = key.encode('utf-8')
+            val_bytes = val.encode('utf-8')
+            buf.write(KEY_LEN_STRUCT.pack(len(key_bytes)))
+            buf.write(key_bytes)
+            buf.write(COUNT_STRUCT.pack(len(val_bytes)))
+            buf.write(val_bytes)
+        moves = game.board.history_move[1:]  # history_move[0] is None
+        buf.write(COUNT_STRUCT.pack(len(moves)))
+        buf.write(struct.pack(f'<{len(moves)}H', *[cls.move_pack(move) for move in moves]))
+        return buf.getvalue()
+
+    @classmethod
+    def write_games(cls, f: BinaryIO, games: Iterable[Game]) -> int:
+        f.write(HEADER_STRUCT.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, 0, 0))
+        offsets = []
+        for game in games:
+            offsets.append(f.tell())
+            f.write(cls.game_to_bytes(game))
+        index_offset = f.tell()
+        f.write(struct.pack(f'<{len(offsets)}Q', *offsets))
+        f.seek(0)
+        f.write(HEADER_STRUCT.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION,
+                len(offsets), index_offset))
+        f.seek(0, io.SEEK_END)
+        return len(offsets)
+
+    @classmethod
+    def write_path(cls, path: str, games: Iterable[Game]) -> int:
+        with open(path, 'wb') as f:
+            return cls.write_games(f, games)
+
+    # ========================================
+    # SECTION: READING
+    # ========================================
+
+    # Returns the list of Game record offsets.
+    @classmethod
+    def read_index(cls, f: BinaryIO) -> List[int]:
+        f.seek(0)
+        magic, version, game_count, index_offset = HEADER_STRUCT.unpack(
+                f.read(HEADER_STRUCT.size))
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError(f'Not a game archive (magic={magic})')
+        if version != ARCHIVE_VERSION:
+            raise ValueError(f'Unsupported game archive version: {version}')
+        f.seek(index_offset)
+        return list(struct.unpack(f'<{game_count}Q',
+                f.read(game_count * OFFSET_STRUCT.size)))
+
+    # Returns (tag pairs, packed moves), without replaying the Game.
+    @classmethod
+    def read_game_record(cls, f: BinaryIO, offset: int):
+        f.seek(offset)
+        attrs = OrderedDict[str, str]()
+        (tag_count,) = COUNT_STRUCT.unpack(f.read(COUNT_STRUCT.size))
+        for _ in range(tag_count):
+            (key_len,) = KEY_LEN_STRUCT.unpack(f.read(KEY_LEN_STRUCT.size))
+            key = f.read(key_len).decode('utf-8')
+            (val_len,) = COUNT_STRUCT.unpack(f.read(COUNT_STRUCT.size))
+            attrs[key] = f.read(val_len).decode('utf-8')
+        (move_count,) = COUNT_STRUCT.unpack(f.read(COUNT_STRUCT.size))
+        packed_moves = struct.unpack(f'<{move_count}H', f.read(2 * move_count))
+        return attrs, packed_moves
+
+    # The packed move is trusted to be legal on this Board,
+    # so no move generation is needed.
+    @classmethod
+    def packed_move_to_move(cls, board: Board, packed_move: int) -> Move:
+        fr_npos, to_npos, promo_ind = cls.move_unpack(packed_move)
+        pt = board.get_pt_at(fr_npos)
+        is_promotion = (pt == PieceType.Pawn
+                and board.is_in_pawn_promo_zone(to_npos))
+        move = Move(fr_npos, to_npos,
+                PROMO_PTS[promo_ind] if is_promotion else None)
+        move.pt = pt
+        if (pt == PieceType.Pawn and to_npos == board.ep_target
+                and board.is_empty(to_npos)):
+            move.capture_pt = PieceType.Pawn
+            move.ep_target = board.ep_target
+        return move
+
+    @classmethod
+    def record_to_game(cls, attrs, packed_moves) -> Game:
+        game = Game()
+        game.set_attributes(attrs)
+        board = game.board
+        for packed_move in packed_moves:
+            board.move_make(cls.packed_move_to_move(board, packed_move))
+        return game
+
+    @classmethod
+    def read_records(cls, f: BinaryIO):
+        for offset in cls.read_index(f):
+            yield cls.read_game_record(f, offset)
+
+    @classmethod
+    def read_game(cls, f: BinaryIO, offset: int) -> Game:
+        return cls.record_to_game(*cls.read_game_record(f, offset))
+
+    @classmethod
+    def read_games(cls, f: BinaryIO) -> Iterator[Game]:
+        for offset in cls.read_index(f):
+            yield cls.read_game(f, offset)
+
+    @classmethod
+    def read_path(cls, path: str) -> Iterator[Game]:
+        with open(path, 'rb') as f:
+            yield from cls.read_games(f)
+
+    # ========================================
+    # SECTION: CONVERSION
+    # ========================================
+
+    # Games that cannot be resolved from their movetext are skipped, with
+    #   a warning to stderr. The index (in the file) of each skipped Game
+    #   is appended to skipped, if given.
+    @classmethod
+    def pgn_to_games(cls, pgn_path: str, lang='en',
+            skipped: List[int]=None) -> Iterator[Game]:
+        game_specs = Pgn.pgn_lines_to_game_specs(Pgn.get_pgn_lines(pgn_path))
+        for game_ind, game_spec in enumerate(game_specs):
+            try:
+                game = Pgn.game_spec_to_game(game_spec, lang)
+            except (AssertionError, NotImplementedError, ValueError) as e:
+                print(f'Skipped game {game_ind} of {pgn_path}: {e!r}',
+                      file=sys.stderr)
+                if skipped is not None:
+                    skipped.append(game_ind)
+                continue
+            yield game
+
+    @classmethod
+    def pgn_to_archive(cls, pgn_path: str, archive_path: str, lang='en',
+            skipped: List[int]=None) -> int:
+        return cls.write_path(archive_path, cls.pgn_to_games(pgn_path, lang, skipped))
+
+
+# Usage: python -m src.game_archive [--lang hu] <input.pgn> <output.glnk>
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Convert a PGN file to a binary game archive')
+    parser.add_argument('--lang', default='en', help='Language of piece symbols (en or hu)')
+    parser.add_argument('pgn_path')
+    parser.add_argument('archive_path')
+    args = parser.parse_args(argv)
+    skipped = []
+    game_count = GameArchive.pgn_to_archive(args.pgn_path, args.archive_path, args.lang, skipped)
+    print(f'Wrote {game_count} games to {args.archive_path}'
+          + (f' (skipped {len(skipped)})' if skipped else ''))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
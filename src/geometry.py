@@ -2,13 +2,14 @@
 # by Jay M. Coskey, 2026
 
 import re
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from src.bitboard import *
 from src.board_color import BoardColor
+from src.geometry_cache import GeometryCache
 from src.hex_pos import HexPos
 from src.hex_vec import HexVec
-from src.piece import Piece
+from src.piece import Piece, FEN_SYMBOL_TO_PLAYER_PT
 from src.piece_type import PieceType, PIECE_TYPES
 from src.player import Player, PLAYERS
 
@@ -172,6 +173,12 @@ class Geometry:
         for k, alg in enumerate(BOARD_SPACE_NAMES):
             setattr(cls, alg, alg_to_pos(alg))
 
+        # Lookup table for the common conversion from (lower case)
+        # algebraic notation to npos, avoiding regex matching.
+        ALG_TO_NPOS = {alg.lower(): npos
+                for npos, alg in enumerate(BOARD_SPACE_NAMES)}
+        setattr(cls, "ALG_TO_NPOS", ALG_TO_NPOS)
+
         # --------------------
 
         # Define initial layout of pieces,
@@ -199,6 +206,15 @@ class Geometry:
                 }
         setattr(cls, "INIT_LAYOUT_DICT", INIT_LAYOUT_DICT)
 
+        # The initial Board.pieces, indexed by npos. Pieces are immutable,
+        # so a Board can start from a shallow copy of this.
+        INIT_PIECES = [None] * SPACE_COUNT
+        for player, pt_positions in INIT_LAYOUT_DICT.items():
+            for pt, positions in pt_positions.items():
+                for pos in positions:
+                    INIT_PIECES[cls.pos_to_npos(pos)] = Piece(player, pt)
+        setattr(cls, "INIT_PIECES", tuple(INIT_PIECES))
+
 
         # Here is what FEN for an initial Board setup would look like
         # if the Spaces were arranged in row order:
@@ -306,127 +322,117 @@ class Geometry:
         setattr(cls, "VECS_PAWN_HOP_WHITE",  VECS_PAWN_HOP_WHITE)
 
         # --------------------
-        LEAPS_KING = {}
-        for npos in range(SPACE_COUNT):
-            pos = cls.npos_to_pos(npos)
-            npos_leap = [cls.pos_to_npos(pos + vec)
-                        for vec in VECS_12
-                        if cls.is_pos_on_board(pos + vec)]
-            LEAPS_KING[npos] = npos_leap
-        setattr(cls, "LEAPS_KING", LEAPS_KING)
-
-        LEAPS_KNIGHT = {}
-        for npos in range(SPACE_COUNT):
-            pos = cls.npos_to_pos(npos)
-            npos_leap = [cls.pos_to_npos(pos + vec)
-                        for vec in VECS_KNIGHT
-                        if cls.is_pos_on_board(pos + vec)]
-            LEAPS_KNIGHT[npos] = npos_leap
-        setattr(cls, "LEAPS_KNIGHT", LEAPS_KNIGHT)
-
-        # --------------------
-        #
-        # This section could likely be more compact, at the cost of clarity.
-        #
-        LEAP_PAWN_ADV_BLACK = {}
-        for npos in range(SPACE_COUNT):
-            if BB_COURT_BLACK[npos] or BB_PAWN_PROMO_BLACK[npos]:
-                continue
-            pos = cls.npos_to_pos(npos)
-            pos_adv = pos + VECS_PAWN_ADV_BLACK
-            LEAP_PAWN_ADV_BLACK[npos] = cls.pos_to_npos(pos_adv)
-        setattr(cls, "LEAP_PAWN_ADV_BLACK", LEAP_PAWN_ADV_BLACK)
-
-        LEAP_PAWN_ADV_WHITE = {}
-        for npos in range(SPACE_COUNT):
-            if BB_COURT_WHITE[npos] or BB_PAWN_PROMO_WHITE[npos]:
-                continue
-            pos = cls.npos_to_pos(npos)
-            pos_adv = pos + VECS_PAWN_ADV_WHITE
-            LEAP_PAWN_ADV_WHITE[npos] = cls.pos_to_npos(pos_adv)
-        setattr(cls, "LEAP_PAWN_ADV_WHITE", LEAP_PAWN_ADV_WHITE)
-
-        # --------------------
-
-        LEAP_PAWN_CAPT_BLACK = {}
-        for npos in range(SPACE_COUNT):
-            if BB_COURT_BLACK[npos] or BB_PAWN_PROMO_BLACK[npos]:
-                continue
-            pos = cls.npos_to_pos(npos)
-            npos_capt = [cls.pos_to_npos(pos + vec)
-                        for vec in VECS_PAWN_CAPT_BLACK
-                        if cls.is_pos_on_board(pos + vec)]
-            LEAP_PAWN_CAPT_BLACK[npos] = npos_capt
-        setattr(cls, "LEAP_PAWN_CAPT_BLACK", LEAP_PAWN_CAPT_BLACK)
-
-        LEAP_PAWN_CAPT_WHITE = {}
-        for npos in range(SPACE_COUNT):
-            if BB_COURT_WHITE[npos] or BB_PAWN_PROMO_WHITE[npos]:
-                continue
-            pos = cls.npos_to_pos(npos)
-            npos_capt = [cls.pos_to_npos(pos + vec)
-                        for vec in VECS_PAWN_CAPT_WHITE
-                        if cls.is_pos_on_board(pos + vec)]
-            LEAP_PAWN_CAPT_WHITE[npos] = npos_capt
-        setattr(cls, "LEAP_PAWN_CAPT_WHITE", LEAP_PAWN_CAPT_WHITE)
-
-        # --------------------
-
-        LEAP_PAWN_HOP_BLACK = {}
-        for pos in PAWN_HOME_BLACK:
-            npos = cls.pos_to_npos(pos)
-            pos_hop = cls.npos_to_pos(npos) + VECS_PAWN_HOP_BLACK
-            LEAP_PAWN_HOP_BLACK[npos] = cls.pos_to_npos(pos_hop)
-        setattr(cls, "LEAP_PAWN_HOP_BLACK", LEAP_PAWN_HOP_BLACK)
-
-        LEAP_PAWN_HOP_WHITE = {}
-        for pos in PAWN_HOME_WHITE:
-            npos = cls.pos_to_npos(pos)
-            pos_hop = cls.npos_to_pos(npos) + VECS_PAWN_HOP_WHITE
-            LEAP_PAWN_HOP_WHITE[npos] = cls.pos_to_npos(pos_hop)
-        setattr(cls, "LEAP_PAWN_HOP_WHITE", LEAP_PAWN_HOP_WHITE)
-
-        # --------------------
-
-        # When moving a slider, check space in progression,
-        # until the piece moves off the board or contacts a piece.
-        # Called by get_moves_pseudolegal_slider().
-        # Pre-compute this, so rays can be found by lookup.
-        def compute_ray(pos: HexPos, vec: HexVec) -> List[Npos]:
-            result = []
-            cursor = pos
-            for _ in range(11):
-                cursor = cursor + vec
-                if cls.is_pos_on_board(cursor):
-                    result.append(cls.pos_to_npos(cursor))
-                else:
-                    return result
-
-        def compute_rays(pos: HexPos, vecs: List[HexVec]) -> List[List[Npos]]:
-            result = []
-            for vec in vecs:
-                ray = compute_ray(pos, vec)
-                if ray:  # Do not append zero-length rays.
-                    result.append(ray)
-            return result
-
-        RAYS_BISHOP = {}
-        for npos in range(SPACE_COUNT):
-            pos = HexPos(COORD_HEX0[npos], COORD_HEX1[npos])
-            RAYS_BISHOP[npos] = compute_rays(pos, VECS_DIAG)
-        setattr(cls, "RAYS_BISHOP", RAYS_BISHOP)
-
-        RAYS_QUEEN = {}
-        for npos in range(SPACE_COUNT):
-            pos = HexPos(COORD_HEX0[npos], COORD_HEX1[npos])
-            RAYS_QUEEN[npos] = compute_rays(pos, VECS_12)
-        setattr(cls, "RAYS_QUEEN", RAYS_QUEEN)
-
-        RAYS_ROOK = {}
-        for npos in range(SPACE_COUNT):
-            pos = HexPos(COORD_HEX0[npos], COORD_HEX1[npos])
-            RAYS_ROOK[npos] = compute_rays(pos, VECS_ORTHO)
-        setattr(cls, "RAYS_ROOK", RAYS_ROOK)
+        # The tables below map each npos to the npos values reachable from it.
+        # Each is a flat tuple indexed by npos (rather than a dict), holding
+        # tuples, so that move generation does one indexing step per lookup.
+        # Pawn advances and hops hold None where a Pawn can't move.
+        # They are the bulk of the work done here, so they are cached on disk,
+        # keyed by a hash of the source files they depend on (see GeometryCache).
+        def compute_tables() -> Dict[str, Tuple]:
+            tables = {}
+
+            def compute_leaps(npos: Npos, vecs: List[HexVec]) -> Tuple[Npos, ...]:
+                pos = cls.npos_to_pos(npos)
+                return tuple(cls.pos_to_npos(pos + vec)
+                             for vec in vecs
+                             if cls.is_pos_on_board(pos + vec))
+
+            tables["LEAPS_KING"] = tuple(compute_leaps(npos, VECS_12)
+                                         for npos in range(SPACE_COUNT))
+            tables["LEAPS_KNIGHT"] = tuple(compute_leaps(npos, VECS_KNIGHT)
+                                           for npos in range(SPACE_COUNT))
+
+            # --------------------
+            # A Pawn never stands in its own court, nor in its promotion zone.
+            def can_pawn_move_from(npos: Npos, player: Player) -> bool:
+                if player == Player.Black:
+                    return not (BB_COURT_BLACK[npos] or BB_PAWN_PROMO_BLACK[npos])
+                return not (BB_COURT_WHITE[npos] or BB_PAWN_PROMO_WHITE[npos])
+
+            tables["LEAP_PAWN_ADV_BLACK"] = tuple(
+                    cls.pos_to_npos(cls.npos_to_pos(npos) + VECS_PAWN_ADV_BLACK)
+                    if can_pawn_move_from(npos, Player.Black) else None
+                    for npos in range(SPACE_COUNT))
+            tables["LEAP_PAWN_ADV_WHITE"] = tuple(
+                    cls.pos_to_npos(cls.npos_to_pos(npos) + VECS_PAWN_ADV_WHITE)
+                    if can_pawn_move_from(npos, Player.White) else None
+                    for npos in range(SPACE_COUNT))
+
+            tables["LEAP_PAWN_CAPT_BLACK"] = tuple(
+                    compute_leaps(npos, VECS_PAWN_CAPT_BLACK)
+                    if can_pawn_move_from(npos, Player.Black) else ()
+                    for npos in range(SPACE_COUNT))
+            tables["LEAP_PAWN_CAPT_WHITE"] = tuple(
+                    compute_leaps(npos, VECS_PAWN_CAPT_WHITE)
+                    if can_pawn_move_from(npos, Player.White) else ()
+                    for npos in range(SPACE_COUNT))
+
+            npos_pawn_home_black = {cls.pos_to_npos(pos) for pos in PAWN_HOME_BLACK}
+            npos_pawn_home_white = {cls.pos_to_npos(pos) for pos in PAWN_HOME_WHITE}
+            tables["LEAP_PAWN_HOP_BLACK"] = tuple(
+                    cls.pos_to_npos(cls.npos_to_pos(npos) + VECS_PAWN_HOP_BLACK)
+                    if npos in npos_pawn_home_black else None
+                    for npos in range(SPACE_COUNT))
+            tables["LEAP_PAWN_HOP_WHITE"] = tuple(
+                    cls.pos_to_npos(cls.npos_to_pos(npos) + VECS_PAWN_HOP_WHITE)
+                    if npos in npos_pawn_home_white else None
+                    for npos in range(SPACE_COUNT))
+
+            # The inverse of LEAP_PAWN_CAPT_*: the spaces from which a Pawn of
+            # the given Player would capture onto each space. Used to detect
+            # attacks on a space without generating the attacker's moves.
+            tables["LEAP_PAWN_ATTACKERS_BLACK"] = tuple(
+                    compute_leaps(npos, [-1 * vec for vec in VECS_PAWN_CAPT_BLACK])
+                    for npos in range(SPACE_COUNT))
+            tables["LEAP_PAWN_ATTACKERS_WHITE"] = tuple(
+                    compute_leaps(npos, [-1 * vec for vec in VECS_PAWN_CAPT_WHITE])
+                    for npos in range(SPACE_COUNT))
+
+            # --------------------
+
+            # When moving a slider, check space in progression,
+            # until the piece moves off the board or contacts a piece.
+            # Called by get_moves_pseudolegal_slider().
+            # Pre-compute this, so rays can be found by lookup.
+            def compute_ray(pos: HexPos, vec: HexVec) -> Tuple[Npos, ...]:
+                result = []
+                cursor = pos
+                for _ in range(11):
+                    cursor = cursor + vec
+                    if cls.is_pos_on_board(cursor):
+                        result.append(cls.pos_to_npos(cursor))
+                    else:
+                        break
+                return tuple(result)
+
+            def compute_rays(npos: Npos, vecs: List[HexVec]) -> Tuple[Tuple[Npos, ...], ...]:
+                pos = HexPos(COORD_HEX0[npos], COORD_HEX1[npos])
+                rays = (compute_ray(pos, vec) for vec in vecs)
+                return tuple(ray for ray in rays if ray)  # Omit zero-length rays.
+
+            tables["RAYS_BISHOP"] = tuple(compute_rays(npos, VECS_DIAG)
+                                          for npos in range(SPACE_COUNT))
+            tables["RAYS_QUEEN"] = tuple(compute_rays(npos, VECS_12)
+                                         for npos in range(SPACE_COUNT))
+            tables["RAYS_ROOK"] = tuple(compute_rays(npos, VECS_ORTHO)
+                                        for npos in range(SPACE_COUNT))
+            return tables
+
+        for name, table in GeometryCache.get_tables(compute_tables).items():
+            setattr(cls, name, table)
+
+        # The leap and ray tables of each PieceType, indexed by PieceType.value,
+        # so that move generation dispatches by lookup, rather than by branching.
+        # None marks a PieceType that has no such table.
+        LEAPS_BY_PT = tuple({PieceType.King: cls.LEAPS_KING,
+                             PieceType.Knight: cls.LEAPS_KNIGHT}.get(pt)
+                            for pt in PIECE_TYPES)
+        RAYS_BY_PT = tuple({PieceType.Queen: cls.RAYS_QUEEN,
+                            PieceType.Rook: cls.RAYS_ROOK,
+                            PieceType.Bishop: cls.RAYS_BISHOP}.get(pt)
+                           for pt in PIECE_TYPES)
+        setattr(cls, "LEAPS_BY_PT", LEAPS_BY_PT)
+        setattr(cls, "RAYS_BY_PT", RAYS_BY_PT)
 
     # ========================================
     # ========================================
@@ -442,6 +448,39 @@ class Geometry:
         hex1 = rank - 6 + max(0, hex0)
         return HexPos(hex0, hex1)
 
+    # Parses the board part of a FEN string directly into a list of Pieces
+    # (or None) indexed by npos, without an intermediate LayoutDict.
+    # Validation matches that of fen_board_to_layout_dict().
+    @classmethod
+    def fen_board_to_pieces(cls, fen: str) -> List[Optional[Piece]]:
+        file_strs = fen.split('/')
+        if len(file_strs) != 11:
+            raise ValueError(f'Invalid FEN string: Has {len(file_strs)} files instead of 11: {fen}')
+        pieces = []
+        for file_num, file_str in enumerate(file_strs):
+            file_start = len(pieces)
+            blank_count = 0
+            for c in file_str:
+                if c.isdigit():
+                    blank_count = 10 * blank_count + int(c)
+                    continue
+                if blank_count:
+                    pieces.extend([None] * blank_count)
+                    blank_count = 0
+                if c not in FEN_SYMBOL_TO_PLAYER_PT:
+                    raise ValueError(f'Invalid FEN string: Unrecognized piece symbol {c}: {fen}')
+                pieces.append(Piece(*FEN_SYMBOL_TO_PLAYER_PT[c]))
+            if blank_count:
+                pieces.extend([None] * blank_count)
+            if len(pieces) - file_start != cls.RANK_COUNT_PER_FILE[file_num]:
+                expected_len = cls.RANK_COUNT_PER_FILE[file_num]
+                actual_len = len(pieces) - file_start
+                msg = (f'Invalid FEN string: The (1-based) file #{file_num}, '
+                    + f'"{file_str}", has info on {actual_len} spaces, '
+                    + f'when it should have info on {expected_len} spaces.')
+                raise ValueError(msg)
+        return pieces
+
     @classmethod
     def fen_board_to_layout_dict(cls, fen: str) -> LayoutDict:
         layout_dict = cls.get_layout_dict_empty()
@@ -489,16 +528,11 @@ class Geometry:
     # Note: Geometry.get_rays() populates the "pre-computed" RAYS_*.
     #       This method retrives them.
     @classmethod
-    def get_rays(cls, npos: Npos, pt: PieceType) -> List[List[Npos]]:
-        if pt == PieceType.Queen:
-            rays = cls.RAYS_QUEEN[npos]
-        elif pt == PieceType.Rook:
-            rays = cls.RAYS_ROOK[npos]
-        elif pt == PieceType.Bishop:
-            rays = cls.RAYS_BISHOP[npos]
-        else:
+    def get_rays(cls, npos: Npos, pt: PieceType) -> Tuple[Tuple[Npos, ...], ...]:
+        rays_by_npos = cls.RAYS_BY_PT[pt.value]
+        if rays_by_npos is None:
             raise ValueError(f'Unrecognized slider type: {pt}')
-        return rays
+        return rays_by_npos[npos]
 
     @classmethod
     def is_pos_on_board(cls, pos: HexPos):
@@ -522,6 +556,8 @@ class Geometry:
     #
     @classmethod
     def alg_to_npos(cls, alg: str) -> str:
+        if alg in cls.ALG_TO_NPOS:
+            return cls.ALG_TO_NPOS[alg]
         return cls.pos_to_npos(cls.alg_to_pos(alg))
 
     @classmethod
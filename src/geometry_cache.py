@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import marshal
+import os
+import sys
+from typing import Callable, Dict
+
+
+# Geometry's movement tables (leaps and rays, by npos) take most of the time
+# spent importing src.geometry, and so src.board. They are cached in a marshal
+# file, named by a hash of the source files they're computed from, so that
+# any change to those files invalidates the cache:
+#   $GLINSKI_GEOMETRY_CACHE, if set, or else
+#   src/__pycache__/geometry_tables.<hash>.marshal
+# The cache is written on first use (or by running this module, e.g., as a
+# build step). If it can't be read or written (e.g., in a read-only install),
+# the tables are computed as usual.
+#
+# Since this module is imported by every process that imports src.board,
+# it avoids the import costs of hashlib, pickle, and tempfile: the tables
+# (dicts of ints and lists) are stored with marshal, the hash is a pair of
+# zlib checksums (a cache key, not a security measure), and tempfile is
+# only imported when a cache file is written.
+SOURCE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_FNAMES = ['geometry.py', 'bitboard.py', 'hex_pos.py', 'hex_vec.py']
+CACHE_DIR = os.path.join(SOURCE_DIR, '__pycache__')
+CACHE_FNAME_PREFIX = 'geometry_tables.'
+CACHE_FNAME_SUFFIX = '.marshal'
+
+Tables = Dict[str, Dict]
+
+
+class GeometryCache:
+    @classmethod
+    def get_source_hash(cls) -> str:
+        import zlib  # pylint: disable=import-outside-toplevel
+        crc = zlib.crc32(bytes([marshal.version]))
+        adler = zlib.adler32(bytes([marshal.version]))
+        for fname in SOURCE_FNAMES:
+            with open(os.path.join(SOURCE_DIR, fname), 'rb') as f:
+                data = f.read()
+            crc = zlib.crc32(data, crc)
+            adler = zlib.adler32(data, adler)
+        return f'{crc:08x}{adler:08x}'
+
+    @classmethod
+    def get_path(cls) -> str:
+        path = os.getenv('GLINSKI_GEOMETRY_CACHE')
+        if path:
+            return path
+        return os.path.join(CACHE_DIR, CACHE_FNAME_PREFIX + cls.get_source_hash() + CACHE_FNAME_SUFFIX)
+
+    # A cache file set by $GLINSKI_GEOMETRY_CACHE holds its source hash,
+    # since its name doesn't.
+    @classmethod
+    def read(cls, path: str):
+        try:
+            with open(path, 'rb') as f:
+                source_hash, tables = marshal.loads(f.read())
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if source_hash != cls.get_source_hash():
+            return None
+        return tables
+
+    # The file is written under a temporary name and then renamed, so that
+    # processes starting concurrently never read a partial file.
+    @classmethod
+    def write(cls, path: str, tables: Tables) -> bool:
+        import tempfile  # pylint: disable=import-outside-toplevel
+        tmp_path = None
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.')
+            with os.fdopen(fd, 'wb') as f:
+                marshal.dump((cls.get_source_hash(), tables), f)
+            os.replace(tmp_path, path)
+        except OSError:
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+            return False
+        return True
+
+    # Removes cache files for earlier versions of the source files.
+    @classmethod
+    def remove_stale(cls, path: str) -> None:
+        if os.path.dirname(path) != CACHE_DIR:
+            return
+        for fname in os.listdir(CACHE_DIR):
+            if (fname.startswith(CACHE_FNAME_PREFIX) and fname.endswith(CACHE_FNAME_SUFFIX)
+                    and fname != os.path.basename(path)):
+                try:
+                    os.remove(os.path.join(CACHE_DIR, fname))
+                except OSError:
+                    pass
+
+    @classmethod
+    def get_tables(cls, compute_tables: Callable[[], Tables]) -> Tables:
+        path = cls.get_path()
+        tables = cls.read(path)
+        if tables is None:
+            tables = compute_tables()
+            if cls.write(path, tables):
+                cls.remove_stale(path)
+        return tables
+
+
+# Usage: python -m src.geometry_cache
+# Importing Geometry computes and caches its tables, if needed.
+def main():
+    path = GeometryCache.get_path()
+    if os.path.exists(path):
+        os.remove(path)
+    from src.geometry import Geometry  # pylint: disable=import-outside-toplevel, unused-import
+    if not os.path.exists(path):
+        print(f'Could not write {path}')
+        return 1
+    print(f'Wrote {path}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import importlib
+import os
+import random
+import sys
+import time
+from typing import Dict, Iterator, List, Tuple
+
+from src.controller import Controller, RandomPlayer
+from src.game import Game
+from src.game_state import GameState
+from src.player import Player
+
+
+# A match is a series of Games between two Controllers, which alternate
+# playing White. Each Game is played with its own random seed, derived from
+# the match seed and the Game's index, so results don't depend on how Games
+# are scheduled across worker processes.
+#
+# Controllers are named, so that they can be passed to worker processes:
+#   * a key of CONTROLLER_NAMES (e.g., random), or
+#   * a module path and class name (e.g., src.controller:RandomPlayer).
+# Named Controllers are given in the same form, so that a Controller's
+# module (e.g., the search, with its evaluation) is only imported when used.
+CONTROLLER_NAMES = {
+        'book': 'src.book:BookPlayer',
+        'random': 'src.controller:RandomPlayer',
+        'search': 'src.search:SearchPlayer',
+        }
+
+HALFMOVE_BUCKET_SIZE = 50
+
+# (game_ind, white_name, black_name, game_state_name, halfmove_count, scores),
+#   where scores are those of Game.get_scores_vals(): (White, Black).
+GameResult = Tuple[int, str, str, str, int, Tuple[float, float]]
+
+
+def get_controller(name: str) -> Controller:
+    name = CONTROLLER_NAMES.get(name, name)
+    if ':' in name:
+        module_name, class_name = name.split(':', 1)
+        return getattr(importlib.import_module(module_name), class_name)
+    raise ValueError(f'Unknown Controller: {name}')
+
+
+def get_game_seed(match_seed: int, game_ind: int) -> int:
+    return (match_seed << 32) + game_ind
+
+
+# Called once in each worker process.
+def init_worker() -> None:
+    RandomPlayer.is_verbose = False
+
+
+def play_game(game_ind: int, seed: int, white_name: str, black_name: str) -> GameResult:
+    random.seed(seed)
+    game = Game(quiet=True)
+    game.controllers = {
+            Player.White: get_controller(white_name),
+            Player.Black: get_controller(black_name),
+            }
+    game.play()
+    return (game_ind, white_name, black_name,
+            game.game_state.name, game.board.halfmove_count, game.get_scores_vals())
+
+
+def _play_game_args(args) -> GameResult:
+    return play_game(*args)
+
+
+class MatchStats:
+    def __init__(self, names: List[str]):
+        self.names = names
+        self.game_count = 0
+        self.scores: Dict[str, float] = {name: 0.0 for name in names}
+        self.wins: Dict[str, int] = {name: 0 for name in names}
+        self.stalemate_wins: Dict[str, int] = {name: 0 for name in names}
+        self.color_scores: Dict[Player, float] = {Player.White: 0.0, Player.Black: 0.0}
+        self.draw_count = 0
+        self.halfmove_histo: Counter = Counter()
+        self.halfmove_total = 0
+        self.elapsed_secs = 0.0
+
+    def add(self, result: GameResult) -> None:
+        _, white_name, black_name, game_state_name, halfmove_count, scores = result
+        white_score, black_score = scores
+
+        self.game_count += 1
+        self.scores[white_name] += white_score
+        self.scores[black_name] += black_score
+        self.color_scores[Player.White] += white_score
+        self.color_scores[Player.Black] += black_score
+        game_state = GameState[game_state_name]
+        if game_state == GameState.Draw:
+            self.draw_count += 1
+        elif game_state == GameState.WinWhite:
+            self.wins[white_name] += 1
+        elif game_state == GameState.WinBlack:
+            self.wins[black_name] += 1
+        elif game_state == GameState.WinWhiteStalemate:
+            self.stalemate_wins[white_name] += 1
+        elif game_state == GameState.WinBlackStalemate:
+            self.stalemate_wins[black_name] += 1
+        bucket = halfmove_count // HALFMOVE_BUCKET_SIZE * HALFMOVE_BUCKET_SIZE
+        self.halfmove_histo[bucket] += 1
+        self.halfmove_total += halfmove_count
+
+    def get_summary_str(self) -> str:
+        lines = []
+        for name in self.names:
+            lines.append(f'{name}: score={self.scores[name]:g}, '
+                    + f'wins={self.wins[name]}, '
+                    + f'stalemate wins={self.stalemate_wins[name]}')
+        lines.append(f'draws={self.draw_count}, '
+                + f'White score={self.color_scores[Player.White]:g}, '
+                + f'Black score={self.color_scores[Player.Black]:g}')
+        if self.game_count:
+            lines.append(f'halfmoves: mean={self.halfmove_total / self.game_count:.1f}')
+        for bucket in sorted(self.halfmove_histo):
+            lines.append(f'  {bucket:5d}-{bucket + HALFMOVE_BUCKET_SIZE - 1:<5d} '
+                    + f'{self.halfmove_histo[bucket]}')
+        if self.elapsed_secs > 0:
+            lines.append(f'{self.game_count} games in {self.elapsed_secs:.2f}s '
+                    + f'({self.game_count / self.elapsed_secs:.2f} games/sec)')
+        return '\n'.join(lines)
+
+
+# Controller name_a plays White in even-numbered Games.
+def get_game_args(name_a: str, name_b: str, game_count: int, match_seed: int):
+    for game_ind in range(game_count):
+        white_name, black_name = ((name_a, name_b) if game_ind % 2 == 0
+                else (name_b, name_a))
+        yield (game_ind, get_game_seed(match_seed, game_ind), white_name, black_name)
+
+
+# With worker_count=1, Games are played in this process, which is set up
+# as a worker only while they are played.
+def play_results(name_a: str, name_b: str, game_count: int,
+        match_seed=0, worker_count=None) -> Iterator[GameResult]:
+    game_args = get_game_args(name_a, name_b, game_count, match_seed)
+    if worker_count == 1:
+        is_verbose = RandomPlayer.is_verbose
+        init_worker()
+        try:
+            for args in game_args:
+                yield play_game(*args)
+        finally:
+            RandomPlayer.is_verbose = is_verbose
+        return
+    with ProcessPoolExecutor(max_workers=worker_count, initializer=init_worker) as executor:
+        yield from executor.map(_play_game_args, game_args)
+
+
+def play_match(name_a: str, name_b: str, game_count: int,
+        match_seed=0, worker_count=None) -> MatchStats:
+    names = [name_a] if name_a == name_b else [name_a, name_b]
+    stats = MatchStats(names)
+    time_start = time.perf_counter()
+    for result in play_results(name_a, name_b, game_count, match_seed, worker_count):
+        stats.add(result)
+    stats.elapsed_secs = time.perf_counter() - time_start
+    return stats
+
+
+# Usage: python -m src.match [-n <games>] [--seed <seed>] [--workers <count>] <controller> <controller>
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Play a match between two Controllers')
+    parser.add_argument('-n', '--games', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('controller_a')
+    parser.add_argument('controller_b')
+    args = parser.parse_args(argv)
+    stats = play_match(args.controller_a, args.controller_b, args.games,
+            args.seed, args.workers)
+    print(stats.get_summary_str())
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+from src.bitboard import BB_SPACES_DARK, BB_SPACES_LIGHT, BB_SPACES_MEDIUM
+from src.board_color import BoardColor
+from src.geometry import Geometry as G
+from src.piece_type import PieceType
+
+
+# Material that can never produce checkmate, for either Player, whatever
+# moves are made.
+#
+# A Player's minor material is keyed by
+#   (Knight count, Medium Bishop count, Light Bishop count, Dark Bishop count),
+# and a position's by (Black's key, White's key). Positions with any Pawn,
+# Queen, or Rook are never in this set.
+#
+# This differs from orthodox chess. An exhaustive search for checkmate
+# positions with each material (with any Player to move, and with Bishops
+# on each combination of colors) shows that on Glinski's board:
+#   * KN vs K and KNN vs K have checkmates;
+#   * KB vs K has checkmates with a Light or Dark Bishop, but not with
+#     a Medium Bishop;
+#   * KBB vs K has checkmates unless both Bishops are Medium;
+#   * KB vs KB has checkmates unless both Bishops are Medium.
+#
+# Such positions are still not dead, and so not drawn: stalemate is a
+# partial win, and it can be reached with any of this material. A lone King
+# can be stalemated by the opposing King alone (e.g., with White's King on
+# b4 and Black's on a6, White to move, Kb4-c6 stalemates Black), and KB vs
+# KB can reach K vs K by captures. So no position is dead by material alone,
+# and these endings are left to the tablebase and search.
+MAJOR_OR_PAWN_PTS = (PieceType.Queen, PieceType.Rook, PieceType.Pawn)
+
+KEY_KING = (0, 0, 0, 0)
+KEY_BISHOP_MEDIUM = (0, 1, 0, 0)
+KEY_BISHOPS_MEDIUM = (0, 2, 0, 0)
+
+NO_CHECKMATE_MATERIAL_KEYS = frozenset(
+        [(KEY_KING, KEY_KING)]
+        + [pair for key in (KEY_BISHOP_MEDIUM, KEY_BISHOPS_MEDIUM)
+           for pair in ((key, KEY_KING), (KEY_KING, key))]
+        + [(KEY_BISHOP_MEDIUM, KEY_BISHOP_MEDIUM)])
+
+
+def get_npos_to_board_color_value():
+    result = [None] * G.SPACE_COUNT
+    for bb_spaces, board_color in ((BB_SPACES_MEDIUM, BoardColor.Medium),
+                                   (BB_SPACES_LIGHT, BoardColor.Light),
+                                   (BB_SPACES_DARK, BoardColor.Dark)):
+        for npos in bb_spaces.search(1):
+            result[npos] = board_color.value
+    return tuple(result)
+
+
+NPOS_TO_BOARD_COLOR_VALUE = get_npos_to_board_color_value()
@@ -1,13 +1,39 @@
 #!/usr/bin/env python
 # by Jay M. Coskey, 2026
 
+from array import array
 import re
 import sys
 
 from src.geometry import Geometry as G
 from src.geometry import Npos
 from src.move_eval import MoveEval
-from src.piece_type import PieceType
+from src.piece_type import PieceType, PIECE_TYPES
+
+
+# A packed Move is an int that holds a pseudolegal Move's attributes:
+#   bits  0-6:  fr_npos
+#   bits  7-13: to_npos
+#   bits 14-16: promotion PieceType.value + 1, or 0 for none
+#   bits 17-19: capture PieceType.value + 1, or 0 for none
+#   bit  20:    set for an e.p. capture (whose ep_target is to_npos)
+#   bits 21-23: the moving PieceType.value
+# Board.fill_moves_pseudolegal() writes packed Moves to a MoveBuffer, so
+# that move generation needn't create a Move object for each Move, nor a
+# generator for each Piece. A search can reuse one MoveBuffer per ply.
+PACKED_NPOS_MASK = 0x7F
+PACKED_PT_MASK = 0x7
+PACKED_TO_SHIFT = 7
+PACKED_PROMOTION_SHIFT = 14
+PACKED_CAPTURE_SHIFT = 17
+PACKED_EP_FLAG = 1 << 20
+PACKED_PT_SHIFT = 21
+PACKED_CAPTURE_MASK = PACKED_PT_MASK << PACKED_CAPTURE_SHIFT
+
+# Large enough for the pseudolegal Moves of any position that can arise
+MOVE_BUFFER_SIZE = 1024
+
+MoveBuffer = array
 
 
 # Moves are instantiated with only 3 arguments (fr_npos, to_npos, promo type).
@@ -100,6 +126,11 @@ class Move:
         suffix = '{1}{2}{3}'.format(promo, check_checkmate, move_eval)
         return move_text + suffix
 
+    # UCI format: <from><to><promotion>, e.g., e1c3 or f10f11q.
+    def to_uci(self):
+        promo = self.promotion_pt.to_symbol().lower() if self.promotion_pt else ''
+        return G.npos_to_alg(self.fr_npos) + G.npos_to_alg(self.to_npos) + promo
+
     def to_move_text(self):
         piece = '' if self.pt == PieceType.Pawn else str(self.pt)
         fr_alg = G.npos_to_pos(self.fr_npos)
@@ -107,3 +138,34 @@ class Move:
         to_alg = G.npos_to_pos(self.to_npos)
         move_text = '{1}{2}{3}{4}'.format(piece, fr_alg, capt, to_alg)
         return move_text
+
+    # ========================================
+    # Packed Moves (see above)
+
+    def to_packed(self) -> int:
+        return (self.fr_npos
+                | (self.to_npos << PACKED_TO_SHIFT)
+                | ((self.promotion_pt.value + 1 if self.promotion_pt else 0)
+                   << PACKED_PROMOTION_SHIFT)
+                | ((self.capture_pt.value + 1 if self.capture_pt else 0)
+                   << PACKED_CAPTURE_SHIFT)
+                | (PACKED_EP_FLAG if self.ep_target else 0)
+                | (self.pt.value << PACKED_PT_SHIFT))
+
+    @classmethod
+    def from_packed(cls, packed: int) -> 'Move':
+        to_npos = (packed >> PACKED_TO_SHIFT) & PACKED_NPOS_MASK
+        promotion_ind = (packed >> PACKED_PROMOTION_SHIFT) & PACKED_PT_MASK
+        move = Move(packed & PACKED_NPOS_MASK, to_npos,
+                    PIECE_TYPES[promotion_ind - 1] if promotion_ind else None)
+        move.pt = PIECE_TYPES[(packed >> PACKED_PT_SHIFT) & PACKED_PT_MASK]
+        capture_ind = (packed >> PACKED_CAPTURE_SHIFT) & PACKED_PT_MASK
+        if capture_ind:
+            move.capture_pt = PIECE_TYPES[capture_ind - 1]
+        if packed & PACKED_EP_FLAG:
+            move.ep_target = to_npos
+        return move
+
+    @classmethod
+    def new_buffer(cls, size: int=MOVE_BUFFER_SIZE) -> MoveBuffer:
+        return array('I', [0]) * size
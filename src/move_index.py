@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+from typing import Dict, Iterable, List, Tuple
+
+from src.geometry import Geometry as G
+from src.geometry import Npos
+from src.move import Move
+from src.move_spec import MoveSpec
+from src.piece_type import PieceType
+
+
+# A MoveIndex holds the legal moves of one Board position, generated once,
+# and indexed so that a move specification (e.g., from PGN movetext) can be
+# resolved by dictionary lookup instead of by scanning the Board:
+#   * moves_by_to_pt:  (to_npos, PieceType) -> moves of that PieceType to to_npos
+#   * moves_by_uci:    UCI text (e.g., e1c3, f10f11q) -> the unique move
+# The MoveIndex is a snapshot. It must be rebuilt after the Board changes.
+class MoveIndex:
+    def __init__(self, board):
+        self.board = board
+        self.moves: List[Move] = board.get_moves_legal()
+
+        self.moves_by_to_pt: Dict[Tuple[Npos, PieceType], List[Move]] = {}
+        self.moves_by_uci: Dict[str, Move] = {}
+        for move in self.moves:
+            key = (move.to_npos, move.pt)
+            if key in self.moves_by_to_pt:
+                self.moves_by_to_pt[key].append(move)
+            else:
+                self.moves_by_to_pt[key] = [move]
+            self.moves_by_uci[move.to_uci()] = move
+
+    def __len__(self):
+        return len(self.moves)
+
+    def get_move_by_uci(self, uci: str) -> Move:
+        return self.moves_by_uci.get(uci.lower())
+
+    # If a move is written without a PieceType or starting position
+    #   (e.g., b5), it is taken to be a Pawn move.
+    # Note: The "move_text" arg is not needed, but can be helpful for debugging.
+    def get_moves_matching(self, ms: MoveSpec, move_text=None) -> Iterable[Move]:  # pylint: disable=unused-argument
+        if ms.to_file and ms.to_rank:
+            to_npos = G.ALG_TO_NPOS[ms.to_file + str(ms.to_rank)]
+            if ms.fr_file and ms.fr_rank:
+                # Fully specified, so look up the move directly.
+                uci = (ms.fr_file + str(ms.fr_rank) + ms.to_file + str(ms.to_rank)
+                        + (ms.promotion_pt.to_symbol().lower() if ms.promotion_pt else ''))
+                move = self.moves_by_uci.get(uci)
+                if move is None or (ms.pt and move.pt != ms.pt):
+                    return []
+                return [move]
+
+            pt = ms.pt if ms.pt else PieceType.Pawn
+            moves = self.moves_by_to_pt.get((to_npos, pt), [])
+            if ms.is_capture:
+                moves = [move for move in moves if move.capture_pt]
+            if ms.fr_file:
+                moves = [move for move in moves
+                        if G.npos_to_file_char(move.fr_npos) == ms.fr_file]
+            if ms.fr_rank:
+                moves = [move for move in moves
+                        if G.npos_to_rank(move.fr_npos) == ms.fr_rank]
+            if ms.promotion_pt:
+                moves = [move for move in moves
+                        if move.promotion_pt == ms.promotion_pt]
+            return moves
+
+        if (ms.pt is None and ms.fr_file and ms.is_capture and ms.to_file
+                and (not ms.fr_rank and not ms.to_rank)):
+            # Terse Pawn capture, such as dxe
+            return [move for move in self.moves
+                    if move.pt == PieceType.Pawn and move.capture_pt
+                    and G.npos_to_file_char(move.fr_npos) == ms.fr_file
+                    and G.npos_to_file_char(move.to_npos) == ms.to_file
+                    and move.promotion_pt == ms.promotion_pt]
+        raise NotImplementedError('MoveIndex.get_moves_matching(). Move pattern not recognized')
+
+    def get_moves_to(self, to_npos: Npos) -> Iterable[Move]:
+        return [move for move in self.moves if move.to_npos == to_npos]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+from typing import List, Optional, Tuple
+
+from src.bitboard import BitBoard, BITBOARD_FILES, BITBOARD_SPACES
+from src.geometry import Geometry as G
+from src.geometry import Npos
+from src.piece import Piece
+from src.piece_type import PieceType
+from src.player import Player, PLAYERS
+
+
+# Evaluation of Pawn structure, in centipawns, with White's terms positive:
+#   * advancement: a bonus by the number of steps left to promotion
+#   * passed Pawns: a further bonus for a Pawn that no enemy Pawn can block
+#     or capture on its way to promotion
+#   * isolated Pawns: a penalty for a Pawn with no friendly Pawn on either
+#     adjacent file
+#   * doubled Pawns: a penalty for each Pawn beyond the first on a file
+# These depend only on where the Pawns are, so Evaluator caches them by
+# Board.pawn_zobrist_hash, and they can afford to be computed with bitboards
+# built from scratch.
+
+FILE_COUNT = len(BITBOARD_FILES)
+STEP_COUNT_MAX = FILE_COUNT - 1
+
+# Indexed by the number of steps left to promotion (Pawns start with 6).
+ADVANCE_BONUS = (0, 60, 35, 20, 10, 5) + (0,) * (STEP_COUNT_MAX - 5)
+PASSED_BONUS = (0, 120, 80, 50, 30, 20, 15) + (10,) * (STEP_COUNT_MAX - 6)
+ISOLATED_PENALTY = 15
+DOUBLED_PENALTY = 12
+
+# File index (into BITBOARD_FILES) of each space
+FILE_OF_NPOS: Tuple[int, ...] = tuple(G.COORD_HEX0[npos] + 5 for npos in range(G.SPACE_COUNT))
+
+# Indexed by file index: the union of the files on either side
+ADJACENT_FILES: Tuple[BitBoard, ...] = tuple(
+        (BITBOARD_FILES[f - 1] if f > 0 else BitBoard(G.SPACE_COUNT))
+        | (BITBOARD_FILES[f + 1] if f + 1 < FILE_COUNT else BitBoard(G.SPACE_COUNT))
+        for f in range(FILE_COUNT))
+
+
+def get_pawn_adv_table(player: Player) -> Tuple[Optional[Npos], ...]:
+    return G.LEAP_PAWN_ADV_BLACK if player == Player.Black else G.LEAP_PAWN_ADV_WHITE
+
+
+# The spaces a Pawn of the given Player would advance through, in order,
+# ending on its promotion space
+def get_spaces_ahead(player: Player, npos: Npos) -> List[Npos]:
+    adv = get_pawn_adv_table(player)
+    result = []
+    npos = adv[npos]
+    while npos is not None:
+        result.append(npos)
+        npos = adv[npos]
+    return result
+
+
+# The spaces on which an enemy Pawn keeps a Pawn from being passed:
+# those ahead of it on its file (where the enemy Pawn blocks it), and those
+# from which an enemy Pawn attacks the Pawn's path (including its own space),
+# or can advance to do so.
+def get_passed_mask(player: Player, npos: Npos) -> BitBoard:
+    enemy_attackers = (G.LEAP_PAWN_ATTACKERS_WHITE if player == Player.Black
+                       else G.LEAP_PAWN_ATTACKERS_BLACK)
+    ahead = get_spaces_ahead(player, npos)
+    mask = BitBoard(G.SPACE_COUNT)
+    for space in ahead:
+        mask |= BITBOARD_SPACES[space]
+    for space in [npos] + ahead:
+        for attacker in enemy_attackers[space]:
+            mask |= BITBOARD_SPACES[attacker]
+            for beyond in get_spaces_ahead(player, attacker):
+                mask |= BITBOARD_SPACES[beyond]
+    return mask
+
+
+# STEPS_TO_PROMO and PASSED_MASKS are indexed by Player.value, then by npos.
+STEPS_TO_PROMO: Tuple[Tuple[int, ...], ...] = tuple(
+        tuple(len(get_spaces_ahead(player, npos)) for npos in range(G.SPACE_COUNT))
+        for player in PLAYERS)
+
+PASSED_MASKS: Tuple[Tuple[BitBoard, ...], ...] = tuple(
+        tuple(get_passed_mask(player, npos) for npos in range(G.SPACE_COUNT))
+        for player in PLAYERS)
+
+
+class PawnStructure:
+    # Returns a bitboard of each Player's Pawns, indexed by Player.value.
+    @classmethod
+    def get_pawn_bitboards(cls, pieces: List[Optional[Piece]]) -> List[BitBoard]:
+        result = [BitBoard(G.SPACE_COUNT), BitBoard(G.SPACE_COUNT)]
+        for npos, piece in enumerate(pieces):
+            if piece is not None and piece.pt == PieceType.Pawn:
+                result[piece.player.value][npos] = 1
+        return result
+
+    @classmethod
+    def evaluate_player(cls, player: Player, own: BitBoard, enemy: BitBoard) -> int:
+        steps_to_promo = STEPS_TO_PROMO[player.value]
+        passed_masks = PASSED_MASKS[player.value]
+        score = 0
+        for npos in own.search(1):
+            steps = steps_to_promo[npos]
+            score += ADVANCE_BONUS[steps]
+            if not (enemy & passed_masks[npos]).any():
+                score += PASSED_BONUS[steps]
+            if not (own & ADJACENT_FILES[FILE_OF_NPOS[npos]]).any():
+                score -= ISOLATED_PENALTY
+        for bb_file in BITBOARD_FILES:
+            count = (own & bb_file).count()
+            if count > 1:
+                score -= DOUBLED_PENALTY * (count - 1)
+        return score
+
+    @classmethod
+    def evaluate(cls, pieces: List[Optional[Piece]]) -> int:
+        black, white = cls.get_pawn_bitboards(pieces)
+        return (cls.evaluate_player(Player.White, white, black)
+                - cls.evaluate_player(Player.Black, black, white))
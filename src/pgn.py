@@ -1,17 +1,16 @@
 #!/usr/bin/env python # by Jay M. Coskey, 2026
 
 from collections import OrderedDict
+from functools import lru_cache
 import itertools
 import re
 from typing import Dict, List, Tuple
 
 from src.board import Board
-from src.game import Game
 from src.geometry import Geometry as G
 from src.hex_pos import HexPos
 from src.move import Move
 from src.move_spec import MoveSpec
-from src.move_parse_phase import MoveParsePhase
 from src.piece_type import PieceType, PIECE_TYPES
 from src.player import Player, PLAYERS
 
@@ -20,6 +19,48 @@ GameTagPair = Tuple[str, str]
 GameTagPairSet = OrderedDict[str, str]
 GameSpec = Tuple[GameTagPairSet, List[str]]
 
+# TODO: Break up into one set for each Player
+FILE_PROMOTION_SPACES = frozenset("""a6 b7 c8 d9 e10 f11 g10 h9 i8 k7 l6
+                                     a1 b1 c1 d1 e1 f1 g1 h1 i1 k1 l1""".split())
+
+# Movetext, as in Qc3xBf9#!, with one group per MoveSpec field.
+# Fields that can appear in more than one location have a group per location.
+MOVE_TEXT_PATTERN = (
+        r'^(?P<pt>[{pts}])?'
+        r'(?P<fr_file>[abcdefghikl])?'
+        r'(?P<fr_rank>1[01]|[1-9])?'
+        r'(?:(?P<capture>x)(?P<capture_pt>[{pts}])?)?'
+        r'(?P<to_file>[abcdefghikl])?'
+        r'(?P<to_rank>1[01]|[1-9])?'
+        r'(?:(?P<capture_post>x)(?P<capture_pt_post>[{pts}])?)?'
+        r'(?P<en_passant>ep\.?|e\.p\.)?'
+        r'(?:(?P<promotion>=)(?P<promotion_pt>[{promo_pts}])|(?P<promotion_pt_bare>[{promo_pts}]))?'
+        r'(?P<checkness>[+#])?'
+        r'(?P<move_eval>[!?]+)?$')
+
+# Final scores found in movetext, as values of the PGN Result tag.
+MOVE_TEXT_TO_RESULT = {
+        '1-0': '1-0',
+        '0-1': '0-1',
+        'draw': '1/2-1/2',
+        'remi': '1/2-1/2',
+        'ź-ź': '1/2-1/2',
+        }
+
+# White's score, by Result tag value. See Game.get_scores_str().
+RESULT_TO_SCORE = {
+        '1-0': 1.0,
+        '0-1': 0.0,
+        '1/2-1/2': 0.5,
+        '3/4-1/4': 0.75,
+        '1/4-3/4': 0.25,
+        }
+
+RE_MOVE_TEXT = {
+        'en': re.compile(MOVE_TEXT_PATTERN.format(pts='KQRBNP', promo_pts='QRBN')),
+        'hu': re.compile(MOVE_TEXT_PATTERN.format(pts='KVBFHG', promo_pts='VBFH')),
+        }
+
 # Overview of parsing a PGN file:
 #   * Split the PGN file into a series of GameSpecs.
 #   * Each GameSpec has form (Game tag pairs, movetext lines).
@@ -98,199 +139,93 @@ class Pgn:
                 layout[player][pt] = []
         return layout
 
-    # Note: This method uses 2 techniques to handle multi-character tokens:
-    #   (1) To handle two-digit rank numbers (e.g., 10, 11), the first digit
-    #       is cached (into the variable "cached_digit") in one loop iteration,
-    #       and the completed rank value (whether 1 or 2 digits) is handled
-    #       on the next one.
-    #   (2) The various indicators of en-passant capture (ep, ep., e.p.)
-    #       are handled when the first letter is detected, using the loop
-    #       iteration flag "skip_chars".
+    # Movetext is parsed in one pass by a precompiled regular expression
+    # per language (RE_MOVE_TEXT). The groups follow the field order of
+    # MoveSpec (see move_spec.py). Some notes:
+    #   * Two-digit ranks (10, 11) are tried before one-digit ranks.
+    #   * A capture can name the captured PieceType either before the
+    #     destination (Qc3xBf9) or after it (f7g6xP).
+    #   * En passant can be written as ep, ep., or e.p.
+    #   * A promotion PieceType can appear without a preceding '=' (k7Q),
+    #     in which case it is only accepted on a promotion space.
     # Note: This method does not process comments or game-end information,
     #       such as score, or indications of how the game ended (agreement
     #       to a draw, or one player resigning).
+    # Note: Parsed MoveSpecs are cached (the same tokens recur constantly
+    #       across games), so callers should treat them as read-only.
     @classmethod
     def move_text_to_move_spec(cls, move_str, lang='en') -> MoveSpec:
-        move_spec = MoveSpec()
-
-        # TODO: Break up into one set for each Player
-        FILE_PROMOTION_SPACES = """a6 b7 c8 d9 e10 f11 g10 h9 i8 k7 l6
-                                   a1 b1 c1 d1 e1 f1 g1 h1 i1 k1 l1""".split()
-        PROMOTION_PIECES_EN = tuple('QRBN')
-        PROMOTION_PIECES_HU = tuple('VBFH')
-        PROMOTION_PIECES = (PROMOTION_PIECES_EN
-                if lang == 'en' else PROMOTION_PIECES_HU)
-
-        cached_digit = None
-        cur_phase = MoveParsePhase.START
-        skip_chars = 0
-        for k, c in enumerate(move_str):
-            if skip_chars > 0:
-                skip_chars -= 1
-                continue
+        return cls._move_text_to_move_spec_cached(move_str, lang)
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _move_text_to_move_spec_cached(move_str: str, lang: str) -> MoveSpec:
+        if lang not in RE_MOVE_TEXT:
+            raise NotImplementedError(f'Movetext parsing not supported for language {lang}')
+        match = RE_MOVE_TEXT[lang].match(move_str)
+        if not match:
+            raise ValueError(f'Movetext {move_str} has unrecognized syntax')
+        (pt, fr_file, fr_rank, capture, capture_pt, to_file, to_rank,
+                capture_post, capture_pt_post, en_passant,
+                promotion, promotion_pt, promotion_pt_bare,
+                checkness, move_eval) = match.groups()
 
-            if c.isdigit():
-                if cached_digit:
-                    assert cached_digit == '1'
-                    assert c in ['0', '1']  # Ranks don't exceed 11.
-                    rank = int(cached_digit + c)
-                    cached_digit = None
-                    if cur_phase.value < MoveParsePhase.FROM_RANK.value:
-                        move_spec.fr_rank = rank
-                        cur_phase = MoveParsePhase.FROM_RANK
-                        continue
-                    if cur_phase.value < MoveParsePhase.TO_RANK.value:
-                        move_spec.to_rank = rank
-                        cur_phase = MoveParsePhase.TO_RANK
-                        continue
-                    raise ValueError(f'Rank ({rank}) appears in invalid location')
-                if c == '1' and k < len(move_str) - 1:
-                    # This digit might be the first digit of a 2-digit rank number.
-                    # Prepare to handle it in the next iteration of this character loop.
-                    cached_digit = c
-                    continue
-                # Handle the single-row digit, without caching cache.
-                rank = int(c)
-                if cur_phase.value < MoveParsePhase.FROM_RANK.value:
-                    move_spec.fr_rank = rank
-                    cur_phase = MoveParsePhase.FROM_RANK
-                elif cur_phase.value < MoveParsePhase.TO_RANK.value:
-                    move_spec.to_rank = rank
-                    cur_phase = MoveParsePhase.TO_RANK
-                continue
-            # c is not a digit.
-            if cached_digit:
-                rank = int(cached_digit)
-                cached_digit = None
-                if cur_phase.value < MoveParsePhase.FROM_RANK.value:
-                    move_spec.fr_rank = rank
-                    cur_phase = MoveParsePhase.FROM_RANK
-                    # Proceed with this loop iteration, since we still need to handle c.
-                elif cur_phase.value < MoveParsePhase.TO_RANK.value:
-                    move_spec.to_rank = rank
-                    cur_phase = MoveParsePhase.TO_RANK
-                    # Proceed with this loop iteration, since we still need to handle c.
-                else:
-                    raise ValueError(f'Rank ({rank}) appears valid context')
-            if c.isupper():
-                # UPPER CASE => Represents a PieceType
-                if cur_phase == MoveParsePhase.START:
-                    move_spec.pt = PieceType.from_symbol(c, lang)
-                    cur_phase = MoveParsePhase.FROM_PIECE_TYPE
-                    continue
-                if cur_phase == MoveParsePhase.IS_CAPTURE:
-                    move_spec.capture_pt = PieceType.from_symbol(c, lang)
-                    cur_phase = MoveParsePhase.CAPTURE_PIECE_TYPE
-                    continue
-                if cur_phase == MoveParsePhase.IS_PROMOTION:
-                    move_spec.promotion_pt = PieceType.from_symbol(c, lang)
-                    cur_phase = MoveParsePhase.PROMOTION_TYPE
-                    continue
-                if c in PROMOTION_PIECES:
-                    # Might indicate a Pawn promotion without a preceding promotion indicator (=).
-                    if cur_phase == MoveParsePhase.FROM_RANK:
-                        fr_pos = move_spec.fr_file + str(move_spec.fr_rank)
-                        if fr_pos in FILE_PROMOTION_SPACES:
-                            move_spec.promotion_pt = PieceType.from_symbol(c, lang)
-                            cur_phase = MoveParsePhase.PROMOTION_TYPE
-                            continue
-                    if cur_phase == MoveParsePhase.TO_RANK:
-                        to_pos = move_spec.to_file + str(move_spec.to_rank)
-                        if to_pos in FILE_PROMOTION_SPACES:
-                            move_spec.promotion_pt = PieceType.from_symbol(c, lang)
-                            cur_phase = MoveParsePhase.PROMOTION_TYPE
-                            continue
-                    msg = f'Movetext {move_str}[{k}]=({c}) in invalid context.'
-                    raise ValueError(msg + ' Pawn promotion?')
-                msg = f'Movetext {move_str}[{k}]=({c}) in invalid context'
-                raise ValueError(msg)
-
-            if c.islower():
-                if c == 'x':
-                    # x => Represents capture
-                    assert not move_spec.is_capture  # We can't have multiple of these.
-                    move_spec.is_capture = True
-                    cur_phase = MoveParsePhase.IS_CAPTURE
-                    continue
-                # LOWER CASE => Represents a file or 'ep'
-                if c not in 'abcdefghikl':
-                    raise ValueError(f'In string {move_str}, found an invalid file character: {c}')
-                # Check to see if it is the start of an en passant representation
-                if c == 'e':
-                    if (k < len(move_str) - 1 and move_str[k + 1] == 'p'):
-                        # Found en passant
-                        move_spec.is_en_passant = True
-                        cur_phase = MoveParsePhase.IS_EN_PASSANT
-                        if k < len(move_str) - 2 and move_str[k + 2] == '.':
-                            skip_chars = 2
-                            move_spec.en_passant_str = 'ep.'
-                        else:
-                            skip_chars = 1
-                            move_spec.en_passant_str = 'ep'
-                        continue
-                    if (k < len(move_str) - 3  # At least 3 chars left in input
-                            and move_str[k + 1] == '.'
-                            and move_str[k + 1] == 'e'
-                            and move_str[k + 1] == '.'):
-                        # Found verbose en passant
-                        move_spec.is_en_passant = True
-                        cur_phase = MoveParsePhase.IS_EN_PASSANT
-                        move_spec.en_passant_str = 'e.p.'
-                        skip_chars = 3
-                        continue
-                # Not en passant
-                if cur_phase.value < MoveParsePhase.FROM_FILE.value:
-                    move_spec.fr_file = c
-                    cur_phase = MoveParsePhase.FROM_FILE
-                    continue
-                if cur_phase.value < MoveParsePhase.TO_FILE.value:
-                    move_spec.to_file = c
-                    cur_phase = MoveParsePhase.TO_FILE
-                    continue
-                raise ValueError(f'Invalid state: file symbols ({c}) comes after valid positions')
-            if c == '=':
-                assert not move_spec.is_promotion  # We can't have multiple of these.
-                move_spec.is_promotion = True
-                cur_phase = MoveParsePhase.IS_PROMOTION
-                continue
-            if c in ['+', '#']:
-                assert not move_spec.checkness_str  # We can't have multiple of these.
-                move_spec.checkness_str = c
-                cur_phase = MoveParsePhase.CHECKNESS
-                continue
-            if c in ['!', '?']:
-                if move_spec.move_eval_str:
-                    move_spec.move_eval_str += c
-                else:
-                    move_spec.move_eval_str = c
-                continue
-            raise ValueError(f'Character with unrecognized role in Move string: {c}')
-        assert not cached_digit
-
-        # Final conditional transformation
-        if (move_spec.fr_file and move_spec.fr_rank
-                and (not move_spec.to_file) and (not move_spec.to_rank)):
-            # The eager approach populated the "from" position with file and rank.
-            # But it's now apparent that these actually belong to the "to" position.
-            move_spec.to_file = move_spec.fr_file
-            move_spec.fr_file = None
-
-            move_spec.to_rank = move_spec.fr_rank
-            move_spec.fr_rank = None
+        move_spec = MoveSpec()
+        if pt:
+            move_spec.pt = PieceType.from_symbol(pt, lang)
+        if capture or capture_post:
+            move_spec.is_capture = True
+        if capture_pt or capture_pt_post:
+            move_spec.capture_pt = PieceType.from_symbol(
+                    capture_pt or capture_pt_post, lang)
+        if en_passant:
+            move_spec.is_en_passant = True
+            move_spec.en_passant_str = en_passant
+        if promotion:
+            move_spec.is_promotion = True
+            move_spec.promotion_pt = PieceType.from_symbol(promotion_pt, lang)
+        if checkness:
+            move_spec.checkness_str = checkness
+        if move_eval:
+            move_spec.move_eval_str = move_eval
+
+        if fr_file and fr_rank and not to_file and not to_rank:
+            # Only one position was given, so it is the "to" position.
+            to_file, to_rank = fr_file, fr_rank
+            fr_file, fr_rank = None, None
+        if fr_file:
+            move_spec.fr_file = fr_file
+        if fr_rank:
+            move_spec.fr_rank = int(fr_rank)
+        if to_file:
+            move_spec.to_file = to_file
+        if to_rank:
+            move_spec.to_rank = int(to_rank)
+
+        if promotion_pt_bare:
+            # Might indicate a Pawn promotion without a preceding promotion indicator (=).
+            # Before the final transformation above, the position could
+            # have been either the "from" or the "to" position.
+            pos_alg = (to_file or fr_file or '') + (to_rank or fr_rank or '')
+            if pos_alg not in FILE_PROMOTION_SPACES:
+                raise ValueError(f'Movetext {move_str}: Pawn promotion '
+                        + f'({promotion_pt_bare}) outside of promotion space')
+            move_spec.promotion_pt = PieceType.from_symbol(promotion_pt_bare, lang)
         return move_spec
 
     # TODO: Support passing line numbers, so error msgs can point to location in file.
     @classmethod
-    def game_spec_to_game(cls, game_spec: GameSpec, lang='en') -> Game:
+    def game_spec_to_game(cls, game_spec: GameSpec, lang='en') -> 'Game':
+        # Game (and with it, the Controllers) is imported only here, so that
+        # tools that only parse movetext don't load it.
+        from src.game import Game  # pylint: disable=import-outside-toplevel
         game = Game()
         game.set_attributes(game_spec[0])
-        game_id = game_spec[0]['GameID'] if 'GameID' in game_spec[0] else '???'
-        if game_id in '29 57 79 83 87 92'.split():
-            return None  # TODO: Proper handling of Check.
         move_texts = cls.move_lines_to_move_texts(game_spec[1])
         for move_text in move_texts:
             if move_text in ['', '0-1', '1-0', 'draw', 'remi', 'ź-ź', '...']:
-                # TODO: Insert info into Game
+                if move_text in MOVE_TEXT_TO_RESULT and 'Result' not in game.attrs:
+                    game.attrs['Result'] = MOVE_TEXT_TO_RESULT[move_text]
                 continue
             move_spec = cls.move_text_to_move_spec(move_text, lang)
             moves = game.board.get_moves_matching(move_spec, move_text)
@@ -1,20 +1,23 @@
 #!/usr/bin/env python
 # by Jay M. Coskey, 2026
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from src.piece_type import PieceType
-from src.player import Player
+from src.piece_type import PieceType, PIECE_TYPES, PIECE_TYPE_COUNT
+from src.player import Player, PLAYERS
 
 
-@dataclass
+# Pieces are immutable, so that Boards can share them (e.g., in Board.clone()).
+@dataclass(frozen=True)
 class Piece:
     player: Player
     pt: PieceType
+    code: int = field(init=False, repr=False, compare=False)  # See CODE_TO_PIECE
 
     def __post_init__(self):
         assert self.player
         assert self.pt
+        object.__setattr__(self, 'code', 1 + self.player.value * PIECE_TYPE_COUNT + self.pt.value)
 
     def __repr__(self):
         return self.__str__()
@@ -31,3 +34,16 @@ class Piece:
         pt = PieceType.from_symbol(c.upper())
         return (player, pt)
 
+
+# FEN symbols (e.g., K for White's King, k for Black's), in both directions,
+# for parsing and writing FEN without per-character PieceType lookups.
+PLAYER_PT_TO_FEN_SYMBOL = {
+        (player, pt): (pt.to_symbol().lower() if player == Player.Black else pt.to_symbol())
+        for player in PLAYERS for pt in PIECE_TYPES
+        }
+FEN_SYMBOL_TO_PLAYER_PT = {c: player_pt for player_pt, c in PLAYER_PT_TO_FEN_SYMBOL.items()}
+
+# Piece codes (as in src.dataset), for compact position encodings:
+#   0 for an empty space, else Piece.code = 1 + Player.value * 6 + PieceType.value.
+CODE_TO_PIECE = (None,) + tuple(sorted((Piece(player, pt) for player in PLAYERS for pt in PIECE_TYPES),
+                                       key=lambda piece: piece.code))
@@ -17,10 +17,10 @@ class Player(Enum):
             return "W"
 
     def opponent(self):
-        cls = self.__class__
-        vals = list(cls)
-        opp_ind = (vals.index(self) + 1) % 2
-        return vals[opp_ind]
+        if self == Player.Black:
+            return Player.White
+        else:
+            return Player.Black
 
 PLAYERS = [Player.Black, Player.White]
 
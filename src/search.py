@@ -0,0 +1,405 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+from dataclasses import dataclass
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from src.board import Board
+from src.controller import Controller
+from src.evaluation import Evaluator, PIECE_VALUES
+from src.move import Move, MoveBuffer, PACKED_CAPTURE_MASK
+from src.move_alternative import MoveAlternative
+from src.piece_type import PieceType
+
+
+# An alpha-beta (negamax) search, with iterative deepening, a transposition
+# table, and a quiescence search over captures.
+#
+# Moves are made with Board.move_make(do_partial_only=True), which skips the
+# end-of-Game checks (and so the opponent's move generation) done by a full
+# move_make(). Checkmate and stalemate are instead detected when a node has
+# no legal moves. Positions drawn by repetition or by the non-progress rules
+# are not detected within the search. No position is dead by material alone,
+# since stalemate can still be reached (see src.material).
+#
+# Scores are in centipawns, from the point of view of the Player to move.
+# In Glinski's chess, stalemating the opponent is worth 3/4 of a point, so
+# a stalemate is scored between a material advantage and a checkmate.
+# Mate and stalemate scores are reduced by the ply at which they occur,
+# so that quicker wins (and slower losses) are preferred.
+SCORE_INFINITE = 1_000_000
+SCORE_MATE = 100_000
+SCORE_STALEMATE = 50_000
+# Mate and stalemate scores lie within PLY_MAX of SCORE_MATE and SCORE_STALEMATE.
+PLY_MAX = 1000
+
+# How often (in nodes) the stop conditions are checked.
+STOP_CHECK_INTERVAL = 256
+
+# Transposition table entry flags
+TT_EXACT = 0
+TT_LOWER = 1  # The score is a lower bound (the search failed high).
+TT_UPPER = 2  # The score is an upper bound (the search failed low).
+
+DEFAULT_TT_MAX_SIZE = 1_000_000
+
+# (from npos, to npos, promotion PieceType or None)
+MoveKey = Tuple[int, int, Optional[PieceType]]
+
+
+def get_move_key(move: Move) -> MoveKey:
+    return (move.fr_npos, move.to_npos, move.promotion_pt)
+
+
+# Mate and stalemate scores count plies from the root, but a position can
+# be reached at different plies, so the transposition table stores them
+# counting plies from the position itself.
+def is_ply_adjusted_score(score: int) -> bool:
+    return (abs(score) > SCORE_MATE - PLY_MAX
+            or SCORE_STALEMATE - PLY_MAX < abs(score) <= SCORE_STALEMATE)
+
+
+def score_to_tt(score: int, ply: int) -> int:
+    if not is_ply_adjusted_score(score):
+        return score
+    return score + ply if score > 0 else score - ply
+
+
+def score_from_tt(score: int, ply: int) -> int:
+    if not is_ply_adjusted_score(score):
+        return score
+    return score - ply if score > 0 else score + ply
+
+
+# Any limit that is None is not applied. With no limits, a search
+# runs until it is stopped (as by "go infinite").
+@dataclass
+class SearchLimits:
+    depth: Optional[int] = None
+    movetime_ms: Optional[int] = None
+    nodes: Optional[int] = None
+
+
+# Reported after each iteration of iterative deepening. The counts are
+# totals for the search so far (see src.search_telemetry for per-iteration
+# figures):
+#   * nodes: all nodes, including qnodes (quiescence search nodes)
+#   * tt_probes, tt_hits: transposition table lookups, and those that
+#     found an entry (whether or not its score could be used)
+#   * cutoffs: beta cutoffs in the main search, and first_move_cutoffs,
+#     those caused by the first move searched (a measure of move ordering)
+@dataclass
+class SearchInfo:
+    depth: int
+    score: int
+    nodes: int
+    time_ms: int
+    pv: List[Move]
+    qnodes: int = 0
+    tt_probes: int = 0
+    tt_hits: int = 0
+    cutoffs: int = 0
+    first_move_cutoffs: int = 0
+
+    @property
+    def nps(self) -> int:
+        return self.nodes * 1000 // self.time_ms if self.time_ms else 0
+
+    @property
+    def qnode_share(self) -> float:
+        return self.qnodes / self.nodes if self.nodes else 0.0
+
+    @property
+    def tt_hit_rate(self) -> float:
+        return self.tt_hits / self.tt_probes if self.tt_probes else 0.0
+
+    @property
+    def first_move_cutoff_rate(self) -> float:
+        return self.first_move_cutoffs / self.cutoffs if self.cutoffs else 0.0
+
+    # The score in UCI form: "cp <centipawns>" or "mate <moves>",
+    # where a negative mate count means that the Player to move is mated.
+    def get_score_str(self) -> str:
+        if abs(self.score) > SCORE_MATE - PLY_MAX:
+            plies = SCORE_MATE - abs(self.score)
+            moves = (plies + 1) // 2
+            return f'mate {moves if self.score > 0 else -moves}'
+        return f'cp {self.score}'
+
+
+class SearchStopped(Exception):
+    pass
+
+
+class Search:
+    def __init__(self, evaluator: Evaluator=None, tt_max_size=DEFAULT_TT_MAX_SIZE):
+        self.evaluator = evaluator if evaluator is not None else Evaluator()
+        self.tt_max_size = tt_max_size
+        # (Zobrist hash, Player to move, e.p. target)
+        #   -> (depth, score, flag, best MoveKey or None)
+        self.tt: Dict[Tuple, Tuple] = {}
+        # Indexed by ply, for move generation (see get_move_buffer())
+        self.move_buffers: List[MoveBuffer] = []
+        self.stop_event = threading.Event()
+        self.board: Board = None
+        self.limits: SearchLimits = None
+        self.reset_counts()
+        self.time_start = 0.0
+
+    def clear(self) -> None:
+        self.tt.clear()
+
+    def reset_counts(self) -> None:
+        self.node_count = 0
+        self.qnode_count = 0
+        self.tt_probe_count = 0
+        self.tt_hit_count = 0
+        self.cutoff_count = 0
+        self.first_move_cutoff_count = 0
+
+    def stop(self) -> None:
+        self.stop_event.set()
+
+    def get_elapsed_ms(self) -> int:
+        return int((time.perf_counter() - self.time_start) * 1000)
+
+    def check_stop(self) -> None:
+        limits = self.limits
+        if (self.stop_event.is_set()
+                or (limits.nodes is not None and self.node_count >= limits.nodes)
+                or (limits.movetime_ms is not None
+                    and self.get_elapsed_ms() >= limits.movetime_ms)):
+            raise SearchStopped()
+
+    # ========================================
+    # SECTION: MOVES
+    # ========================================
+    def get_tt_key(self) -> Tuple:
+        board = self.board
+        return (board.get_zobrist_hash(), board.cur_player, board.ep_target)
+
+    def is_in_check(self) -> bool:
+        board = self.board
+        mover = board.cur_player
+        return board.is_npos_attacked(board.get_king_npos(mover), mover.opponent())
+
+    # Captures are ordered by Most Valuable Victim, then Least Valuable
+    # Attacker, and promotions by the value of the promotion PieceType.
+    # The best move from the transposition table, if any, comes first.
+    @classmethod
+    def get_move_order_key(cls, move: Move) -> int:
+        key = 0
+        if move.capture_pt:
+            key += 10 * PIECE_VALUES[move.capture_pt] - PIECE_VALUES[move.pt] // 100
+        if move.promotion_pt:
+            key += PIECE_VALUES[move.promotion_pt]
+        return key
+
+    def order_moves(self, moves: List[Move], best_move_key: Optional[MoveKey]) -> List[Move]:
+        moves.sort(key=self.get_move_order_key, reverse=True)
+        if best_move_key is not None:
+            for ind, move in enumerate(moves):
+                if get_move_key(move) == best_move_key:
+                    moves.insert(0, moves.pop(ind))
+                    break
+        return moves
+
+    # Each ply has its own MoveBuffer, so a buffer isn't overwritten while
+    # the Moves in it are being searched, nor reallocated at each node.
+    def get_move_buffer(self, ply: int) -> MoveBuffer:
+        while len(self.move_buffers) <= ply:
+            self.move_buffers.append(Move.new_buffer())
+        return self.move_buffers[ply]
+
+    # Pseudolegal captures (including capturing promotions) that don't
+    # leave the mover's King attacked.
+    # Moves are generated packed, so that only captures become Move objects.
+    def get_captures_legal(self, ply: int) -> List[Move]:
+        board = self.board
+        mover = board.cur_player
+        opponent = mover.opponent()
+        king_npos = board.get_king_npos(mover)
+        buf = self.get_move_buffer(ply)
+        result = []
+        for ind in range(board.fill_moves_pseudolegal(buf)):
+            packed = buf[ind]
+            if not packed & PACKED_CAPTURE_MASK:
+                continue
+            move = Move.from_packed(packed)
+            board.move_make(move, do_partial_only=True)
+            target_npos = move.to_npos if move.fr_npos == king_npos else king_npos
+            if not board.is_npos_attacked(target_npos, opponent):
+                result.append(move)
+            board.move_undo(do_partial_only=True)
+        return result
+
+    # ========================================
+    # SECTION: SEARCH
+    # ========================================
+    def quiesce(self, alpha: int, beta: int, ply: int) -> int:
+        self.node_count += 1
+        self.qnode_count += 1
+        if self.node_count % STOP_CHECK_INTERVAL == 0:
+            self.check_stop()
+        board = self.board
+        stand_pat = self.evaluator.evaluate(board)
+        if stand_pat >= beta:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+        for move in self.order_moves(self.get_captures_legal(ply), None):
+            board.move_make(move, do_partial_only=True)
+            try:
+                score = -self.quiesce(-beta, -alpha, ply + 1)
+            finally:
+                board.move_undo(do_partial_only=True)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def negamax(self, depth: int, alpha: int, beta: int, ply: int) -> int:
+        if depth <= 0:
+            return self.quiesce(alpha, beta, ply)
+        self.node_count += 1
+        if self.node_count % STOP_CHECK_INTERVAL == 0:
+            self.check_stop()
+        board = self.board
+
+        alpha_orig = alpha
+        tt_key = self.get_tt_key()
+        tt_entry = self.tt.get(tt_key)
+        self.tt_probe_count += 1
+        best_move_key = None
+        if tt_entry is not None:
+            self.tt_hit_count += 1
+            tt_depth, tt_score, tt_flag, best_move_key = tt_entry
+            tt_score = score_from_tt(tt_score, ply)
+            if tt_depth >= depth and ply > 0:
+                if (tt_flag == TT_EXACT
+                        or (tt_flag == TT_LOWER and tt_score >= beta)
+                        or (tt_flag == TT_UPPER and tt_score <= alpha)):
+                    return tt_score
+
+        moves = board.get_moves_legal()
+        if not moves:
+            if self.is_in_check():
+                return -(SCORE_MATE - ply)
+            return -(SCORE_STALEMATE - ply)
+
+        best_score = -SCORE_INFINITE
+        best_move = None
+        for move_ind, move in enumerate(self.order_moves(moves, best_move_key)):
+            board.move_make(move, do_partial_only=True)
+            try:
+                score = -self.negamax(depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                board.move_undo(do_partial_only=True)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                self.cutoff_count += 1
+                if move_ind == 0:
+                    self.first_move_cutoff_count += 1
+                break
+
+        if best_score <= alpha_orig:
+            flag = TT_UPPER
+        elif best_score >= beta:
+            flag = TT_LOWER
+        else:
+            flag = TT_EXACT
+        if len(self.tt) >= self.tt_max_size:
+            self.tt.clear()
+        self.tt[tt_key] = (depth, score_to_tt(best_score, ply), flag, get_move_key(best_move))
+        return best_score
+
+    # Follows best moves through the transposition table.
+    def get_pv(self, max_len: int) -> List[Move]:
+        board = self.board
+        pv = []
+        seen = set()
+        while len(pv) < max_len:
+            tt_key = self.get_tt_key()
+            tt_entry = self.tt.get(tt_key)
+            if tt_entry is None or tt_key in seen:
+                break
+            seen.add(tt_key)
+            move = next((move for move in board.get_moves_legal()
+                         if get_move_key(move) == tt_entry[3]), None)
+            if move is None:
+                break
+            board.move_make(move, do_partial_only=True)
+            pv.append(move)
+        for _ in pv:
+            board.move_undo(do_partial_only=True)
+        return pv
+
+    # Searches the position on board (which is modified during the search,
+    # but restored by the time this returns), reporting each completed
+    # iteration to on_info. Returns the best move found, or None if there
+    # are no legal moves.
+    # The search ends early if stop() is called, from any thread. The stop
+    # request is cleared by the caller (stop_event.clear()), not here, so
+    # that a stop() made just before run() begins isn't lost.
+    def run(self, board: Board, limits: SearchLimits,
+            on_info: Callable[[SearchInfo], None]=None) -> Optional[Move]:
+        self.board = board
+        self.limits = limits
+        self.reset_counts()
+        self.time_start = time.perf_counter()
+
+        moves = board.get_moves_legal()
+        if not moves:
+            return None
+        best_move = moves[0]
+        depth = 1
+        while limits.depth is None or depth <= limits.depth:
+            try:
+                score = self.negamax(depth, -SCORE_INFINITE, SCORE_INFINITE, 0)
+            except SearchStopped:
+                break
+            pv = self.get_pv(depth)
+            if pv:
+                best_move = pv[0]
+            if on_info is not None:
+                on_info(SearchInfo(depth, score, self.node_count, self.get_elapsed_ms(), pv,
+                        self.qnode_count, self.tt_probe_count, self.tt_hit_count,
+                        self.cutoff_count, self.first_move_cutoff_count))
+            if abs(score) >= SCORE_MATE - depth or len(moves) == 1:
+                break
+            depth += 1
+        return next(move for move in moves if get_move_key(move) == get_move_key(best_move))
+
+
+# A computer Player that searches each position to a fixed depth.
+# If $GLINSKI_SEARCH_TELEMETRY is set, each search's telemetry is appended
+# to that file, as JSON lines (see src.search_telemetry).
+class SearchPlayer(Controller):
+    depth = 2
+    search: Search = None
+
+    @classmethod
+    def choose_move(cls, board: Board) -> Union[Move, MoveAlternative]:
+        if cls.search is None:
+            cls.search = Search()
+        limits = SearchLimits(depth=cls.depth)
+        telemetry_path = os.getenv('GLINSKI_SEARCH_TELEMETRY')
+        if telemetry_path:
+            from src.search_telemetry import SearchTelemetry  # pylint: disable=import-outside-toplevel
+            with open(telemetry_path, 'a') as f:
+                move = SearchTelemetry(f).run(cls.search, board.clone(), limits)
+        else:
+            move = cls.search.run(board.clone(), limits)
+        return move if move is not None else MoveAlternative.Resign
+
+    @classmethod
+    def do_accept_offer_draw(cls, board: Board) -> bool:
+        return False
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional, TextIO
+
+from src.board import Board
+from src.move import Move
+from src.search import Search, SearchInfo, SearchLimits
+
+
+# Structured telemetry of searches, for tuning move ordering and pruning.
+# Each search is reported as JSON lines: one per iteration of iterative
+# deepening, with type "iteration", followed by one with type "search":
+#   depth, score, nodes, qnodes, time_ms, nps, pv (UCI moves)
+#   tt_probes, tt_hits, tt_hit_rate
+#   cutoffs, first_move_cutoffs, first_move_cutoff_rate
+#   qnode_share (the share of nodes that are quiescence nodes)
+#   branching_factor (the effective branching factor: this iteration's
+#     nodes over the previous iteration's, or null for the first iteration)
+# Counts in iteration lines are for that iteration alone; counts in search
+# lines are for the whole search, whose branching factor is that of its
+# last iteration. Search lines also give the fen and the bestmove.
+#
+# Iterations (and searches) can also be collected as Chrome trace events,
+# and written as a JSON file viewable with chrome://tracing (or Perfetto).
+#
+# SearchPlayer appends its telemetry to $GLINSKI_SEARCH_TELEMETRY, if set.
+
+# Chrome trace event timestamps are in microseconds.
+US_PER_SEC = 1_000_000
+
+
+class SearchTelemetry:
+    def __init__(self, out: Optional[TextIO]=None, do_trace=False):
+        self.out = out
+        self.trace_events: Optional[List[Dict]] = [] if do_trace else None
+        self.time_origin = time.perf_counter()
+        self.search_count = 0
+
+    def write_record(self, record: Dict) -> None:
+        if self.out is not None:
+            self.out.write(json.dumps(record) + '\n')
+            self.out.flush()
+
+    def add_trace_event(self, name: str, time_start: float, secs: float, args: Dict) -> None:
+        if self.trace_events is not None:
+            self.trace_events.append({
+                    'name': name, 'cat': 'search', 'ph': 'X', 'pid': os.getpid(), 'tid': 1,
+                    'ts': round((time_start - self.time_origin) * US_PER_SEC),
+                    'dur': round(secs * US_PER_SEC), 'args': args,
+                    })
+
+    # The counts of info that accrued since prev_info (or since the
+    # beginning of the search, if prev_info is None).
+    @classmethod
+    def get_record(cls, info: SearchInfo, prev_info: Optional[SearchInfo]) -> Dict:
+        def delta(name: str) -> int:
+            return getattr(info, name) - (getattr(prev_info, name) if prev_info else 0)
+        nodes = delta('nodes')
+        qnodes = delta('qnodes')
+        tt_probes = delta('tt_probes')
+        tt_hits = delta('tt_hits')
+        cutoffs = delta('cutoffs')
+        first_move_cutoffs = delta('first_move_cutoffs')
+        time_ms = delta('time_ms')
+        return {
+                'depth': info.depth,
+                'score': info.score,
+                'nodes': nodes,
+                'qnodes': qnodes,
+                'time_ms': time_ms,
+                'nps': nodes * 1000 // time_ms if time_ms else 0,
+                'tt_probes': tt_probes,
+                'tt_hits': tt_hits,
+                'tt_hit_rate': round(tt_hits / tt_probes, 4) if tt_probes else 0.0,
+                'cutoffs': cutoffs,
+                'first_move_cutoffs': first_move_cutoffs,
+                'first_move_cutoff_rate': (round(first_move_cutoffs / cutoffs, 4)
+                        if cutoffs else 0.0),
+                'qnode_share': round(qnodes / nodes, 4) if nodes else 0.0,
+                'pv': [move.to_uci() for move in info.pv],
+                }
+
+    # Runs search.run(), reporting its iterations, and then the search.
+    def run(self, search: Search, board: Board, limits: SearchLimits,
+            on_info=None) -> Optional[Move]:
+        self.search_count += 1
+        infos: List[SearchInfo] = []
+        records: List[Dict] = []
+        time_search_start = time.perf_counter()
+        time_iter_start = [time_search_start]
+        fen = board.get_fen()
+
+        def on_iteration(info: SearchInfo) -> None:
+            time_iter_end = time.perf_counter()
+            prev_info = infos[-1] if infos else None
+            record = self.get_record(info, prev_info)
+            prev_nodes = records[-1]['nodes'] if records else 0
+            record['branching_factor'] = (round(record['nodes'] / prev_nodes, 3)
+                    if prev_nodes else None)
+            infos.append(info)
+            records.append(record)
+            self.write_record({'type': 'iteration', 'search': self.search_count, **record})
+            self.add_trace_event(f'depth {info.depth}', time_iter_start[0],
+                    time_iter_end - time_iter_start[0], record)
+            time_iter_start[0] = time_iter_end
+            if on_info is not None:
+                on_info(info)
+
+        move = search.run(board, limits, on_iteration)
+        secs = time.perf_counter() - time_search_start
+        # Including any iteration that was stopped before it completed
+        last_info = infos[-1] if infos else SearchInfo(0, 0, 0, 0, [])
+        info = SearchInfo(last_info.depth, last_info.score, search.node_count,
+                search.get_elapsed_ms(), last_info.pv, search.qnode_count,
+                search.tt_probe_count, search.tt_hit_count,
+                search.cutoff_count, search.first_move_cutoff_count)
+        record = self.get_record(info, None)
+        record['branching_factor'] = records[-1]['branching_factor'] if records else None
+        record['fen'] = fen
+        record['bestmove'] = move.to_uci() if move else None
+        self.write_record({'type': 'search', 'search': self.search_count, **record})
+        self.add_trace_event(f'search {self.search_count}', time_search_start, secs,
+                {'fen': fen, 'bestmove': record['bestmove']})
+        return move
+
+    def write_trace(self, path: str) -> None:
+        with open(path, 'w') as f:
+            json.dump({'traceEvents': self.trace_events or [],
+                       'displayTimeUnit': 'ms'}, f)
+
+
+# Usage: python -m src.search_telemetry [--fen FEN] [--depth N] [--movetime MS]
+#            [--nodes N] [--trace trace.json]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Search a position, reporting search telemetry')
+    parser.add_argument('--fen', help='Position to search (default: the initial position)')
+    parser.add_argument('--depth', type=int)
+    parser.add_argument('--movetime', type=int, help='Search time, in milliseconds')
+    parser.add_argument('--nodes', type=int)
+    parser.add_argument('--trace', help='Path of a Chrome trace file to write')
+    args = parser.parse_args(argv)
+
+    if args.depth is None and args.movetime is None and args.nodes is None:
+        args.depth = 3
+    board = Board(args.fen) if args.fen else Board()
+    telemetry = SearchTelemetry(sys.stdout, do_trace=bool(args.trace))
+    telemetry.run(Search(), board, SearchLimits(args.depth, args.movetime, args.nodes))
+    if args.trace:
+        telemetry.write_trace(args.trace)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
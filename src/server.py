@@ -0,0 +1,345 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import argparse
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+import itertools
+import os
+import sys
+from typing import Dict, Optional, Set
+
+from src.board import Board
+from src.game import Game
+from src.game_state import GameState
+from src.match import CONTROLLER_NAMES, get_controller, init_worker
+from src.move import Move
+from src.move_alternative import MoveAlternative
+from src.move_index import MoveIndex
+from src.player import Player
+
+
+# A server hosting many concurrent Games in one process, over a local TCP
+# or Unix socket. Each side of a Game is played either by a client or by
+# a Controller (e.g., random, book; see src.match). Controllers choose
+# their moves in a process pool, so the event loop is never blocked by
+# engine thinking, and one slow engine doesn't delay other Games.
+#
+# The protocol is line-based text. Client requests:
+#   new <white> <black>   Start a Game. Each side is one of:
+#                           * human: played by this client
+#                           * open:  played by the first client to join it
+#                           * a Controller name (a key of CONTROLLER_NAMES)
+#   join <id> <side>      Play an open side (white or black) of a Game
+#   watch <id>            Receive a Game's moves without playing
+#   move <id> <uci>       Make a move, in UCI format (e.g., e1c3, f10f11q)
+#   moves <id>            List the legal moves
+#   fen <id>              Show the position
+#   resign <id>
+#   quit
+# Server responses:
+#   game <id> <side>...   (to new or join) the sides played by this client
+#   moves <id> <uci>...
+#   fen <id> <fen>
+#   error <message>
+# Server notifications, to each client playing or watching a Game:
+#   move <id> <uci> <game state>
+#   end <id> <game state> <scores>
+# A Game whose Controller fails (e.g., if its worker process dies) ends
+# as Abandoned.
+#
+# Moves are validated against a MoveIndex of the current position, built
+# once per position, so a client's move is a dictionary lookup.
+SIDE_HUMAN = 'human'
+SIDE_OPEN = 'open'
+SIDE_NAMES = {'white': Player.White, 'black': Player.Black}
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 7711
+
+
+# Called in a worker process. Boards are passed as Board.to_bytes(), and
+# choices are returned as UCI text, or as a MoveAlternative name.
+def engine_choose_move(controller_name: str, board_bytes: bytes) -> str:
+    board = Board.from_bytes(board_bytes)
+    choice = get_controller(controller_name).choose_move(board)
+    if isinstance(choice, Move):
+        return choice.to_uci()
+    return choice.name
+
+
+class GameSession:
+    def __init__(self, game_id: int, controller_names: Dict[Player, Optional[str]]):
+        self.game_id = game_id
+        self.game = Game(quiet=True)
+        self.game.board.set_game_state(GameState.InPlay)
+        # Player -> Controller name, or None if played by a client
+        self.controller_names = controller_names
+        # Player -> client (StreamWriter), if played by a client
+        self.clients: Dict[Player, asyncio.StreamWriter] = {}
+        self.watchers: Set[asyncio.StreamWriter] = set()
+        self.move_index: Optional[MoveIndex] = None
+        self.engine_task: Optional[asyncio.Task] = None
+
+    @property
+    def board(self) -> Board:
+        return self.game.board
+
+    def is_over(self) -> bool:
+        return self.board.game_state != GameState.InPlay
+
+    def get_move_index(self) -> MoveIndex:
+        if self.move_index is None:
+            self.move_index = MoveIndex(self.board)
+        return self.move_index
+
+    def get_open_players(self):
+        return [player for player in (Player.White, Player.Black)
+                if self.controller_names[player] is None and player not in self.clients]
+
+    def notify(self, line: str) -> None:
+        data = (line + '\n').encode()
+        for writer in self.watchers:
+            if not writer.is_closing():
+                writer.write(data)
+
+    def move_make(self, move: Move) -> None:
+        self.board.move_make(move)
+        self.move_index = None
+        self.notify(f'move {self.game_id} {move.to_uci()} {self.board.game_state.name}')
+        if self.is_over():
+            self.notify_end()
+
+    def set_game_state(self, game_state: GameState) -> None:
+        self.board.set_game_state(game_state)
+        self.notify_end()
+
+    def abandon(self) -> None:
+        self.set_game_state(GameState.Abandoned)
+
+    def notify_end(self) -> None:
+        self.notify(f'end {self.game_id} {self.board.game_state.name} {self.game.get_scores_str()}')
+
+    # Handles a MoveAlternative as Game.play() does, except that draw
+    # offers made by Controllers to clients are declined.
+    def alternative_make(self, choice: MoveAlternative) -> None:
+        if choice in (MoveAlternative.ClaimNonProgress50, MoveAlternative.ClaimRepetition3x):
+            self.set_game_state(GameState.Draw)
+        elif choice == MoveAlternative.Resign:
+            self.set_game_state(GameState.WinWhite if self.board.cur_player == Player.Black
+                    else GameState.WinBlack)
+
+
+class GameServer:
+    def __init__(self, executor: Executor=None, worker_count=None):
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=worker_count, initializer=init_worker)
+        self.executor = executor
+        self.sessions: Dict[int, GameSession] = {}
+        self.game_ids = itertools.count(1)
+
+    def close(self) -> None:
+        for session in self.sessions.values():
+            if session.engine_task:
+                session.engine_task.cancel()
+        self.executor.shutdown(cancel_futures=True)
+
+    # ========================================
+    # SECTION: ENGINE MOVES
+    # ========================================
+    def schedule_engine(self, session: GameSession) -> None:
+        if (not session.is_over()
+                and session.controller_names[session.board.cur_player] is not None
+                and (session.engine_task is None or session.engine_task.done())):
+            session.engine_task = asyncio.create_task(self.play_engine(session))
+
+    async def play_engine(self, session: GameSession) -> None:
+        loop = asyncio.get_running_loop()
+        while not session.is_over():
+            controller_name = session.controller_names[session.board.cur_player]
+            if controller_name is None:
+                return
+            halfmove_count = session.board.halfmove_count
+            try:
+                choice = await loop.run_in_executor(self.executor, engine_choose_move,
+                        controller_name, session.board.to_bytes())
+            except Exception:  # pylint: disable=broad-exception-caught
+                # E.g., BrokenProcessPool, or an error raised by the Controller
+                if not session.is_over():
+                    session.abandon()
+                return
+            if session.is_over() or session.board.halfmove_count != halfmove_count:
+                return
+            if choice in MoveAlternative.__members__:
+                session.alternative_make(MoveAlternative[choice])
+                continue
+            move = session.get_move_index().get_move_by_uci(choice)
+            if move is None:
+                session.abandon()
+                return
+            session.move_make(move)
+
+    # ========================================
+    # SECTION: REQUESTS
+    # ========================================
+    def get_session(self, game_id_str: str) -> GameSession:
+        try:
+            session = self.sessions.get(int(game_id_str))
+        except ValueError:
+            session = None
+        if session is None:
+            raise ValueError(f'Unknown game: {game_id_str}')
+        return session
+
+    def get_client_player(self, session: GameSession, writer) -> Player:
+        if session.is_over():
+            raise ValueError(f'Game {session.game_id} is over')
+        player = session.board.cur_player
+        if session.clients.get(player) is not writer:
+            raise ValueError(f'Not your move in game {session.game_id}')
+        return player
+
+    def request_new(self, writer, white: str, black: str) -> str:
+        controller_names = {}
+        for player, name in ((Player.White, white), (Player.Black, black)):
+            if name in (SIDE_HUMAN, SIDE_OPEN):
+                controller_names[player] = None
+            elif name in CONTROLLER_NAMES:
+                # Clients may only name Controllers, not arbitrary modules to import.
+                controller_names[player] = name
+            else:
+                raise ValueError(f'Unknown Controller: {name}')
+        session = GameSession(next(self.game_ids), controller_names)
+        self.sessions[session.game_id] = session
+        session.watchers.add(writer)
+        sides = []
+        for player, name in ((Player.White, white), (Player.Black, black)):
+            if name == SIDE_HUMAN:
+                session.clients[player] = writer
+                sides.append(player.name.lower())
+        self.schedule_engine(session)
+        return f'game {session.game_id} ' + ' '.join(sides)
+
+    def request_join(self, writer, game_id_str: str, side: str) -> str:
+        session = self.get_session(game_id_str)
+        player = SIDE_NAMES.get(side)
+        if player not in session.get_open_players():
+            raise ValueError(f'Side {side} is not open in game {session.game_id}')
+        session.clients[player] = writer
+        session.watchers.add(writer)
+        return f'game {session.game_id} {side}'
+
+    def request_move(self, writer, game_id_str: str, uci: str) -> None:
+        session = self.get_session(game_id_str)
+        self.get_client_player(session, writer)
+        move = session.get_move_index().get_move_by_uci(uci)
+        if move is None:
+            raise ValueError(f'Illegal move in game {session.game_id}: {uci}')
+        session.move_make(move)
+        self.schedule_engine(session)
+
+    def request_resign(self, writer, game_id_str: str) -> None:
+        session = self.get_session(game_id_str)
+        player = next((player for player, client in session.clients.items()
+                if client is writer), None)
+        if player is None or session.is_over():
+            raise ValueError(f'Cannot resign game {game_id_str}')
+        session.set_game_state(GameState.WinWhite if player == Player.Black
+                else GameState.WinBlack)
+
+    def handle_request(self, writer, words) -> Optional[str]:
+        cmd, args = words[0], words[1:]
+        if cmd == 'new' and len(args) == 2:
+            return self.request_new(writer, *args)
+        if cmd == 'join' and len(args) == 2:
+            return self.request_join(writer, *args)
+        if cmd == 'watch' and len(args) == 1:
+            self.get_session(args[0]).watchers.add(writer)
+            return None
+        if cmd == 'move' and len(args) == 2:
+            self.request_move(writer, *args)
+            return None
+        if cmd == 'moves' and len(args) == 1:
+            session = self.get_session(args[0])
+            return f'moves {session.game_id} ' + ' '.join(session.get_move_index().moves_by_uci)
+        if cmd == 'fen' and len(args) == 1:
+            session = self.get_session(args[0])
+            return f'fen {session.game_id} {session.board.get_fen()}'
+        if cmd == 'resign' and len(args) == 1:
+            self.request_resign(writer, *args)
+            return None
+        raise ValueError(f'Unrecognized request: {" ".join(words)}')
+
+    # A client's sides become open when it disconnects. Games with
+    # no remaining clients are discarded.
+    def drop_client(self, writer) -> None:
+        for game_id in list(self.sessions):
+            session = self.sessions[game_id]
+            session.watchers.discard(writer)
+            for player in [player for player, client in session.clients.items()
+                    if client is writer]:
+                del session.clients[player]
+            if not session.watchers:
+                if session.engine_task:
+                    session.engine_task.cancel()
+                del self.sessions[game_id]
+
+    async def handle_client(self, reader: asyncio.StreamReader,
+            writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                words = line.decode(errors='replace').split()
+                if not words:
+                    continue
+                if words[0] == 'quit':
+                    break
+                try:
+                    response = self.handle_request(writer, words)
+                except ValueError as e:
+                    response = f'error {e}'
+                if response is not None:
+                    writer.write((response + '\n').encode())
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.drop_client(writer)
+            writer.close()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT, unix_path: str=None):
+        if unix_path:
+            return await asyncio.start_unix_server(self.handle_client, path=unix_path)
+        return await asyncio.start_server(self.handle_client, host, port)
+
+
+async def serve(host: str, port: int, unix_path: str, worker_count: int) -> None:
+    server = GameServer(worker_count=worker_count)
+    try:
+        async with await server.start(host, port, unix_path) as socket_server:
+            where = unix_path if unix_path else f'{host}:{port}'
+            print(f'Serving Games on {where}')
+            await socket_server.serve_forever()
+    finally:
+        server.close()
+
+
+# Usage: python -m src.server [--host H] [--port P | --unix PATH] [--workers N]
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve Games to clients over a local socket')
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', help='Path of a Unix socket to serve on, instead of TCP')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='Number of engine worker processes')
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port, args.unix, args.workers))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import os
+import sys
+from typing import Iterable, List, Tuple
+import zipfile
+
+from src.board import Board
+from src.game_archive import GameArchive
+from src.move import Move
+from src.svg_template import SvgTemplate
+
+
+# Renders the positions of a Game as SVG frames, for a replay viewer,
+# slideshow, or animation. The SVG template is read and split once
+# (see SvgTemplate), and the Game is replayed once, so each frame costs
+# only the layout string for its position.
+#
+# Frame k shows the position after halfmove k (frame 0 is the initial
+# position), with the last move and any checked King highlighted.
+# Frame files are named as by Board.svg_write():
+#   <game_name>_<halfmove count><suffix>.svg
+#
+# Frames can be written as separate files (by a thread pool, since writing
+# is I/O-bound), or into a single zip file.
+DEFAULT_GAME_NAME = 'glinski'
+DEFAULT_WORKER_COUNT = 8
+
+# (file name, SVG content)
+Frame = Tuple[str, str]
+
+
+class SvgRenderer:
+    def __init__(self, template_path: str=None, game_name=DEFAULT_GAME_NAME, suffix=''):
+        self.template = SvgTemplate.get(template_path)
+        self.game_name = game_name
+        self.suffix = suffix
+
+    def get_frame_name(self, halfmove_count: int) -> str:
+        return f'{self.game_name}_{halfmove_count:03}{self.suffix}.svg'
+
+    def render_board(self, board: Board) -> str:
+        move = board.history_move[board.halfmove_count]
+        fr_npos = move.fr_npos if move else None
+        to_npos = move.to_npos if move else None
+        king_check_npos = None
+        king_checkmate_npos = None
+        if board.is_checkmate:
+            king_checkmate_npos = board.get_king_npos(board.cur_player)
+        elif board.is_check:
+            king_check_npos = board.get_king_npos(board.cur_player)
+        layout_str = board.svg_get_layout_dict_str(fr_npos, to_npos,
+                king_check_npos, king_checkmate_npos)
+        return self.template.render(layout_str)
+
+    # Replays moves from the initial position, rendering each position.
+    def get_frames(self, moves: Iterable[Move]) -> List[Frame]:
+        board = Board()
+        frames = [(self.get_frame_name(0), self.render_board(board))]
+        for move in moves:
+            board.move_make(move)
+            frames.append((self.get_frame_name(board.halfmove_count), self.render_board(board)))
+        return frames
+
+    def write_frames(self, frames: Iterable[Frame], out_dir: str,
+            worker_count=DEFAULT_WORKER_COUNT) -> int:
+        def write_frame(frame: Frame) -> None:
+            fname, svg_content = frame
+            with open(os.path.join(out_dir, fname), 'w') as f:
+                f.write(svg_content)
+
+        os.makedirs(out_dir, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            return sum(1 for _ in executor.map(write_frame, frames))
+
+    def write_zip(self, frames: Iterable[Frame], zip_path: str) -> int:
+        frame_count = 0
+        with zipfile.ZipFile(zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+            for fname, svg_content in frames:
+                zf.writestr(fname, svg_content)
+                frame_count += 1
+        return frame_count
+
+
+# Usage: python -m src.svg_render [--game K] [--zip PATH | --out-dir DIR] <input.pgn|input.glnk>
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render the positions of a Game as SVG frames')
+    parser.add_argument('--lang', default='en', help='Language of PGN piece symbols (en or hu)')
+    parser.add_argument('--game', type=int, default=0, help='Index of the Game in the input file')
+    parser.add_argument('--name', default=DEFAULT_GAME_NAME, help='Prefix of frame file names')
+    parser.add_argument('--jobs', type=int, default=DEFAULT_WORKER_COUNT,
+                        help='Number of threads writing frame files')
+    output_group = parser.add_mutually_exclusive_group(required=True)
+    output_group.add_argument('--out-dir', help='Directory to write frame files to')
+    output_group.add_argument('--zip', help='Zip file to write frames to')
+    parser.add_argument('input_path')
+    args = parser.parse_args(argv)
+
+    if args.input_path.endswith('.pgn'):
+        game = next(islice(GameArchive.pgn_to_games(args.input_path, args.lang), args.game, None))
+    else:
+        with open(args.input_path, 'rb') as f:
+            game = GameArchive.read_game(f, GameArchive.read_index(f)[args.game])
+    moves = game.board.history_move[1:]
+
+    renderer = SvgRenderer(game_name=args.name)
+    frames = renderer.get_frames(moves)
+    if args.zip:
+        frame_count = renderer.write_zip(frames, args.zip)
+        print(f'Wrote {frame_count} frames to {args.zip}')
+    else:
+        frame_count = renderer.write_frames(frames, args.out_dir, args.jobs)
+        print(f'Wrote {frame_count} frames to {args.out_dir}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
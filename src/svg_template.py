@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import os
+from typing import Dict
+
+
+# An SVG template file (by default, $GLINSKI_HOME/assets/glinski_game.svg)
+# draws a Board with JavaScript, from a LAYOUT variable that sits between
+# BEGIN_LAYOUT and END_LAYOUT marker lines. A template is read and split
+# around that block once per process; rendering a frame is then just
+#   head + layout string + tail.
+TEMPLATE_SVG_DIR = '/assets/'
+TEMPLATE_SVG_FNAME = 'glinski_game.svg'
+
+
+class SvgTemplate:
+    # Path -> SvgTemplate
+    cache: Dict[str, 'SvgTemplate'] = {}
+
+    def __init__(self, text: str):
+        lines = text.splitlines(keepends=True)
+        begin_ind = next((k for k, line in enumerate(lines) if 'BEGIN_LAYOUT' in line), None)
+        end_ind = next((k for k, line in enumerate(lines) if 'END_LAYOUT' in line), None)
+        if begin_ind is None or end_ind is None or end_ind <= begin_ind:
+            raise ValueError('SVG template has no BEGIN_LAYOUT ... END_LAYOUT block')
+        self.head = ''.join(lines[:begin_ind + 1])
+        self.tail = ''.join(lines[end_ind:])
+
+    @classmethod
+    def get_default_path(cls) -> str:
+        return os.getenv('GLINSKI_HOME') + TEMPLATE_SVG_DIR + TEMPLATE_SVG_FNAME
+
+    # Returns the template at path (by default, the standard one),
+    # reading it only the first time it's requested.
+    @classmethod
+    def get(cls, path: str=None) -> 'SvgTemplate':
+        if path is None:
+            path = cls.get_default_path()
+        template = cls.cache.get(path)
+        if template is None:
+            with open(path, 'r') as f:
+                template = SvgTemplate(f.read())
+            cls.cache[path] = template
+        return template
+
+    def render(self, layout_str: str) -> str:
+        return self.head + layout_str + self.tail
@@ -0,0 +1,567 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import argparse
+from array import array
+import os
+import struct
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+from src.geometry import Geometry as G
+from src.geometry import Npos
+from src.piece_type import PieceType
+from src.player import Player
+
+
+# An endgame tablebase holds the game-theoretic value of every position with
+# a given material signature (e.g., KQvK: White King & Queen vs Black King),
+# computed by retrograde analysis: starting from checkmates and stalemates,
+# results are propagated backwards, one ply at a time, through unmoves.
+#
+# Only pawnless signatures are supported. Without Pawns, the rules are
+#   * unchanged by the 12 symmetries of the board (rotations by multiples
+#     of 60 degrees, and reflections), so only one position per symmetry
+#     class is stored, with the White King in KING_DOMAIN, and
+#   * unchanged by swapping the Players' colors, so KvKQ with White to move
+#     is looked up as KQvK with Black to move (see get_canonical_signature).
+#
+# In Glinski's chess, stalemate isn't a draw: the stalemating Player scores
+# 3/4, and the stalemated Player 1/4. So each position's value is one of
+# five results for the Player to move, stored as a code (score = code / 4):
+#   * TB_LOSS (0):         is checkmated, or will be
+#   * TB_STALEMATED (1):   is stalemated, or will be
+#   * TB_DRAW (2):         neither Player can force a better result
+#   * TB_STALEMATING (3):  can force a stalemate, but not checkmate
+#   * TB_WIN (4):          can force checkmate
+# along with the number of plies until the game ends that way, assuming
+# that the winning side hurries and the losing side delays. Each result is
+# found by a separate pass, which solves the game "can the Player to move
+# force at least this code?" (Captures into smaller signatures use the depth
+# stored in that signature's tablebase.)
+#
+# File layout (all integers little-endian):
+#   * Header:   magic (4 bytes), version (uint16), signature (16 bytes, ASCII,
+#               zero-padded), entry count per Player to move (uint32)
+#   * Entries:  for Black to move, then for White to move (by Player.value),
+#               one uint16 per position index: code << 12 | depth
+#
+# Position index: with pieces ordered as in the signature (White's, then
+# Black's, each starting with the King), and their locations s0, s1, ...:
+#   KING_DOMAIN_INDEX[s0] * 91**(n-1) + s1 * 91**(n-2) + ... + s(n-1)
+# Entries for positions that are impossible, or that aren't the canonical
+# member of their symmetry class (see get_canonical_squares), hold TB_UNUSED.
+TB_LOSS = 0
+TB_STALEMATED = 1
+TB_DRAW = 2
+TB_STALEMATING = 3
+TB_WIN = 4
+TB_UNUSED = 7
+
+TB_CODE_NAMES = {
+        TB_LOSS: 'Loss',
+        TB_STALEMATED: 'Stalemated',
+        TB_DRAW: 'Draw',
+        TB_STALEMATING: 'Stalemating',
+        TB_WIN: 'Win',
+        TB_UNUSED: 'Unused',
+        }
+
+TB_MAGIC = b'GLTB'
+TB_VERSION = 1
+HEADER_STRUCT = struct.Struct('<4sH16sI')
+
+DEPTH_MASK = 0x0FFF
+CODE_SHIFT = 12
+
+KING = PieceType.King.value
+KNIGHT = PieceType.Knight.value
+
+# (code, depth)
+TbEntry = Tuple[int, int]
+
+
+# ========================================
+# SECTION: BOARD SYMMETRIES
+# ========================================
+
+# Each symmetry is a permutation of npos values, built from a rotation by
+# 60 degrees, (hex0, hex1) -> (hex0 - hex1, hex0), and the reflection across
+# the f-file, (hex0, hex1) -> (-hex0, hex1 - hex0). SYMMETRIES[0] is the identity.
+def get_symmetries() -> List[Tuple[Npos, ...]]:
+    def rotate(coords):
+        return (coords[0] - coords[1], coords[0])
+
+    def reflect(coords):
+        return (-coords[0], coords[1] - coords[0])
+
+    result = []
+    for do_reflect in [False, True]:
+        for rotation_count in range(6):
+            perm = []
+            for npos in range(G.SPACE_COUNT):
+                coords = (G.COORD_HEX0[npos], G.COORD_HEX1[npos])
+                if do_reflect:
+                    coords = reflect(coords)
+                for _ in range(rotation_count):
+                    coords = rotate(coords)
+                perm.append(G.COORDS_TO_NPOS[coords])
+            result.append(tuple(perm))
+    return result
+
+
+SYMMETRIES = get_symmetries()
+
+# The least npos in each symmetry class (12 in all).
+KING_DOMAIN = sorted({min(sym[npos] for sym in SYMMETRIES) for npos in range(G.SPACE_COUNT)})
+KING_DOMAIN_INDEX = {npos: ind for ind, npos in enumerate(KING_DOMAIN)}
+
+# The symmetries that map each npos into KING_DOMAIN.
+NPOS_TO_SYMMETRIES = [[sym for sym in SYMMETRIES if sym[npos] in KING_DOMAIN_INDEX]
+                      for npos in range(G.SPACE_COUNT)]
+
+
+# ========================================
+# SECTION: PIECE MOVEMENT
+# ========================================
+# Pieces are identified by PieceType.value, for speed.
+
+LEAPS = {
+        KING: G.LEAPS_KING,
+        KNIGHT: G.LEAPS_KNIGHT,
+        }
+LEAP_SETS = {pt_val: [frozenset(leaps) for leaps in leaps_list]
+             for pt_val, leaps_list in LEAPS.items()}
+
+RAYS = {
+        pt.value: G.RAYS_BY_PT[pt.value]
+        for pt in [PieceType.Queen, PieceType.Rook, PieceType.Bishop]
+        }
+
+
+# LINES[pt_val][fr_npos][to_npos] holds the spaces strictly between,
+# for each pair of spaces connected by a ray of that slider.
+def get_lines(pt_val: int) -> List[Dict[Npos, Tuple[Npos, ...]]]:
+    result = []
+    for npos in range(G.SPACE_COUNT):
+        lines = {}
+        for ray in RAYS[pt_val][npos]:
+            for k, to_npos in enumerate(ray):
+                lines[to_npos] = ray[:k]
+        result.append(lines)
+    return result
+
+
+LINES = {pt_val: get_lines(pt_val) for pt_val in RAYS}
+
+
+# Yields the destinations of a piece, including occupied spaces
+# (whose pieces might be captured).
+def get_destinations(pt_val: int, npos: Npos, occupied) -> List[Npos]:
+    if pt_val in LEAPS:
+        return LEAPS[pt_val][npos]
+    result = []
+    for ray in RAYS[pt_val][npos]:
+        for to_npos in ray:
+            result.append(to_npos)
+            if to_npos in occupied:
+                break
+    return result
+
+
+def is_attacked(npos: Npos, attacker_pt_vals: Sequence[int],
+        attacker_squares: Sequence[Npos], occupied) -> bool:
+    for pt_val, attacker_npos in zip(attacker_pt_vals, attacker_squares):
+        if pt_val in LEAP_SETS:
+            if npos in LEAP_SETS[pt_val][attacker_npos]:
+                return True
+        else:
+            between = LINES[pt_val][attacker_npos].get(npos)
+            if between is not None and not any(b in occupied for b in between):
+                return True
+    return False
+
+
+# ========================================
+# SECTION: SIGNATURES
+# ========================================
+
+# Returns the PieceTypes of White and Black in a signature such as KQvK.
+def parse_signature(signature: str) -> Tuple[List[PieceType], List[PieceType]]:
+    sides = signature.split('v')
+    if len(sides) != 2:
+        raise ValueError(f'Invalid tablebase signature: {signature}')
+    result = []
+    for side in sides:
+        try:
+            pts = [PieceType.from_symbol(c) for c in side.upper()]
+        except Exception as e:
+            raise ValueError(f'Invalid tablebase signature: {signature}') from e
+        if PieceType.Pawn in pts:
+            raise ValueError(f'Tablebase signatures cannot include Pawns: {signature}')
+        if pts.count(PieceType.King) != 1:
+            raise ValueError(f'Tablebase signature sides need one King each: {signature}')
+        result.append(sorted(pts, key=lambda pt: pt.value))
+    return result[0], result[1]
+
+
+def get_side_str(pts: Sequence[PieceType]) -> str:
+    return ''.join(pt.to_symbol() for pt in sorted(pts, key=lambda pt: pt.value))
+
+
+# Orders sides by piece count, and then by the strength of their pieces.
+def get_side_key(pts: Sequence[PieceType]):
+    return (len(pts), sorted((-pt.value for pt in pts), reverse=True))
+
+
+# Returns (signature, is_flipped), where is_flipped is True if the
+# signature's sides have been swapped to put the stronger side first.
+def get_canonical_signature(white_pts: Sequence[PieceType],
+        black_pts: Sequence[PieceType]) -> Tuple[str, bool]:
+    is_flipped = get_side_key(black_pts) > get_side_key(white_pts)
+    if is_flipped:
+        white_pts, black_pts = black_pts, white_pts
+    return get_side_str(white_pts) + 'v' + get_side_str(black_pts), is_flipped
+
+
+# ========================================
+# SECTION: POSITION INDEX
+# ========================================
+
+# Returns the canonical member of the symmetry class of these piece
+# locations (in signature order), given the runs of identical pieces
+# (see Tablebase.runs).
+def get_canonical_squares(squares: Sequence[Npos], runs) -> Tuple[Npos, ...]:
+    candidates = []
+    for sym in NPOS_TO_SYMMETRIES[squares[0]]:
+        mapped = [sym[npos] for npos in squares]
+        for start, end in runs:
+            mapped[start:end] = sorted(mapped[start:end])
+        candidates.append(tuple(mapped))
+    return min(candidates) if len(candidates) > 1 else candidates[0]
+
+
+# Expects canonical squares.
+def get_index(squares: Sequence[Npos]) -> int:
+    ind = KING_DOMAIN_INDEX[squares[0]]
+    for npos in squares[1:]:
+        ind = ind * G.SPACE_COUNT + npos
+    return ind
+
+
+# ========================================
+# SECTION: TABLEBASE
+# ========================================
+
+class Tablebase:
+    def __init__(self, signature: str, entries: List[array]=None):
+        white_pts, black_pts = parse_signature(signature)
+        self.signature = get_side_str(white_pts) + 'v' + get_side_str(black_pts)
+        self.white_pts = white_pts
+        self.black_pts = black_pts
+        self.pt_vals = tuple(pt.value for pt in white_pts + black_pts)
+        self.piece_count = len(self.pt_vals)
+        self.white_count = len(white_pts)
+        self.entry_count = len(KING_DOMAIN) * G.SPACE_COUNT ** (self.piece_count - 1)
+        # Runs of identical pieces of the same Player (start, end), whose
+        # locations are sorted in canonical positions, since swapping them
+        # changes nothing.
+        self.runs = (list(self.get_runs(self.pt_vals[:self.white_count]))
+                     + [(start + self.white_count, end + self.white_count)
+                        for start, end in self.get_runs(self.pt_vals[self.white_count:])])
+        if entries is None:
+            entries = [array('H', [TB_UNUSED << CODE_SHIFT]) * self.entry_count
+                       for _ in range(2)]
+        self.entries = entries
+
+    @classmethod
+    def get_runs(cls, pt_vals: Sequence[int]):
+        start = 0
+        for ind in range(1, len(pt_vals) + 1):
+            if ind == len(pt_vals) or pt_vals[ind] != pt_vals[start]:
+                if ind - start > 1:
+                    yield (start, ind)
+                start = ind
+
+    def get_canonical_squares(self, squares: Sequence[Npos]) -> Tuple[Npos, ...]:
+        return get_canonical_squares(squares, self.runs)
+
+    def get_index(self, squares: Sequence[Npos]) -> int:
+        return get_index(squares)
+
+    def get_squares(self, ind: int) -> List[Npos]:
+        squares = [0] * self.piece_count
+        for k in range(self.piece_count - 1, 0, -1):
+            ind, squares[k] = divmod(ind, G.SPACE_COUNT)
+        squares[0] = KING_DOMAIN[ind]
+        return squares
+
+    def get_entry(self, player: Player, ind: int) -> TbEntry:
+        entry = self.entries[player.value][ind]
+        return (entry >> CODE_SHIFT, entry & DEPTH_MASK)
+
+    # Returns (code, depth) for the Player to move, for piece locations
+    # in signature order.
+    def probe_squares(self, player: Player, squares: Sequence[Npos]) -> TbEntry:
+        return self.get_entry(player, self.get_index(self.get_canonical_squares(squares)))
+
+    def get_code_counts(self, player: Player) -> Dict[str, int]:
+        counts = {name: 0 for name in TB_CODE_NAMES.values()}
+        for entry in self.entries[player.value]:
+            counts[TB_CODE_NAMES[entry >> CODE_SHIFT]] += 1
+        return counts
+
+    # ========================================
+
+    def write_path(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(HEADER_STRUCT.pack(TB_MAGIC, TB_VERSION,
+                    self.signature.encode('ascii'), self.entry_count))
+            for player_entries in self.entries:
+                if sys.byteorder == 'big':
+                    player_entries = array('H', player_entries)
+                    player_entries.byteswap()
+                f.write(player_entries.tobytes())
+
+    @classmethod
+    def read_path(cls, path: str) -> 'Tablebase':
+        with open(path, 'rb') as f:
+            magic, version, signature_bytes, entry_count = HEADER_STRUCT.unpack(
+                    f.read(HEADER_STRUCT.size))
+            if magic != TB_MAGIC:
+                raise ValueError(f'Not a tablebase (magic={magic})')
+            if version != TB_VERSION:
+                raise ValueError(f'Unsupported tablebase version: {version}')
+            tb = Tablebase(signature_bytes.rstrip(b'\0').decode('ascii'))
+            if entry_count != tb.entry_count:
+                raise ValueError(f'Tablebase {tb.signature} has {entry_count} entries; '
+                        + f'expected {tb.entry_count}')
+            for player_entries in tb.entries:
+                player_entries[:] = array('H', f.read(2 * entry_count))
+                if sys.byteorder == 'big':
+                    player_entries.byteswap()
+        return tb
+
+
+# ========================================
+# SECTION: GENERATION
+# ========================================
+
+# Generates tablebases, along with those for the signatures
+# reachable from them by captures.
+class TablebaseGenerator:
+    def __init__(self, tb_dir: str=None, is_verbose=False):
+        self.tb_dir = tb_dir
+        self.is_verbose = is_verbose
+        self.tablebases: Dict[str, Tablebase] = {}
+
+    def get_tablebase(self, signature: str) -> Tablebase:
+        if signature not in self.tablebases:
+            path = self.get_path(signature)
+            if path and os.path.exists(path):
+                self.tablebases[signature] = Tablebase.read_path(path)
+            else:
+                self.tablebases[signature] = self.generate(signature)
+                if path:
+                    self.tablebases[signature].write_path(path)
+        return self.tablebases[signature]
+
+    def get_path(self, signature: str):
+        return os.path.join(self.tb_dir, f'{signature}.gltb') if self.tb_dir else None
+
+    # Returns (code, depth) for the Player to move after a capture.
+    def probe_capture(self, pt_vals: Sequence[int], squares: Sequence[Npos],
+            white_count: int, player: Player) -> TbEntry:
+        white = sorted(zip(pt_vals[:white_count], squares[:white_count]))
+        black = sorted(zip(pt_vals[white_count:], squares[white_count:]))
+        signature, is_flipped = get_canonical_signature(
+                [PieceType(pt_val) for pt_val, _ in white],
+                [PieceType(pt_val) for pt_val, _ in black])
+        if is_flipped:
+            white, black = black, white
+            player = player.opponent()
+        tb = self.get_tablebase(signature)
+        return tb.probe_squares(player, [npos for _, npos in white + black])
+
+    def generate(self, signature: str) -> Tablebase:
+        tb = Tablebase(signature)
+        if self.is_verbose:
+            print(f'Generating {tb.signature} ({2 * tb.entry_count} entries)')
+        # Player to move: (piece indices, opponent piece indices)
+        sides = {
+                Player.White: (range(tb.white_count), range(tb.white_count, tb.piece_count)),
+                Player.Black: (range(tb.white_count, tb.piece_count), range(tb.white_count)),
+                }
+        # Per Player to move: whether each entry is in use; the number of
+        # distinct successors of each position; and, for positions with
+        # capturing or terminal results, the results of those captures.
+        is_used = {player: bytearray(tb.entry_count) for player in sides}
+        succ_counts = {player: array('H', [0]) * tb.entry_count for player in sides}
+        terminals: Dict[Tuple[Player, int], int] = {}
+        captures: Dict[Tuple[Player, int], List[TbEntry]] = {}
+
+        pt_vals = tb.pt_vals
+        for player, (mover_inds, opp_inds) in sides.items():
+            mover_pt_vals = [pt_vals[i] for i in mover_inds]
+            opp_pt_vals = [pt_vals[i] for i in opp_inds]
+            mover_king_ind = mover_inds[0]
+            opp_king_ind = opp_inds[0]
+            for ind in range(tb.entry_count):
+                squares = tb.get_squares(ind)
+                occupied = set(squares)
+                if len(occupied) < tb.piece_count:
+                    continue
+                if tuple(squares) != tb.get_canonical_squares(squares):
+                    continue
+                # The Player not to move can't be in check.
+                if is_attacked(squares[opp_king_ind], mover_pt_vals,
+                        [squares[i] for i in mover_inds], occupied):
+                    continue
+                is_used[player][ind] = 1
+
+                successors = set()
+                capture_entries = []
+                for i in mover_inds:
+                    fr_npos = squares[i]
+                    for to_npos in get_destinations(pt_vals[i], fr_npos, occupied):
+                        captured_ind = None
+                        if to_npos in occupied:
+                            captured_ind = squares.index(to_npos)
+                            if captured_ind in mover_inds:
+                                continue
+                        next_squares = squares.copy()
+                        next_squares[i] = to_npos
+                        next_occupied = occupied - {fr_npos}
+                        next_occupied.add(to_npos)
+                        opp_attackers = [k for k in opp_inds if k != captured_ind]
+                        if is_attacked(next_squares[mover_king_ind],
+                                [pt_vals[k] for k in opp_attackers],
+                                [next_squares[k] for k in opp_attackers], next_occupied):
+                            continue
+                        if captured_ind is None:
+                            successors.add(tb.get_index(tb.get_canonical_squares(next_squares)))
+                        else:
+                            keep = [k for k in range(tb.piece_count) if k != captured_ind]
+                            white_count = tb.white_count - (1 if captured_ind < tb.white_count else 0)
+                            capture_entries.append(self.probe_capture(
+                                    [pt_vals[k] for k in keep], [next_squares[k] for k in keep],
+                                    white_count, player.opponent()))
+                succ_counts[player][ind] = len(successors)
+                if capture_entries:
+                    captures[(player, ind)] = capture_entries
+                elif not successors:
+                    is_check = is_attacked(squares[mover_king_ind], opp_pt_vals,
+                            [squares[i] for i in opp_inds], occupied)
+                    terminals[(player, ind)] = TB_LOSS if is_check else TB_STALEMATED
+
+        # Solve "can the Player to move force at least this code?"
+        # for TB_WIN and TB_STALEMATING.
+        solutions = {target: self.solve(tb, sides, is_used, succ_counts,
+                                        terminals, captures, target)
+                     for target in [TB_WIN, TB_STALEMATING]}
+        for player in sides:
+            wins, losses = solutions[TB_WIN]
+            wins_sm, losses_sm = solutions[TB_STALEMATING]
+            player_entries = tb.entries[player.value]
+            for ind in range(tb.entry_count):
+                if not is_used[player][ind]:
+                    continue
+                key = (player, ind)
+                if key in wins:
+                    code, depth = TB_WIN, wins[key]
+                elif key in wins_sm:
+                    code, depth = TB_STALEMATING, wins_sm[key]
+                elif key in losses:
+                    code, depth = TB_LOSS, losses[key]
+                elif key in losses_sm:
+                    code, depth = TB_STALEMATED, losses_sm[key]
+                else:
+                    code, depth = TB_DRAW, 0
+                player_entries[ind] = (code << CODE_SHIFT) | min(depth, DEPTH_MASK)
+        return tb
+
+    # Retrograde analysis of the game in which the Player to move "wins"
+    # by scoring at least the target code. Positions are resolved in order
+    # of depth (in plies), so each gets the depth of the fastest win,
+    # or of the slowest loss. Returns (wins, losses): {(Player, ind): depth}.
+    def solve(self, tb: Tablebase, sides, is_used, succ_counts,
+            terminals, captures, target: int):
+        wins: Dict[Tuple[Player, int], int] = {}
+        losses: Dict[Tuple[Player, int], int] = {}
+        remaining = {player: array('H', counts) for player, counts in succ_counts.items()}
+        # Depth -> list of (is_win, Player, ind), for positions found to be
+        # wins, or to have a move to a position won by the opponent.
+        buckets: Dict[int, List] = {}
+        for (player, ind), code in terminals.items():
+            if 4 - code >= target:
+                buckets.setdefault(0, []).append((False, player, ind))
+        for (player, ind), capture_entries in captures.items():
+            remaining[player][ind] += len(capture_entries)
+            for code, depth in capture_entries:
+                if 4 - code >= target:
+                    buckets.setdefault(depth + 1, []).append((True, player, ind))
+                elif code >= target:
+                    buckets.setdefault(depth + 1, []).append((False, player, ind))
+
+        pt_vals = tb.pt_vals
+        depth = 0
+        while buckets:
+            if depth not in buckets:
+                depth += 1
+                continue
+            for is_win, player, ind in buckets.pop(depth):
+                key = (player, ind)
+                if key in wins or key in losses:
+                    continue
+                if is_win:
+                    wins[key] = depth
+                else:
+                    if key not in terminals:
+                        remaining[player][ind] -= 1
+                        if remaining[player][ind]:
+                            continue
+                    losses[key] = depth
+                # The position is resolved. Find its predecessors, by unmoving
+                # the pieces of the opponent (who moved last).
+                prev_player = player.opponent()
+                squares = tb.get_squares(ind)
+                occupied = set(squares)
+                preds = set()
+                for i in sides[prev_player][0]:
+                    to_npos = squares[i]
+                    for fr_npos in get_destinations(pt_vals[i], to_npos, occupied):
+                        if fr_npos in occupied:
+                            continue
+                        prev_squares = squares.copy()
+                        prev_squares[i] = fr_npos
+                        prev_ind = tb.get_index(tb.get_canonical_squares(prev_squares))
+                        if is_used[prev_player][prev_ind]:
+                            preds.add(prev_ind)
+                bucket = buckets.setdefault(depth + 1, [])
+                for prev_ind in preds:
+                    bucket.append((not is_win, prev_player, prev_ind))
+            depth += 1
+        return wins, losses
+
+
+# Usage: python -m src.tablebase [--dir <tb_dir>] <signature> ...
+#   e.g.,  python -m src.tablebase --dir data/tb KQvK KRvK
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Generate pawnless endgame tablebases')
+    parser.add_argument('--dir', default='.', help='Directory of tablebase (.gltb) files')
+    parser.add_argument('signatures', nargs='+')
+    args = parser.parse_args(argv)
+    os.makedirs(args.dir, exist_ok=True)
+    generator = TablebaseGenerator(args.dir, is_verbose=True)
+    for signature in args.signatures:
+        white_pts, black_pts = parse_signature(signature)
+        signature, _ = get_canonical_signature(white_pts, black_pts)
+        tb = generator.get_tablebase(signature)
+        for player in [Player.White, Player.Black]:
+            counts = ', '.join(f'{name}={count}' for name, count
+                               in tb.get_code_counts(player).items() if count)
+            print(f'{tb.signature}, {player.name} to move: {counts}')
+
+
+if __name__ == '__main__':
+    sys.exit(main())
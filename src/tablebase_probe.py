@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+from array import array
+from collections import OrderedDict
+import mmap
+import os
+import sys
+from typing import Dict, Optional, Tuple
+
+from src.board import Board
+from src.piece_type import PieceType, PIECE_TYPE_COUNT
+from src.player import Player
+from src.tablebase import CODE_SHIFT, DEPTH_MASK, HEADER_STRUCT, TB_MAGIC, TB_VERSION
+from src.tablebase import Tablebase, TbEntry
+from src.tablebase import get_canonical_signature, get_canonical_squares, get_index
+
+
+# Probes tablebase files (see src.tablebase) without reading them into memory.
+# Each file is memory-mapped the first time its signature is probed, and
+# entries are read a page at a time into a small LRU cache of decoded pages,
+# so probing at each node of a search costs a dict lookup or two once the
+# pages for the current endgame are hot.
+#
+# A position is probed by its Board.pieces, so no Board methods are needed.
+# Positions with Pawns, with more than max_piece_count pieces, or whose
+# signature has no file in tb_dir, have no result (None).
+DEFAULT_MAX_PIECE_COUNT = 5
+DEFAULT_PAGE_ENTRY_COUNT = 2048  # 4 KiB per page
+DEFAULT_CACHE_PAGE_COUNT = 256
+
+KING = PieceType.King.value
+PAWN = PieceType.Pawn.value
+
+
+class TablebaseFile:
+    def __init__(self, path: str):
+        self.path = path
+        self.f = open(path, 'rb')
+        self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, signature_bytes, self.entry_count = HEADER_STRUCT.unpack_from(self.mm, 0)
+        if magic != TB_MAGIC or version != TB_VERSION:
+            self.close()
+            raise ValueError(f'Not a tablebase, or unsupported version: {path}')
+        self.signature = signature_bytes.rstrip(b'\0').decode('ascii')
+
+    def close(self) -> None:
+        self.mm.close()
+        self.f.close()
+
+    # Returns the entries of one page, for one Player to move.
+    def read_page(self, player_value: int, page_ind: int, page_entry_count: int) -> array:
+        section_start = HEADER_STRUCT.size + 2 * player_value * self.entry_count
+        start = section_start + 2 * page_ind * page_entry_count
+        end = min(start + 2 * page_entry_count, section_start + 2 * self.entry_count)
+        page = array('H', self.mm[start:end])
+        if sys.byteorder == 'big':
+            page.byteswap()
+        return page
+
+
+class TablebaseProbe:
+    def __init__(self, tb_dir: str, max_piece_count=DEFAULT_MAX_PIECE_COUNT,
+            page_entry_count=DEFAULT_PAGE_ENTRY_COUNT,
+            cache_page_count=DEFAULT_CACHE_PAGE_COUNT):
+        self.tb_dir = tb_dir
+        self.max_piece_count = max_piece_count
+        self.page_entry_count = page_entry_count
+        self.cache_page_count = cache_page_count
+
+        # Signature -> TablebaseFile, or None if there is no such file.
+        self.files: Dict[str, Optional[TablebaseFile]] = {}
+        # (signature, Player.value, page index) -> page entries, oldest first.
+        self.pages: OrderedDict = OrderedDict()
+        # (White PieceType values, Black PieceType values)
+        #   -> (signature, is_flipped, runs of identical pieces)
+        self.materials: Dict[Tuple, Tuple] = {}
+        self.page_hit_count = 0
+        self.page_miss_count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        for tb_file in self.files.values():
+            if tb_file is not None:
+                tb_file.close()
+        self.files.clear()
+        self.pages.clear()
+
+    def get_file(self, signature: str) -> Optional[TablebaseFile]:
+        if signature not in self.files:
+            path = os.path.join(self.tb_dir, f'{signature}.gltb')
+            self.files[signature] = TablebaseFile(path) if os.path.exists(path) else None
+        return self.files[signature]
+
+    def get_material(self, white_pt_vals: Tuple[int, ...], black_pt_vals: Tuple[int, ...]):
+        key = (white_pt_vals, black_pt_vals)
+        if key not in self.materials:
+            signature, is_flipped = get_canonical_signature(
+                    [PieceType(pt_val) for pt_val in white_pt_vals],
+                    [PieceType(pt_val) for pt_val in black_pt_vals])
+            self.materials[key] = (signature, is_flipped, Tablebase(signature).runs)
+        return self.materials[key]
+
+    def get_entry(self, signature: str, player_value: int, ind: int) -> Optional[TbEntry]:
+        tb_file = self.get_file(signature)
+        if tb_file is None:
+            return None
+        page_ind, page_offset = divmod(ind, self.page_entry_count)
+        key = (signature, player_value, page_ind)
+        page = self.pages.get(key)
+        if page is None:
+            self.page_miss_count += 1
+            page = tb_file.read_page(player_value, page_ind, self.page_entry_count)
+            self.pages[key] = page
+            if len(self.pages) > self.cache_page_count:
+                self.pages.popitem(last=False)
+        else:
+            self.page_hit_count += 1
+            self.pages.move_to_end(key)
+        entry = page[page_offset]
+        return (entry >> CODE_SHIFT, entry & DEPTH_MASK)
+
+    # Returns (code, depth) for the Player to move (see src.tablebase),
+    # or None if the position isn't covered by a tablebase file.
+    def probe(self, board: Board) -> Optional[TbEntry]:
+        white = []
+        black = []
+        for npos, piece in enumerate(board.pieces):
+            if piece is not None:
+                player_value, pt_val = divmod(piece.code - 1, PIECE_TYPE_COUNT)
+                if pt_val == PAWN:
+                    return None
+                if player_value == Player.White.value:
+                    white.append((pt_val, npos))
+                else:
+                    black.append((pt_val, npos))
+        if len(white) + len(black) > self.max_piece_count:
+            return None
+        white.sort()
+        black.sort()
+        if not white or white[0][0] != KING or not black or black[0][0] != KING:
+            return None
+        signature, is_flipped, runs = self.get_material(
+                tuple(pt_val for pt_val, _ in white), tuple(pt_val for pt_val, _ in black))
+        player_value = board.cur_player.value
+        if is_flipped:
+            white, black = black, white
+            player_value = 1 - player_value
+        squares = [npos for _, npos in white] + [npos for _, npos in black]
+        ind = get_index(get_canonical_squares(squares, runs))
+        return self.get_entry(signature, player_value, ind)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import sys
+import threading
+from typing import List, Optional, TextIO
+
+from src.board import Board
+from src.move_index import MoveIndex
+from src.player import Player
+from src.search import Search, SearchInfo, SearchLimits
+
+
+# An engine front end speaking a UCI-like protocol, adapted for Glinski's
+# chess: positions are given as Glinski FEN strings (see Board.get_fen()),
+# and moves in UCI format (e.g., e4e5, f10f11q). Supported commands:
+#   uci, isready, ucinewgame, quit
+#   position (startpos | fen <fen>) [moves <move> ...]
+#   go [depth N] [movetime MS] [nodes N] [wtime MS] [btime MS] [winc MS] [binc MS]
+#      [movestogo N] [infinite]
+#   stop
+# The search runs in a background thread, so that isready and stop are
+# answered while it runs. Each completed search iteration is reported as
+#   info depth D score (cp X | mate N) nodes N nps N time MS pv <move> ...
+# and the search ends with "bestmove <move>" ("bestmove 0000" if there are
+# no legal moves).
+ENGINE_NAME = 'Glinski'
+ENGINE_AUTHOR = 'Jay M. Coskey'
+
+# With clock times, and no movestogo, this many moves are assumed to remain.
+DEFAULT_MOVES_TO_GO = 30
+
+
+class UciEngine:
+    def __init__(self, out: TextIO=sys.stdout):
+        self.out = out
+        self.out_lock = threading.Lock()
+        self.board = Board()
+        self.search = Search()
+        self.search_thread: Optional[threading.Thread] = None
+
+    def send(self, line: str) -> None:
+        with self.out_lock:
+            self.out.write(line + '\n')
+            self.out.flush()
+
+    def send_info(self, info: SearchInfo) -> None:
+        pv_str = ' '.join(move.to_uci() for move in info.pv)
+        self.send(f'info depth {info.depth} score {info.get_score_str()} nodes {info.nodes} '
+                + f'nps {info.nps} time {info.time_ms} pv {pv_str}')
+
+    def is_searching(self) -> bool:
+        return self.search_thread is not None and self.search_thread.is_alive()
+
+    def stop_search(self) -> None:
+        if self.search_thread is not None:
+            self.search.stop()
+            self.search_thread.join()
+            self.search_thread = None
+
+    # ========================================
+    # SECTION: COMMANDS
+    # ========================================
+    def cmd_position(self, words: List[str]) -> None:
+        if 'moves' in words:
+            moves_ind = words.index('moves')
+            move_texts = words[moves_ind + 1:]
+            words = words[:moves_ind]
+        else:
+            move_texts = []
+        if words == ['startpos']:
+            board = Board()
+        elif words and words[0] == 'fen':
+            try:
+                board = Board(' '.join(words[1:]))
+            except ValueError as e:
+                self.send(f'info string Invalid position: {e}')
+                return
+        else:
+            self.send(f'info string Invalid position command: {" ".join(words)}')
+            return
+        for move_text in move_texts:
+            move = MoveIndex(board).get_move_by_uci(move_text)
+            if move is None:
+                self.send(f'info string Illegal move: {move_text}')
+                return
+            board.move_make(move)
+        self.board = board
+
+    def get_limits(self, words: List[str]) -> SearchLimits:
+        args = {}
+        for name, value in zip(words, words[1:]):
+            if name in ('depth', 'movetime', 'nodes', 'wtime', 'btime',
+                        'winc', 'binc', 'movestogo'):
+                args[name] = int(value)
+        limits = SearchLimits(args.get('depth'), args.get('movetime'), args.get('nodes'))
+        if 'infinite' in words:
+            return limits
+        if limits.movetime_ms is None:
+            is_white = self.board.cur_player == Player.White
+            time_left = args.get('wtime' if is_white else 'btime')
+            if time_left is not None:
+                increment = args.get('winc' if is_white else 'binc', 0)
+                moves_to_go = args.get('movestogo', DEFAULT_MOVES_TO_GO)
+                limits.movetime_ms = max(1, min(time_left // 2,
+                        time_left // max(1, moves_to_go) + increment // 2))
+        return limits
+
+    def cmd_go(self, words: List[str]) -> None:
+        try:
+            limits = self.get_limits(words)
+        except ValueError:
+            self.send(f'info string Invalid go command: {" ".join(words)}')
+            return
+        is_infinite = 'infinite' in words
+        board = self.board.clone()
+        self.search.stop_event.clear()
+
+        def run_search():
+            move = self.search.run(board, limits, self.send_info)
+            if is_infinite:
+                # Per UCI, the best move is sent only once the GUI says stop.
+                self.search.stop_event.wait()
+            self.send(f'bestmove {move.to_uci() if move else "0000"}')
+
+        self.search_thread = threading.Thread(target=run_search, daemon=True)
+        self.search_thread.start()
+
+    # Returns False once the engine should exit.
+    def handle_line(self, line: str) -> bool:
+        words = line.split()
+        if not words:
+            return True
+        cmd, args = words[0], words[1:]
+        if cmd == 'uci':
+            self.send(f'id name {ENGINE_NAME}')
+            self.send(f'id author {ENGINE_AUTHOR}')
+            self.send('uciok')
+        elif cmd == 'isready':
+            self.send('readyok')
+        elif cmd == 'ucinewgame':
+            self.stop_search()
+            self.search.clear()
+            self.board = Board()
+        elif cmd == 'position':
+            self.stop_search()
+            self.cmd_position(args)
+        elif cmd == 'go':
+            self.stop_search()
+            self.cmd_go(args)
+        elif cmd == 'stop':
+            self.stop_search()
+        elif cmd == 'quit':
+            self.stop_search()
+            return False
+        else:
+            self.send(f'info string Unknown command: {cmd}')
+        return True
+
+
+# Usage: python -m src.uci (then UCI commands on stdin)
+def main():
+    engine = UciEngine()
+    for line in sys.stdin:
+        if not engine.handle_line(line):
+            break
+    engine.stop_search()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
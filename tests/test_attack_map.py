@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import unittest
+
+from src.attack_map import AttackMap
+from src.board import Board
+from src.geometry import Geometry as G
+from src.pgn import Pgn
+from src.piece_type import PieceType
+from src.player import Player
+
+
+class TestAttackMap(unittest.TestCase):
+    def test_mobility(self):
+        # Mobility counts the spaces each PieceType could move to (aside
+        # from Pawns, whose captures need a Piece to capture).
+        board = Board()
+        for move_text in 'Qe1c3 Qe10c6 b1b2 b7b6 Bf3b1 e7e6 Nh1i3'.split():
+            board.move_make(Pgn.move_text_to_move(board, move_text))
+            attack_map = AttackMap(board.pieces)
+            p_val = board.cur_player.value
+            for pt in PieceType:
+                if pt == PieceType.Pawn:
+                    continue
+                move_count = sum(1 for move in board.get_moves_pseudolegal() if move.pt == pt)
+                self.assertEqual(attack_map.mobility[p_val][pt.value], move_count, move_text)
+
+    def test_attacks(self):
+        board = Board()
+        attack_map = AttackMap(board.pieces)
+        self.assertEqual(attack_map.king_npos[Player.White.value], G.alg_to_npos('g1'))
+        self.assertEqual(attack_map.occupied[Player.White.value].count(), 18)
+        # The Queen defends the Pawn in front of it, and can't see past it.
+        self.assertTrue(attack_map.attacks[Player.White.value][G.alg_to_npos('e4')])
+        self.assertFalse(attack_map.attacks[Player.White.value][G.alg_to_npos('e6')])
+        # Pawns attack their capture spaces.
+        self.assertTrue(attack_map.attacks[Player.White.value][G.alg_to_npos('g5')])
+        self.assertFalse(attack_map.attacks[Player.White.value][G.alg_to_npos('f6')])
+
+    def test_hanging(self):
+        # The Knight is attacked by the Rook, and defended only by the Pawn.
+        board = Board({
+                Player.Black: {PieceType.King: [G.alg_to_pos('l5')],
+                               PieceType.Rook: [G.alg_to_pos('f10')]},
+                Player.White: {PieceType.King: [G.alg_to_pos('a1')],
+                               PieceType.Knight: [G.alg_to_pos('f6')],
+                               PieceType.Pawn: [G.alg_to_pos('e5')]},
+                })
+        attack_map = AttackMap(board.pieces)
+        self.assertFalse(attack_map.get_hanging(Player.White).any())
+        board.piece_remove(G.alg_to_npos('e5'))
+        attack_map = AttackMap(board.pieces)
+        self.assertEqual(list(attack_map.get_hanging(Player.White).search(1)),
+                         [G.alg_to_npos('f6')])
+        self.assertFalse(attack_map.get_hanging(Player.Black).any())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,8 @@
 
 from copy import deepcopy
 import os
+import subprocess
+import sys
 import unittest
 
 from src.board import Board
@@ -87,7 +89,8 @@ class TestBoard(unittest.TestCase):
             self.assertEqual(b.halfmove_count, k + 1)
             self.assertEqual(b.get_fen_board(), FOOLS_FEN_BOARDS[k + 1])
             self.assertEqual(b.get_zobrist_hash(), FOOLS_ZOBRIST_HASHES[k + 1])
-        # TODO: self.assertTrue(b.is_checkmate)
+        self.assertTrue(b.is_checkmate)
+        self.assertEqual(b.game_state, GameState.WinWhite)
 
 
 class TestBoardConstructor(unittest.TestCase):
@@ -119,6 +122,88 @@ class TestBoardConstructor(unittest.TestCase):
         zh2 = b2.get_zobrist_hash()
         self.assertEqual(zh2, zh1)
 
+    def test_init_board_fen(self):
+        # Position after 1. b1b3 (White's Pawn hop sets the e.p. target)
+        b0 = Board()
+        b0.move_make(Pgn.move_text_to_move(b0, 'b1b3'))
+        fen = b0.get_fen()
+        self.assertEqual(fen.split()[1:], ['b', '-', 'b2', '0', '1'])
+
+        b1 = Board(fen)
+        self.assertEqual(b1.get_fen(), fen)
+        self.assertEqual(b1.cur_player, Player.Black)
+        self.assertEqual(b1.halfmove_count, 1)
+        self.assertEqual(b1.ep_target, G.alg_to_npos('b2'))
+        self.assertEqual(b1.pieces, b0.pieces)
+        self.assertEqual(b1.get_zobrist_hash(), b0.get_zobrist_hash())
+
+        # Play continues from the FEN position
+        b1.move_make(Pgn.move_text_to_move(b1, 'e6'))
+        self.assertEqual(b1.get_fen().split()[1:], ['w', '-', '-', '0', '2'])
+
+    def test_init_board_fen_invalid(self):
+        fen_board = '6/p5P/rp4PR/n1p3P1N/q2p2P2Q/bbb1p1P1BBB/k2p2P2K/n1p3P1N/rp4PR/p5P/6'
+        for fen in [fen_board + '/6',             # Too many files
+                    fen_board.replace('p5P', 'p4P', 1),  # Too few spaces in file
+                    fen_board.replace('q', 'x'),  # Unrecognized piece
+                    fen_board + ' x - - 0 1',     # Unrecognized Player
+                    fen_board + ' w - -']:        # Wrong number of parts
+            with self.assertRaises(ValueError):
+                Board(fen)
+
+    def test_clone(self):
+        b0 = Board()
+        for move_text in ['b1b3', 'e6', 'Nc3']:
+            b0.move_make(Pgn.move_text_to_move(b0, move_text))
+        fen = b0.get_fen()
+
+        b1 = b0.clone()
+        self.assertEqual(b1.get_fen(), fen)
+        self.assertEqual(b1.pieces, b0.pieces)
+        self.assertEqual(b1.get_zobrist_hash(), b0.get_zobrist_hash())
+
+        # Moves on the clone don't affect the original
+        b1.move_make(Pgn.move_text_to_move(b1, 'f6'))
+        self.assertEqual(b0.get_fen(), fen)
+        self.assertNotEqual(b1.get_fen(), fen)
+        b1.move_undo()
+        self.assertEqual(b1.get_fen(), fen)
+
+        # History is copied only on request
+        self.assertEqual(b1.history_move[1:b1.halfmove_count], [None] * (b1.halfmove_count - 1))
+        b2 = b0.clone(copy_history=True)
+        self.assertEqual(b2.history_move, b0.history_move)
+        for _ in range(3):
+            b2.move_undo()
+        self.assertEqual(b2.get_fen(), Board().get_fen())
+        self.assertEqual(b0.get_fen(), fen)
+
+    def test_to_bytes(self):
+        b0 = Board()
+        data0 = b0.to_bytes()
+        self.assertEqual(len(data0), 52)
+        self.assertEqual(Board.from_bytes(data0).get_fen(), b0.get_fen())
+
+        # Position after 1. b1b3 (White's Pawn hop sets the e.p. target)
+        b0.move_make(Pgn.move_text_to_move(b0, 'b1b3'))
+        data1 = b0.to_bytes()
+        self.assertNotEqual(data1, data0)
+        b1 = Board.from_bytes(data1)
+        self.assertEqual(b1.get_fen(), b0.get_fen())
+        self.assertEqual(b1.pieces, b0.pieces)
+        self.assertEqual(b1.get_zobrist_hash(), b0.get_zobrist_hash())
+        self.assertEqual(b1.to_bytes(), data1)
+        self.assertEqual({data1: 'b1b3'}[Board(b0.get_fen()).to_bytes()], 'b1b3')
+
+        # Play continues from the decoded position
+        b1.move_make(Pgn.move_text_to_move(b1, 'e6'))
+        self.assertEqual(b1.get_fen().split()[1:], ['w', '-', '-', '0', '2'])
+
+        with self.assertRaises(ValueError):
+            Board.from_bytes(data1[:-1])
+        with self.assertRaises(ValueError):
+            Board.from_bytes(b'\xff' + data1[1:])
+
     # Moves per piece in their initial location. (Same for each player.)
     #     K:2,Q:6,R:6(3+3),B:12(2+8+2),N:8(4+4),P:17(2*8+1).
     #     Total: 51
@@ -188,7 +273,9 @@ class TestBoardDetectEndgame(unittest.TestCase):
         m1 = Move(G.alg_to_npos('k6'), G.alg_to_npos('g8'))
         m1.pt = PieceType.Knight
         b1.move_make(m1)
-        # TODO: self.assertTrue(b1.is_checkmate)
+        # Check, but not checkmate: Black can escape with Kf11g10.
+        self.assertTrue(b1.is_check)
+        self.assertFalse(b1.is_checkmate)
 
         # Layout from the penultimate position of Fool's Mate
         layout_dict2 = {
@@ -217,12 +304,69 @@ class TestBoardDetectEndgame(unittest.TestCase):
         m2 = Move(G.alg_to_npos('c3'), G.alg_to_npos('f9'))
         m2.pt = PieceType.Queen
         b2.move_make(m2)
-        # TODO: self.assertTrue(b2.is_checkmate)
+        self.assertTrue(b2.is_checkmate)
 
-    # Technically, insufficient material is a subset of dead game.
-    @unittest.skip
+    # Insufficient material (to checkmate) doesn't make a position dead,
+    #   since stalemate is a partial win.
     def test_detect_insufficient_material(self):
-        pass
+        def get_board(white_bishop_alg: str):
+            return Board({
+                Player.Black: {PieceType.King: [G.G10],
+                               PieceType.Rook: [G.G2]},
+                Player.White: {PieceType.King: [G.G1],
+                               PieceType.Bishop: [G.alg_to_pos(white_bishop_alg)]}
+                })
+
+        # The initial layout, and K+R vs K+B, are not dead.
+        self.assertFalse(Board().is_condition_dead_position())
+        b = get_board('c3')
+        self.assertFalse(b.is_condition_insufficient_material())
+
+        # Capturing the Rook leaves K+B(Medium) vs K, which can't checkmate,
+        #   but can stalemate, so it isn't drawn.
+        m = Move(G.alg_to_npos('g1'), G.alg_to_npos('g2'))
+        b.move_make(m)
+        self.assertEqual(m.capture_pt, PieceType.Rook)
+        self.assertTrue(b.is_condition_insufficient_material())
+        self.assertFalse(b.is_condition_dead_position())
+        self.assertEqual(b.game_state, GameState.InPlay)
+
+        # The piece counts are restored by undo.
+        b.move_undo()
+        self.assertEqual(b.material_counts, get_board('c3').material_counts)
+        self.assertEqual(b.bishop_color_counts, get_board('c3').bishop_color_counts)
+        self.assertFalse(b.is_condition_insufficient_material())
+
+        # K+B(Light) vs K can checkmate on the hex board.
+        b = get_board('c4')
+        b.move_make(Move(G.alg_to_npos('g1'), G.alg_to_npos('g2')))
+        self.assertFalse(b.is_condition_insufficient_material())
+        self.assertNotEqual(b.game_state, GameState.Draw)
+
+        # So can K+N vs K.
+        b = Board({Player.Black: {PieceType.King: [G.G10]},
+                   Player.White: {PieceType.King: [G.G1], PieceType.Knight: [G.C3]}})
+        self.assertFalse(b.is_condition_insufficient_material())
+        b = Board({Player.Black: {PieceType.King: [G.G10]},
+                   Player.White: {PieceType.King: [G.G1]}})
+        self.assertTrue(b.is_condition_insufficient_material())
+        self.assertFalse(b.is_condition_dead_position())
+
+    def test_king_vs_king_stalemate(self):
+        # Capturing down to K vs K isn't a draw, since a lone King can be stalemated.
+        b = Board({Player.Black: {PieceType.King: [G.alg_to_pos('a6')],
+                                  PieceType.Rook: [G.alg_to_pos('c5')]},
+                   Player.White: {PieceType.King: [G.alg_to_pos('b4')]}})
+        m = Move(G.alg_to_npos('b4'), G.alg_to_npos('c5'))
+        b.move_make(m)
+        self.assertEqual(m.capture_pt, PieceType.Rook)
+        self.assertEqual(b.game_state, GameState.InPlay)
+
+        b = Board({Player.Black: {PieceType.King: [G.alg_to_pos('a6')]},
+                   Player.White: {PieceType.King: [G.alg_to_pos('b4')]}})
+        self.assertEqual(b.cur_player, Player.White)
+        b.move_make(Move(G.alg_to_npos('b4'), G.alg_to_npos('c6')))
+        self.assertEqual(b.game_state, GameState.WinWhiteStalemate)
 
     def test_detect_nonprogress(self):
         MOVE_TEXTS_REPEATING = {
@@ -314,9 +458,19 @@ class TestBoardDetectEndgame(unittest.TestCase):
             self.assertFalse(b.is_repetition_5x)
 
         # Create the 5th duplicate
-        # TODO: b.move_make(get_next_move())
-        # TODO: self.assertTrue(b.is_repetition_3x)
-        # TODO: self.assertTrue(b.is_repetition_5x)
+        b.move_make(get_next_move())
+        self.assertTrue(b.is_repetition_3x)
+        self.assertTrue(b.is_repetition_5x)
+        self.assertEqual(b.get_max_repetition_count(), 5)
+        self.assertEqual(b.get_repetition_count_since_progress(), 5)
+        self.assertEqual(b.game_state, GameState.Draw)
+
+        # Undo restores the repetition counts
+        b.move_undo()
+        self.assertFalse(b.is_repetition_5x)
+        self.assertEqual(b.get_max_repetition_count(), 4)
+        self.assertEqual(b.get_repetition_count_since_progress(), 4)
+        self.assertEqual(max(b.zobrist_hash_counts.values()), 4)
 
     def test_detect_stalemate(self):
         layout = {
@@ -329,11 +483,12 @@ class TestBoardDetectEndgame(unittest.TestCase):
                 }
             }
         b = Board(layout)
-        move_w = Pgn.move_text_to_move(b, 'Kg2h1')
+        move_w = Pgn.move_text_to_move(b, 'Kg2f1')
         b.move_make(move_w)
         move_b = Pgn.move_text_to_move(b, 'Qh9h2')
         b.move_make(move_b)
-        # TODO: self.assertEqual(b.game_state, GameState.WinBlackStalemate)
+        self.assertTrue(b.is_stalemate)
+        self.assertEqual(b.game_state, GameState.WinBlackStalemate)
 
 
 class TestBoardDetectError(unittest.TestCase):
@@ -389,9 +544,14 @@ class TestBoardMoves(unittest.TestCase):
     def test_move_counts_by_piece_type(self):
         pass
 
-    @unittest.skip
     def test_get_moves_legal(self):
-        pass
+        b = Board()
+        self.assertEqual(len(b.get_moves_legal()), 51)
+        # Moves that would leave the King attacked are excluded.
+        for move_text in ['g5', 'Kh8', 'Nc3']:
+            b.move_make(Pgn.move_text_to_move(b, move_text))
+        legal_moves = b.get_moves_legal()
+        self.assertLess(len(legal_moves), len(b.get_moves_pseudolegal()))
 
     @unittest.skip
     def test_get_moves_pseudolegal(self):
@@ -408,6 +568,68 @@ class TestBoardMoves(unittest.TestCase):
             b.move_undo()
             self.assertEqual(b.get_zobrist_hash(), zhash0)
 
+    def test_pawn_zobrist_hash(self):
+        # Pawns capture, are captured, capture e.p., and promote.
+        b = Board({
+                Player.Black: {PieceType.King: [G.alg_to_pos('l5')],
+                               PieceType.Pawn: [G.alg_to_pos('d4'), G.alg_to_pos('g6'),
+                                                G.alg_to_pos('h2')]},
+                Player.White: {PieceType.King: [G.alg_to_pos('e1')],
+                               PieceType.Pawn: [G.alg_to_pos('c2'), G.alg_to_pos('f6'),
+                                                G.alg_to_pos('i7')]}
+                })
+        b.set_game_state(GameState.InPlay)
+        hashes = [b.pawn_zobrist_hash]
+        self.assertEqual(b.pawn_zobrist_hash, b.get_pawn_zobrist_hash())
+        for move_text in ['c2c4', 'd4c3', 'i7i8=Q', 'h2h1=Q', 'f6g6']:
+            b.move_make(Pgn.move_text_to_move(b, move_text))
+            self.assertEqual(b.pawn_zobrist_hash, b.get_pawn_zobrist_hash(), move_text)
+            self.assertNotIn(b.pawn_zobrist_hash, hashes)
+            hashes.append(b.pawn_zobrist_hash)
+            self.assertEqual(b.clone().pawn_zobrist_hash, b.pawn_zobrist_hash)
+        for pawn_hash in reversed(hashes[:-1]):
+            b.move_undo()
+            self.assertEqual(b.pawn_zobrist_hash, pawn_hash)
+
+        # Moves of other Pieces leave it unchanged.
+        b = Board()
+        pawn_hash = b.pawn_zobrist_hash
+        b.move_make(Pgn.move_text_to_move(b, 'Nc3'))
+        self.assertEqual(b.pawn_zobrist_hash, pawn_hash)
+        self.assertNotEqual(b.get_zobrist_hash(), b.history_zobrist_hash[0])
+
+    def test_fill_moves_pseudolegal(self):
+        def get_attrs(move):
+            return (move.fr_npos, move.to_npos, move.promotion_pt,
+                    move.pt, move.capture_pt, move.ep_target)
+
+        # Packed Moves match the generated Moves, including an e.p. capture,
+        # promotions, and captures.
+        b = Board({
+                Player.Black: {PieceType.King: [G.alg_to_pos('l5')],
+                               PieceType.Rook: [G.alg_to_pos('k7')],
+                               PieceType.Pawn: [G.alg_to_pos('d4'), G.alg_to_pos('g6'),
+                                                G.alg_to_pos('h2')]},
+                Player.White: {PieceType.King: [G.alg_to_pos('e1')],
+                               PieceType.Pawn: [G.alg_to_pos('c2'), G.alg_to_pos('f6'),
+                                                G.alg_to_pos('i7')]}
+                })
+        b.set_game_state(GameState.InPlay)
+        buf = Move.new_buffer()
+        for move_text in ['c2c4', 'd4c3']:
+            b.move_make(Pgn.move_text_to_move(b, move_text))
+            moves = b.get_moves_pseudolegal()
+            count = b.fill_moves_pseudolegal(buf)
+            self.assertEqual([get_attrs(Move.from_packed(buf[k])) for k in range(count)],
+                             [get_attrs(move) for move in moves])
+            self.assertEqual([move.to_packed() for move in moves], list(buf[:count]))
+        self.assertTrue(any(move.ep_target for move in b.history_move[1:]))
+        self.assertTrue(any(move.promotion_pt and move.capture_pt
+                            for move in b.get_moves_pseudolegal()))
+
+        b = Board()
+        self.assertEqual(b.fill_moves_pseudolegal(buf), 51)
+
 
 class TestBoardPuzzles(unittest.TestCase):
     # def setUp(self):
@@ -420,5 +642,23 @@ class TestBoardPuzzles(unittest.TestCase):
         pass
 
 
+class TestBoardImports(unittest.TestCase):
+    # Loading a position and listing its legal moves shouldn't import the
+    # rarely used subsystems (see benchmarks/bench_import.py).
+    def test_minimal_imports(self):
+        code = ('import sys\n'
+                + 'from src.board import Board\n'
+                + 'Board().get_moves_legal()\n'
+                + 'print(" ".join(sorted(sys.modules)))')
+        repo_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.run([sys.executable, '-c', code], cwd=repo_dir,
+                              capture_output=True, text=True, check=True)
+        modules = set(proc.stdout.split())
+        for module in ['hashlib', 'pickle', 'tempfile',
+                       'src.controller', 'src.game', 'src.move_index', 'src.move_spec',
+                       'src.pgn', 'src.svg_template']:
+            self.assertNotIn(module, modules)
+
+
 if __name__ == '__main__':
     unittest.main()
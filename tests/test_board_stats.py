@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import unittest
+
+from src.board import Board
+from src.board_stats import BoardHook, BoardStats, ProfileHook
+from src.pgn import Pgn
+
+
+class RecordingHook(BoardHook):
+    def __init__(self):
+        self.events = []
+
+    def on_phase_begin(self, phase: str) -> None:
+        self.events.append(('begin', phase))
+
+    def on_phase_end(self, phase: str, secs: float) -> None:
+        self.events.append(('end', phase))
+
+
+class TestBoardStats(unittest.TestCase):
+    def tearDown(self):
+        BoardStats.disable()
+        BoardStats.reset()
+
+    def test_disabled_by_default(self):
+        move_make = Board.move_make
+        self.assertFalse(Board.stats()['enabled'])
+        BoardStats.enable()
+        self.assertIsNot(Board.move_make, move_make)
+        BoardStats.disable()
+        self.assertIs(Board.move_make, move_make)
+
+    def test_counts(self):
+        board = Board()
+        move = Pgn.move_text_to_move(board, 'e4e5')
+        hook = RecordingHook()
+        BoardStats.enable([hook])
+        moves = board.get_moves_legal()
+        board.move_make(move)
+        board.move_undo()
+
+        stats = Board.stats()
+        self.assertTrue(stats['enabled'])
+        counts = stats['counts']
+        self.assertEqual(counts['moves_legal_calls'], 1)
+        self.assertEqual(counts['moves_legal'], len(moves))
+        self.assertGreaterEqual(counts['moves_pseudolegal'], len(moves))
+        self.assertEqual(counts['moves_made'], 1)
+        self.assertEqual(counts['moves_unmade'], 1)
+        self.assertEqual(counts['moves_made_partial'], counts['moves_unmade_partial'])
+        self.assertGreater(counts['attack_checks'], 0)
+        self.assertEqual(stats['phase_calls']['end_of_game'], 1)
+        self.assertGreater(stats['phase_secs']['move_make'], 0.0)
+        self.assertIn(('begin', 'move_make'), hook.events)
+        self.assertEqual(hook.events[-1], ('end', 'move_make'))
+
+        # Counts are kept until reset.
+        BoardStats.disable()
+        self.assertEqual(Board.stats()['counts']['moves_made'], 1)
+        BoardStats.reset()
+        self.assertEqual(Board.stats()['counts']['moves_made'], 0)
+
+    def test_profile_hook(self):
+        board = Board()
+        move = Pgn.move_text_to_move(board, 'e4e5')
+        hook = ProfileHook('end_of_game')
+        BoardStats.enable([hook])
+        board.move_make(move)
+        BoardStats.disable()
+        profiled = {entry.code.co_name for entry in hook.profile.getstats()
+                    if not isinstance(entry.code, str)}
+        self.assertIn('has_moves_legal', profiled)
+        self.assertNotIn('get_zobrist_hash', profiled)  # Called after end_of_game
+
+
+if __name__ == '__main__':
+    unittest.main()
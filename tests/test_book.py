@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from src.board import Board
+from src.book import Book, BookBuilder, BookPlayer
+from src.controller import RandomPlayer
+from src.game_archive import GameArchive
+from src.geometry import Geometry as G
+from src.pgn import Pgn
+from src.piece_type import PieceType
+from src.player import Player
+
+
+class TestBook(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pgn_dir = '/data/pgn/'
+        pgn_fname = 'HexagonalChessTournaments_hu.pgn'
+        fname = os.getenv('GLINSKI_HOME') + pgn_dir + pgn_fname
+        game_specs = Pgn.pgn_lines_to_game_specs(Pgn.get_pgn_lines(fname))
+        cls.games = [Pgn.game_spec_to_game(game_spec, 'hu') for game_spec in game_specs[:10]]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.book_path = os.path.join(self.tmp_dir.name, 'test.glbk')
+        self.is_verbose = RandomPlayer.is_verbose
+
+    def tearDown(self):
+        RandomPlayer.is_verbose = self.is_verbose
+        self.tmp_dir.cleanup()
+
+    def test_book_lookup(self):
+        builder = BookBuilder(max_plies=6)
+        for game in self.games:
+            builder.add_game(game)
+        entry_count = builder.write_path(self.book_path)
+        self.assertEqual(entry_count, len(builder.stats))
+
+        with Book(self.book_path) as book:
+            self.assertEqual(book.entry_count, entry_count)
+            board = Board()
+            moves = book.get_moves(board)
+            self.assertEqual(sum(count for _, count, _ in moves), len(self.games))
+            counts = [count for _, count, _ in moves]
+            self.assertEqual(counts, sorted(counts, reverse=True))
+            first_ucis = {game.board.history_move[1].to_uci() for game in self.games}
+            self.assertEqual({move.to_uci() for move, _, _ in moves}, first_ucis)
+
+            # Follow the first Game through the book
+            for move in self.games[0].board.history_move[1:7]:
+                self.assertIn(move.to_uci(), [m.to_uci() for m, _, _ in book.get_moves(board)])
+                board.move_make(GameArchive.packed_move_to_move(board, GameArchive.move_pack(move)))
+            self.assertEqual(book.get_moves(board), [])
+            self.assertIsNone(book.choose_move(board))
+
+    def test_book_skips_illegal_moves(self):
+        def get_board(white_pawn_alg: str, white_move_text: str) -> Board:
+            board = Board({
+                    Player.Black: {PieceType.King: [G.alg_to_pos('l5')],
+                                   PieceType.Pawn: [G.alg_to_pos('d4')]},
+                    Player.White: {PieceType.King: [G.alg_to_pos('e1')],
+                                   PieceType.Pawn: [G.alg_to_pos(white_pawn_alg)]}
+                    })
+            board.move_make(Pgn.move_text_to_move(board, white_move_text))
+            return board
+
+        # Black can capture e.p. after c2c4, but not after c3c4,
+        #   though the two positions have the same Zobrist hash.
+        board_ep = get_board('c2', 'c2c4')
+        board = get_board('c3', 'c3c4')
+        self.assertEqual(board.zobrist_hash, board_ep.zobrist_hash)
+        builder = BookBuilder()
+        move_ep = Pgn.move_text_to_move(board_ep, 'd4c3')
+        builder.stats[(board_ep.zobrist_hash, GameArchive.move_pack(move_ep))] = [1, 0.0, 0]
+        builder.write_path(self.book_path)
+
+        with Book(self.book_path) as book:
+            self.assertEqual([move.to_uci() for move, _, _ in book.get_moves(board_ep)], ['d4c3'])
+            self.assertEqual(book.choose_move(board_ep).capture_pt, PieceType.Pawn)
+            self.assertEqual(book.get_moves(board), [])
+            self.assertIsNone(book.choose_move(board))
+
+    def test_book_from_archive_records(self):
+        builder = BookBuilder(max_plies=6)
+        for game in self.games:
+            builder.add_game(game)
+        f = io.BytesIO()
+        GameArchive.write_games(f, self.games)
+        archive_builder = BookBuilder(max_plies=6)
+        for attrs, packed_moves in GameArchive.read_records(f):
+            archive_builder.add_archive_record(attrs, packed_moves)
+        self.assertEqual(archive_builder.get_entries(), builder.get_entries())
+
+    def test_book_player(self):
+        builder = BookBuilder(max_plies=2)
+        for game in self.games:
+            builder.add_game(game)
+        builder.write_path(self.book_path)
+        book_ucis = {game.board.history_move[1].to_uci() for game in self.games}
+
+        BookPlayer.book = Book(self.book_path)
+        RandomPlayer.is_verbose = False
+        try:
+            random.seed(0)
+            board = Board()
+            move = BookPlayer.choose_move(board)
+            self.assertIn(move.to_uci(), book_ucis)
+            board.move_make(move)
+            board.move_make(BookPlayer.choose_move(board))
+            # Out of book: the fallback Controller chooses a legal move
+            move = BookPlayer.choose_move(board)
+            self.assertIn(move.to_uci(), [m.to_uci() for m in board.get_moves_legal()])
+        finally:
+            BookPlayer.book.close()
+            BookPlayer.book = None
+
+    def test_book_bad_magic(self):
+        with open(self.book_path, 'wb') as f:
+            f.write(b'GLNK' + bytes(6))
+        with self.assertRaises(ValueError):
+            Book(self.book_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.board import Board
+from src.dataset import DatasetWriter, read_chunks
+from src.geometry import Geometry as G
+from src.pgn import Pgn
+from src.piece_type import PieceType
+from src.player import Player
+
+
+class TestDataset(unittest.TestCase):
+    def test_board_to_codes(self):
+        codes = DatasetWriter.board_to_codes(Board())
+        self.assertEqual(len(codes), G.SPACE_COUNT)
+        self.assertEqual(sum(1 for code in codes if code != 0), 36)
+        self.assertEqual(codes[G.alg_to_npos('f1')], 1 + 6 * Player.White.value + PieceType.Bishop.value)
+        self.assertEqual(codes[G.alg_to_npos('g10')], 1 + 6 * Player.Black.value + PieceType.King.value)
+        self.assertEqual(codes[G.alg_to_npos('f6')], 0)
+
+    def test_codes_to_planes(self):
+        codes = np.array([DatasetWriter.board_to_codes(Board())], dtype=np.int8)
+        planes = DatasetWriter.codes_to_planes(codes)
+        self.assertEqual(planes.shape, (1, 12, G.SPACE_COUNT))
+        self.assertEqual(int(planes.sum()), 36)
+        self.assertTrue(np.array_equal(planes[0].argmax(axis=0) + 1, np.where(codes[0] > 0, codes[0], 1)))
+
+    def test_dataset_write_read(self):
+        pgn_dir = '/data/pgn/'
+        pgn_fname = 'HexagonalChessTournaments_hu.pgn'
+        fname = os.getenv('GLINSKI_HOME') + pgn_dir + pgn_fname
+        game_specs = Pgn.pgn_lines_to_game_specs(Pgn.get_pgn_lines(fname))
+        games = [Pgn.game_spec_to_game(game_spec, 'hu') for game_spec in game_specs[:3]]
+        position_count = sum(game.board.halfmove_count + 1 for game in games)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path_prefix = os.path.join(tmp_dir, 'positions')
+            with DatasetWriter(path_prefix, chunk_size=50) as writer:
+                for game in games:
+                    writer.add_game(game)
+            self.assertEqual(writer.position_count, position_count)
+            self.assertEqual(writer.chunk_count, (position_count + 49) // 50)
+
+            chunks = list(read_chunks(path_prefix))
+            codes = np.concatenate([chunk['codes'] for chunk in chunks])
+            player = np.concatenate([chunk['player'] for chunk in chunks])
+            result = np.concatenate([chunk['result'] for chunk in chunks])
+
+        self.assertEqual(codes.shape, (position_count, G.SPACE_COUNT))
+        self.assertEqual(list(codes[0]), DatasetWriter.board_to_codes(Board()))
+        final_ind = games[0].board.halfmove_count
+        self.assertEqual(list(codes[final_ind]), DatasetWriter.board_to_codes(games[0].board))
+        self.assertEqual(player[0], Player.White.value)
+        self.assertEqual(player[1], Player.Black.value)
+        score = {'1-0': 1.0, '0-1': 0.0, '1/2-1/2': 0.5}[games[0].attrs['Result']]
+        self.assertTrue(np.all(result[:final_ind + 1] == score))
+
+
+if __name__ == '__main__':
+    unittest.main()
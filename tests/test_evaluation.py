@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import unittest
+
+from src.board import Board
+from src.evaluation import Evaluator
+from src.geometry import Geometry as G
+from src.pawn_structure import PawnStructure
+from src.pawn_structure import ADVANCE_BONUS, DOUBLED_PENALTY, ISOLATED_PENALTY, PASSED_BONUS
+from src.pgn import Pgn
+from src.piece_type import PieceType
+from src.player import Player
+
+
+def get_board(white_pawn_algs, black_pawn_algs) -> Board:
+    return Board({
+            Player.Black: {PieceType.King: [G.alg_to_pos('l5')],
+                           PieceType.Pawn: [G.alg_to_pos(alg) for alg in black_pawn_algs]},
+            Player.White: {PieceType.King: [G.alg_to_pos('e1')],
+                           PieceType.Pawn: [G.alg_to_pos(alg) for alg in white_pawn_algs]},
+            })
+
+
+class TestPawnStructure(unittest.TestCase):
+    def test_initial(self):
+        self.assertEqual(PawnStructure.evaluate(Board().pieces), 0)
+
+    def test_passed(self):
+        # A lone Pawn is passed, and isolated. It starts 6 steps from promotion.
+        score = PawnStructure.evaluate(get_board(['f5'], []).pieces)
+        self.assertEqual(score, ADVANCE_BONUS[6] + PASSED_BONUS[6] - ISOLATED_PENALTY)
+        # A Pawn ahead on its file, or on an adjacent file, keeps it from being passed.
+        for black_alg in ['f9', 'e8', 'g9']:
+            score = PawnStructure.evaluate(get_board(['f5'], [black_alg]).pieces)
+            self.assertEqual(score, 0, black_alg)
+        # Pawns that have passed each other are both passed.
+        score = PawnStructure.evaluate(get_board(['f8'], ['g7']).pieces)
+        self.assertEqual(score, PawnStructure.evaluate(get_board(['f8'], []).pieces)
+                         + PawnStructure.evaluate(get_board([], ['g7']).pieces))
+
+    def test_doubled_isolated(self):
+        # All three Pawns are isolated, and one is doubled (and a step ahead).
+        score = PawnStructure.evaluate(get_board(['c2', 'c3', 'e4'], []).pieces)
+        self.assertEqual(score, 2 * (ADVANCE_BONUS[6] + PASSED_BONUS[6])
+                         + ADVANCE_BONUS[5] + PASSED_BONUS[5]
+                         - 3 * ISOLATED_PENALTY - DOUBLED_PENALTY)
+        # Connected Pawns aren't isolated.
+        score = PawnStructure.evaluate(get_board([], ['c7', 'd7', 'e7']).pieces)
+        self.assertEqual(score, -3 * (ADVANCE_BONUS[6] + PASSED_BONUS[6]))
+
+
+class TestEvaluator(unittest.TestCase):
+    def test_pawn_table(self):
+        board = Board()
+        evaluator = Evaluator()
+        self.assertEqual(evaluator.evaluate(board), 0)
+        # Moves of other Pieces hit the pawn table.
+        for move_text in ['Nc3', 'Nc6']:
+            board.move_make(Pgn.move_text_to_move(board, move_text))
+            evaluator.evaluate(board)
+        self.assertEqual(evaluator.pawn_probe_count, 3)
+        self.assertEqual(evaluator.pawn_hit_count, 2)
+        board.move_make(Pgn.move_text_to_move(board, 'e4e6'))
+        score = evaluator.evaluate(board)
+        self.assertEqual(evaluator.pawn_hit_count, 2)
+        self.assertEqual(score, -(evaluator.evaluate_material(board)
+                                  + PawnStructure.evaluate(board.pieces)
+                                  + evaluator.evaluate_activity(board)))
+
+        # The pawn table is cleared when full.
+        evaluator = Evaluator(pawn_table_max_size=1)
+        evaluator.evaluate(board)
+        board.move_undo()
+        evaluator.evaluate(board)
+        self.assertEqual(len(evaluator.pawn_table), 1)
+
+    def test_activity(self):
+        evaluator = Evaluator()
+        self.assertEqual(evaluator.evaluate_activity(Board()), 0)
+        # A hanging Knight costs more than the spaces its defender takes.
+        board = Board({
+                Player.Black: {PieceType.King: [G.alg_to_pos('l5')],
+                               PieceType.Rook: [G.alg_to_pos('f10')]},
+                Player.White: {PieceType.King: [G.alg_to_pos('a1')],
+                               PieceType.Knight: [G.alg_to_pos('f6')],
+                               PieceType.Pawn: [G.alg_to_pos('e5')]},
+                })
+        score = evaluator.evaluate_activity(board)
+        board.piece_remove(G.alg_to_npos('e5'))
+        self.assertGreater(score, evaluator.evaluate_activity(board))
+
+
+if __name__ == '__main__':
+    unittest.main()
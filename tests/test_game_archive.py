@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+from contextlib import redirect_stderr, redirect_stdout
+import io
+import os
+import tempfile
+import unittest
+
+from src.game_archive import GameArchive, main
+from src.geometry import Geometry as G
+from src.move import Move
+from src.pgn import Pgn
+from src.piece_type import PieceType
+
+
+class TestGameArchive(unittest.TestCase):
+    def test_move_pack_unpack(self):
+        fr_npos = G.alg_to_npos('f10')
+        to_npos = G.alg_to_npos('f11')
+        for promo_ind, promo_pt in enumerate([None, PieceType.Rook,
+                                              PieceType.Bishop, PieceType.Knight]):
+            packed_move = GameArchive.move_pack(Move(fr_npos, to_npos, promo_pt))
+            self.assertLess(packed_move, 1 << 16)
+            self.assertEqual(GameArchive.move_unpack(packed_move),
+                             (fr_npos, to_npos, promo_ind))
+
+    def test_archive_bad_magic(self):
+        f = io.BytesIO(b'PGN?' + bytes(14))
+        with self.assertRaises(ValueError):
+            GameArchive.read_index(f)
+
+    def test_archive_round_trip(self):
+        pgn_dir = '/data/pgn/'
+        pgn_fname = 'HexagonalChessTournaments_hu.pgn'
+        fname = os.getenv('GLINSKI_HOME') + pgn_dir + pgn_fname
+        game_specs = Pgn.pgn_lines_to_game_specs(Pgn.get_pgn_lines(fname))
+        games = [Pgn.game_spec_to_game(game_spec, 'hu') for game_spec in game_specs[:10]]
+
+        f = io.BytesIO()
+        self.assertEqual(GameArchive.write_games(f, games), 10)
+        self.assertEqual(len(GameArchive.read_index(f)), 10)
+        for game, game_read in zip(games, GameArchive.read_games(f)):
+            self.assertEqual(game_read.attrs, game.attrs)
+            self.assertEqual(game_read.board.halfmove_count, game.board.halfmove_count)
+            self.assertEqual(game_read.board.get_fen(), game.board.get_fen())
+            self.assertEqual([str(move) for move in game_read.board.history_move],
+                             [str(move) for move in game.board.history_move])
+
+    def test_pgn_skipped_games(self):
+        # The second Game has an illegal move.
+        pgn_text = ''.join(f'[Event "{event}"]\n[Result "1-0"]\n\n1. {movetext} 1-0\n\n'
+                           for event, movetext in [('A', 'e4e5 e7e6'), ('B', 'e4e8 e7e6'),
+                                                   ('C', 'Nc3')])
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            pgn_path = os.path.join(tmp_dir, 'test.pgn')
+            archive_path = os.path.join(tmp_dir, 'test.glnk')
+            with open(pgn_path, 'w', encoding='utf-8') as f:
+                f.write(pgn_text)
+
+            skipped = []
+            stdout, stderr = io.StringIO(), io.StringIO()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                games = list(GameArchive.pgn_to_games(pgn_path, skipped=skipped))
+            self.assertEqual([game.attrs['Event'] for game in games], ['A', 'C'])
+            self.assertEqual(skipped, [1])
+            self.assertIn(f'Skipped game 1 of {pgn_path}', stderr.getvalue())
+
+            stdout = io.StringIO()
+            with redirect_stdout(stdout), redirect_stderr(io.StringIO()):
+                main([pgn_path, archive_path])
+            self.assertIn('Wrote 2 games', stdout.getvalue())
+            self.assertIn('(skipped 1)', stdout.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,9 @@
 # by Jay M. Coskey, 2026
 # pylint: disable=invalid-name, too-many-locals
 
+import marshal
+import os
+import tempfile
 import unittest
 
 from src.bitboard import BitBoard, BITBOARD_SPACES
@@ -19,6 +22,7 @@ from src.bitboard import BB_K2, BB_K4, BB_K6
 from src.bitboard import BB_L1, BB_L6
 from src.board_color import BoardColor
 from src.geometry import Geometry as G
+from src.geometry_cache import GeometryCache
 from src.hex_pos import HexPos
 from src.hex_vec import HexVec
 
@@ -238,5 +242,42 @@ class TestGeometry(unittest.TestCase):
         self.assertEqual(computed, expected)
 
 
+class TestGeometryCache(unittest.TestCase):
+    def test_cache_round_trip(self):
+        tables = {'LEAPS_KING': G.LEAPS_KING, 'RAYS_QUEEN': G.RAYS_QUEEN}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'tables.marshal')
+            self.assertIsNone(GeometryCache.read(path))
+            self.assertTrue(GeometryCache.write(path, tables))
+            self.assertEqual(GeometryCache.read(path), tables)
+
+            computed = []
+            def compute_tables():
+                computed.append(True)
+                return tables
+            os.environ['GLINSKI_GEOMETRY_CACHE'] = path
+            try:
+                self.assertEqual(GeometryCache.get_tables(compute_tables), tables)
+                self.assertEqual(computed, [])
+            finally:
+                del os.environ['GLINSKI_GEOMETRY_CACHE']
+
+            # Unreadable caches, and caches written from other source files, are ignored.
+            with open(path, 'wb') as f:
+                f.write(b'not a marshal file')
+            self.assertIsNone(GeometryCache.read(path))
+            with open(path, 'wb') as f:
+                marshal.dump(('0' * 16, tables), f)
+            self.assertIsNone(GeometryCache.read(path))
+
+    def test_cache_write_failure(self):
+        # The rename onto a directory fails, and leaves no temporary file behind.
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'tables.marshal')
+            os.mkdir(path)
+            self.assertFalse(GeometryCache.write(path, {'LEAPS_KING': G.LEAPS_KING}))
+            self.assertEqual(os.listdir(tmp_dir), ['tables.marshal'])
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import unittest
+
+from src.controller import RandomPlayer
+from src.match import get_controller, get_game_args, play_match, play_results
+
+
+class TestMatch(unittest.TestCase):
+    def test_get_controller(self):
+        self.assertIs(get_controller('random'), RandomPlayer)
+        self.assertIs(get_controller('src.controller:RandomPlayer'), RandomPlayer)
+        with self.assertRaises(ValueError):
+            get_controller('nonesuch')
+
+    def test_game_args_alternate_colors(self):
+        game_args = list(get_game_args('a', 'b', 4, 7))
+        self.assertEqual([args[2] for args in game_args], ['a', 'b', 'a', 'b'])
+        self.assertEqual([args[3] for args in game_args], ['b', 'a', 'b', 'a'])
+        self.assertEqual(len({args[1] for args in game_args}), 4)
+
+    def test_match_is_deterministic(self):
+        is_verbose = RandomPlayer.is_verbose
+        RandomPlayer.is_verbose = True
+        try:
+            results1 = list(play_results('random', 'random', 2, match_seed=3, worker_count=1))
+            # Games played in this process don't leave RandomPlayer quiet.
+            self.assertTrue(RandomPlayer.is_verbose)
+        finally:
+            RandomPlayer.is_verbose = is_verbose
+        results2 = list(play_results('random', 'random', 2, match_seed=3, worker_count=2))
+        self.assertEqual(results1, results2)
+
+    def test_match_stats(self):
+        stats = play_match('random', 'src.controller:RandomPlayer', 2, worker_count=1)
+        self.assertEqual(stats.game_count, 2)
+        self.assertEqual(sum(stats.scores.values()), 2)
+        self.assertEqual(sum(stats.halfmove_histo.values()), 2)
+        self.assertEqual(sum(stats.wins.values()) + sum(stats.stalemate_wins.values())
+                         + stats.draw_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import unittest
+
+from src.board import Board
+from src.geometry import Geometry as G
+from src.move_index import MoveIndex
+from src.pgn import Pgn
+from src.piece_type import PieceType
+
+
+class TestMoveIndex(unittest.TestCase):
+    def test_move_index_initial(self):
+        mi = MoveIndex(Board())
+        self.assertEqual(len(mi), 51)
+        self.assertEqual(len(mi.moves_by_uci), 51)
+
+        move = mi.get_move_by_uci('E4E5')
+        self.assertEqual(move.pt, PieceType.Pawn)
+        self.assertEqual(move.fr_npos, G.alg_to_npos('e4'))
+        self.assertEqual(move.to_npos, G.alg_to_npos('e5'))
+        self.assertIsNone(mi.get_move_by_uci('e4e7'))
+
+    def test_move_index_matching(self):
+        mi = MoveIndex(Board())
+        for move_text, uci in [('e5', 'e4e5'), ('e6', 'e4e6'),
+                               ('Nc3', 'd1c3'), ('Nd1c3', 'd1c3'),
+                               ('d1c3', 'd1c3')]:
+            moves = mi.get_moves_matching(Pgn.move_text_to_move_spec(move_text))
+            self.assertEqual([move.to_uci() for move in moves], [uci])
+        for move_text in ['e7', 'Qe1e5', 'Nd1e5']:
+            moves = mi.get_moves_matching(Pgn.move_text_to_move_spec(move_text))
+            self.assertEqual(len(moves), 0)
+
+    def test_move_index_moves_to(self):
+        mi = MoveIndex(Board())
+        to_ucis = sorted(move.to_uci() for move in mi.get_moves_to(G.alg_to_npos('c3')))
+        self.assertEqual(to_ucis, ['c2c3', 'd1c3', 'e1c3'])
+
+
+if __name__ == '__main__':
+    unittest.main()
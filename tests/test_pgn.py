@@ -11,6 +11,7 @@ import unittest
 
 from src.move_spec import MoveSpec
 from src.pgn import Pgn
+from src.piece_type import PieceType
 
 
 class TestPgn(unittest.TestCase):
@@ -91,6 +92,48 @@ class TestPgn(unittest.TestCase):
         cls.check_parsing_moves(cls.FOOLS_MATE_MOVE_TEXT)
         print()
 
+    def test_move_text_to_move_spec_fields(self):
+        ms = Pgn.move_text_to_move_spec('Qc3xBf9#!')
+        self.assertEqual(ms.pt, PieceType.Queen)
+        self.assertEqual((ms.fr_file, ms.fr_rank), ('c', 3))
+        self.assertTrue(ms.is_capture)
+        self.assertEqual(ms.capture_pt, PieceType.Bishop)
+        self.assertEqual((ms.to_file, ms.to_rank), ('f', 9))
+        self.assertEqual(ms.checkness_str, '#')
+        self.assertEqual(ms.move_eval_str, '!')
+
+        # A lone position is the destination.
+        ms = Pgn.move_text_to_move_spec('Kg10')
+        self.assertFalse(ms.fr_file)
+        self.assertEqual((ms.to_file, ms.to_rank), ('g', 10))
+
+        # Captured PieceType after the destination
+        ms = Pgn.move_text_to_move_spec('f7g6xP')
+        self.assertEqual((ms.fr_file, ms.fr_rank), ('f', 7))
+        self.assertEqual((ms.to_file, ms.to_rank), ('g', 6))
+        self.assertEqual(ms.capture_pt, PieceType.Pawn)
+
+        ms = Pgn.move_text_to_move_spec('e5e.p.')
+        self.assertTrue(ms.is_en_passant)
+        self.assertEqual(ms.en_passant_str, 'e.p.')
+
+        ms = Pgn.move_text_to_move_spec('f10f11=Q')
+        self.assertTrue(ms.is_promotion)
+        self.assertEqual(ms.promotion_pt, PieceType.Queen)
+
+        # Hungarian: B ~ Rook (bástya), V ~ Queen (vezér)
+        ms = Pgn.move_text_to_move_spec('Bxe10', lang='hu')
+        self.assertEqual(ms.pt, PieceType.Rook)
+        ms = Pgn.move_text_to_move_spec('k7V', lang='hu')
+        self.assertEqual(ms.promotion_pt, PieceType.Queen)
+
+    def test_move_text_to_move_spec_invalid(self):
+        for move_text in ['0-1', 'remi', '...', 'j5', 'Qc5Q']:
+            with self.assertRaises(ValueError):
+                Pgn.move_text_to_move_spec(move_text)
+        with self.assertRaises(ValueError):
+            Pgn.move_text_to_move_spec('c5Q')  # Promotion outside of promotion space
+
     def test_pgn_lines_to_game_specs(self):
         cls = self.__class__
         game_specs = Pgn.pgn_lines_to_game_specs(cls.FOOLS_MATE_PGN)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from src.board import Board
+from src.pgn import Pgn
+from src.search import Search, SearchLimits, SearchPlayer, score_from_tt, score_to_tt
+from src.search import SCORE_MATE, SCORE_STALEMATE
+from src.search_telemetry import SearchTelemetry
+
+
+class TestSearch(unittest.TestCase):
+    def get_board(self, move_texts):
+        board = Board()
+        for move_text in move_texts:
+            board.move_make(Pgn.move_text_to_move(board, move_text))
+        return board
+
+    def test_mate_in_1(self):
+        # Fool's mate, before White's last move, Qc3xBf9#
+        board = self.get_board('Qe1c3 Qe10c6 b1b2 b7b6 Bf3b1 e7e6'.split())
+        fen = board.get_fen()
+        infos = []
+        move = Search().run(board, SearchLimits(depth=2), infos.append)
+        self.assertEqual(move.to_uci(), 'c3f9')
+        self.assertEqual(board.get_fen(), fen)
+        self.assertEqual(infos[-1].score, SCORE_MATE - 1)
+        self.assertEqual(infos[-1].get_score_str(), 'mate 1')
+        self.assertEqual([move.to_uci() for move in infos[-1].pv], ['c3f9'])
+
+    def test_tt_scores(self):
+        # A mate (or stalemate) found 2 plies below a node stored at ply 3
+        #   is 2 plies below it when probed at ply 1.
+        for score_abs in (SCORE_MATE, SCORE_STALEMATE):
+            for sign in (1, -1):
+                tt_score = score_to_tt(sign * (score_abs - 5), 3)
+                self.assertEqual(tt_score, sign * (score_abs - 2))
+                self.assertEqual(score_from_tt(tt_score, 1), sign * (score_abs - 3))
+        # Other scores are unchanged.
+        self.assertEqual(score_to_tt(-250, 3), -250)
+        self.assertEqual(score_from_tt(-250, 1), -250)
+
+        # The mate in 1 found at the root, if reached at ply 3, is a mate at ply 4.
+        board = self.get_board('Qe1c3 Qe10c6 b1b2 b7b6 Bf3b1 e7e6'.split())
+        search = Search()
+        search.run(board, SearchLimits(depth=2))
+        self.assertEqual(search.negamax(2, -SCORE_MATE, SCORE_MATE, 3), SCORE_MATE - 4)
+
+    def test_limits(self):
+        board = Board()
+        infos = []
+        search = Search()
+        move = search.run(board, SearchLimits(nodes=500), infos.append)
+        self.assertIn(move.to_uci(), [m.to_uci() for m in board.get_moves_legal()])
+        self.assertLess(search.node_count, 500 + 256)
+        self.assertEqual(board.get_fen(), Board().get_fen())
+
+        # A stopped search still returns a move.
+        search.stop()
+        self.assertIsNotNone(search.run(board, SearchLimits()))
+
+    def test_search_player(self):
+        # Black can capture White's Queen on c6.
+        board = self.get_board('Qe1c3 b7b6 Qc3c6'.split())
+        move = SearchPlayer.choose_move(board)
+        self.assertEqual(move.to_npos, Pgn.move_text_to_move(board, 'Nd9xc6').to_npos)
+
+
+class TestSearchTelemetry(unittest.TestCase):
+    def test_records(self):
+        out = io.StringIO()
+        telemetry = SearchTelemetry(out, do_trace=True)
+        move = telemetry.run(Search(), Board(), SearchLimits(depth=3))
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([r['type'] for r in records], ['iteration'] * 3 + ['search'])
+        iterations, search = records[:3], records[3]
+        self.assertEqual([r['depth'] for r in iterations], [1, 2, 3])
+        self.assertEqual(search['bestmove'], move.to_uci())
+        for name in ['nodes', 'qnodes', 'tt_probes', 'tt_hits', 'cutoffs']:
+            self.assertEqual(sum(r[name] for r in iterations), search[name])
+        self.assertIsNone(iterations[0]['branching_factor'])
+        self.assertGreater(iterations[1]['branching_factor'], 1)
+        self.assertGreater(search['cutoffs'], 0)
+        self.assertTrue(0 < search['qnode_share'] < 1)
+        self.assertTrue(0 <= search['first_move_cutoff_rate'] <= 1)
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'trace.json')
+            telemetry.write_trace(path)
+            with open(path) as f:
+                events = json.load(f)['traceEvents']
+        self.assertEqual([e['name'] for e in events], ['depth 1', 'depth 2', 'depth 3', 'search 1'])
+        self.assertTrue(all(e['ph'] == 'X' and e['dur'] >= 0 for e in events))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import asyncio
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import unittest
+
+from src.match import init_worker
+from src.server import GameServer
+
+
+class BrokenExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise BrokenProcessPool('A worker process died')
+
+
+class IllegalMoveExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_result('e1e9')
+        return future
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = GameServer(ProcessPoolExecutor(max_workers=1, initializer=init_worker))
+        self.socket_server = await self.server.start('127.0.0.1', 0)
+        self.port = self.socket_server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        self.socket_server.close()
+        await self.socket_server.wait_closed()
+        self.server.close()
+
+    async def connect(self):
+        return await asyncio.open_connection('127.0.0.1', self.port)
+
+    async def request(self, client, line: str) -> str:
+        reader, writer = client
+        writer.write((line + '\n').encode())
+        await writer.drain()
+        return await self.read_line(client)
+
+    async def read_line(self, client) -> str:
+        reader, _ = client
+        return (await asyncio.wait_for(reader.readline(), timeout=30)).decode().strip()
+
+    async def test_play_against_engine(self):
+        client = await self.connect()
+        self.assertEqual(await self.request(client, 'new human random'), 'game 1 white')
+        self.assertTrue((await self.request(client, 'moves 1')).startswith('moves 1 '))
+        self.assertEqual(await self.request(client, 'move 1 e4e8'),
+                         'error Illegal move in game 1: e4e8')
+        self.assertEqual(await self.request(client, 'move 1 e4e5'), 'move 1 e4e5 InPlay')
+
+        # The engine replies from the process pool.
+        words = (await self.read_line(client)).split()
+        self.assertEqual(words[:2], ['move', '1'])
+        # White to move, on move 2 (the engine's reply may set an e.p. target).
+        fen_words = (await self.request(client, 'fen 1')).split()
+        self.assertEqual(fen_words[3], 'w')
+        self.assertEqual(fen_words[-1], '2')
+        self.assertEqual(await self.request(client, 'join 1 black'),
+                         'error Side black is not open in game 1')
+        self.assertEqual(await self.request(client, 'fen 9'), 'error Unknown game: 9')
+        client[1].close()
+
+    async def test_play_between_clients(self):
+        white = await self.connect()
+        black = await self.connect()
+        self.assertEqual(await self.request(white, 'new human open'), 'game 1 white')
+        self.assertEqual(await self.request(black, 'move 1 e7e6'),
+                         'error Not your move in game 1')
+        self.assertEqual(await self.request(black, 'join 1 black'), 'game 1 black')
+
+        self.assertEqual(await self.request(white, 'move 1 e4e5'), 'move 1 e4e5 InPlay')
+        self.assertEqual(await self.read_line(black), 'move 1 e4e5 InPlay')
+        self.assertEqual(await self.request(black, 'move 1 e7e6'), 'move 1 e7e6 InPlay')
+        self.assertEqual(await self.read_line(white), 'move 1 e7e6 InPlay')
+
+        self.assertEqual(await self.request(white, 'resign 1'), 'end 1 WinBlack 0-1')
+        self.assertEqual(await self.read_line(black), 'end 1 WinBlack 0-1')
+        self.assertEqual(await self.request(black, 'move 1 e6e5'),
+                         'error Game 1 is over')
+        white[1].close()
+        black[1].close()
+
+    async def test_disconnect(self):
+        client = await self.connect()
+        self.assertEqual(await self.request(client, 'new human human'), 'game 1 white black')
+        client[1].write(b'quit\n')
+        await client[1].drain()
+        self.assertEqual(await client[0].read(), b'')
+        self.assertEqual(self.server.sessions, {})
+
+    async def test_unknown_controller(self):
+        client = await self.connect()
+        # Only named Controllers are accepted, so clients can't import modules.
+        for line in ['new human nosuch.mod:X', 'new os:getcwd human',
+                     'new src.controller:RandomPlayer human']:
+            self.assertEqual((await self.request(client, line)).split()[:3],
+                             ['error', 'Unknown', 'Controller:'], line)
+        self.assertEqual(self.server.sessions, {})
+        client[1].close()
+
+    async def test_engine_failure(self):
+        self.server.executor.shutdown()
+        self.server.executor = BrokenExecutor()
+        client = await self.connect()
+        self.assertEqual(await self.request(client, 'new random human'), 'game 1 black')
+        self.assertEqual(await self.read_line(client), 'end 1 Abandoned (Score TBD)')
+        self.assertEqual(await self.request(client, 'move 1 e7e6'), 'error Game 1 is over')
+
+        # So does a Game whose Controller chooses an illegal move.
+        self.server.executor = IllegalMoveExecutor()
+        self.assertEqual(await self.request(client, 'new random human'), 'game 2 black')
+        self.assertEqual(await self.read_line(client), 'end 2 Abandoned (Score TBD)')
+        client[1].close()
+
+
+if __name__ == '__main__':
+    unittest.main()
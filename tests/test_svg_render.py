@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import os
+import tempfile
+import unittest
+import zipfile
+
+from src.board import Board
+from src.pgn import Pgn
+from src.svg_render import SvgRenderer
+from src.svg_template import SvgTemplate
+
+
+class TestSvgRender(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def get_moves(self, move_texts):
+        board = Board()
+        moves = []
+        for move_text in move_texts:
+            move = Pgn.move_text_to_move(board, move_text)
+            board.move_make(move)
+            moves.append(move)
+        return moves
+
+    def test_template_split(self):
+        path = SvgTemplate.get_default_path()
+        template = SvgTemplate.get(path)
+        self.assertIs(SvgTemplate.get(), template)
+        self.assertTrue(template.head.rstrip().endswith('BEGIN_LAYOUT'))
+        self.assertIn('END_LAYOUT', template.tail.splitlines()[0])
+
+        # Rendering reproduces the template, apart from the layout block.
+        with open(path, 'r') as f:
+            text = f.read()
+        self.assertTrue(text.startswith(template.head))
+        self.assertTrue(text.endswith(template.tail))
+
+        with self.assertRaises(ValueError):
+            SvgTemplate('<svg></svg>\n')
+
+    def test_frames(self):
+        # Fool's mate, ending in checkmate
+        move_texts = 'Qe1c3 Qe10c6 b1b2 b7b6 Bf3b1 e7e6 Qc3xBf9#'.split()
+        renderer = SvgRenderer(game_name='fools')
+        frames = renderer.get_frames(self.get_moves(move_texts))
+        self.assertEqual(len(frames), len(move_texts) + 1)
+        self.assertEqual(frames[0], ('fools_000.svg', Board().svg_get_str()))
+        self.assertEqual(frames[-1][0], 'fools_007.svg')
+        self.assertIn('FROM_COORDS = C3', frames[-1][1])
+        self.assertIn('TO_COORDS = F9', frames[-1][1])
+        self.assertIn('KING_CHECKMATE_COORDS = G10', frames[-1][1])
+
+        out_dir = os.path.join(self.tmp_dir.name, 'frames')
+        self.assertEqual(renderer.write_frames(frames, out_dir, worker_count=4), len(frames))
+        for fname, svg_content in frames:
+            with open(os.path.join(out_dir, fname), 'r') as f:
+                self.assertEqual(f.read(), svg_content)
+
+        zip_path = os.path.join(self.tmp_dir.name, 'fools.zip')
+        self.assertEqual(renderer.write_zip(frames, zip_path), len(frames))
+        with zipfile.ZipFile(zip_path) as zf:
+            self.assertEqual(zf.namelist(), [fname for fname, _ in frames])
+            self.assertEqual(zf.read('fools_003.svg').decode(), frames[3][1])
+
+
+if __name__ == '__main__':
+    unittest.main()
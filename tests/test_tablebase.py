@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import os
+import tempfile
+import unittest
+
+from src.board import Board
+from src.geometry import Geometry as G
+from src.piece_type import PieceType
+from src.player import Player
+from src.tablebase import KING_DOMAIN, LEAPS, RAYS, SYMMETRIES
+from src.tablebase import TB_DRAW, TB_LOSS, TB_STALEMATED, TB_STALEMATING, TB_UNUSED
+from src.tablebase import Tablebase, TablebaseGenerator
+from src.tablebase import get_canonical_signature, parse_signature
+
+
+class TestTablebase(unittest.TestCase):
+    @classmethod
+    def squares_to_board(cls, tb: Tablebase, player: Player, squares) -> Board:
+        layout = G.get_layout_dict_empty()
+        for k, (pt_val, npos) in enumerate(zip(tb.pt_vals, squares)):
+            piece_player = Player.White if k < tb.white_count else Player.Black
+            layout[piece_player][PieceType(pt_val)].append(G.npos_to_pos(npos))
+        board = Board(layout)
+        board.init_defaults(player)
+        return board
+
+    def test_symmetries(self):
+        self.assertEqual(len(set(SYMMETRIES)), 12)
+        self.assertEqual(SYMMETRIES[0], tuple(range(G.SPACE_COUNT)))
+        self.assertEqual(len(KING_DOMAIN), 12)
+        for sym in SYMMETRIES:
+            for npos in range(G.SPACE_COUNT):
+                for pt_val, leaps in LEAPS.items():
+                    self.assertEqual({sym[leap] for leap in leaps[npos]}, set(leaps[sym[npos]]))
+                for pt_val, rays in RAYS.items():
+                    self.assertEqual({tuple(sym[ray_npos] for ray_npos in ray) for ray in rays[npos]},
+                                     set(rays[sym[npos]]))
+
+    def test_signatures(self):
+        K, Q, R = PieceType.King, PieceType.Queen, PieceType.Rook
+        self.assertEqual(parse_signature('KQvK'), ([K, Q], [K]))
+        self.assertEqual(parse_signature('QKvK'), ([K, Q], [K]))
+        self.assertEqual(get_canonical_signature([K, Q], [K]), ('KQvK', False))
+        self.assertEqual(get_canonical_signature([K], [K, Q]), ('KQvK', True))
+        self.assertEqual(get_canonical_signature([K, R], [K, Q]), ('KQvKR', True))
+        for signature in ['KQK', 'KPvK', 'KQvQ', 'KXvK']:
+            with self.assertRaises(ValueError):
+                parse_signature(signature)
+
+    # Each position's value must follow from the values after its legal moves,
+    # as found by Board.
+    def test_king_vs_king(self):
+        tb = TablebaseGenerator().get_tablebase('KvK')
+        for player in [Player.White, Player.Black]:
+            counts = tb.get_code_counts(player)
+            self.assertEqual(counts['Stalemated'], 1)
+            self.assertEqual(counts['Stalemating'], 4)
+            for ind in range(tb.entry_count):
+                code, depth = tb.get_entry(player, ind)
+                if code == TB_UNUSED:
+                    continue
+                board = self.squares_to_board(tb, player, tb.get_squares(ind))
+                moves = board.get_moves_legal()
+                if not moves:
+                    self.assertFalse(board.is_npos_attacked(board.get_king_npos(player),
+                                                            player.opponent()))
+                    self.assertEqual((code, depth), (TB_STALEMATED, 0))
+                    continue
+                best_code = TB_LOSS
+                for move in moves:
+                    board.move_make(move, do_partial_only=True)
+                    next_squares = [board.get_king_npos(Player.White), board.get_king_npos(Player.Black)]
+                    next_code, _ = tb.probe_squares(player.opponent(), next_squares)
+                    board.move_undo(do_partial_only=True)
+                    best_code = max(best_code, 4 - next_code)
+                self.assertEqual(code, best_code)
+                self.assertEqual(depth, 1 if code == TB_STALEMATING else 0)
+
+    def test_read_write(self):
+        generator = TablebaseGenerator()
+        tb = generator.get_tablebase('KvK')
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'KvK.gltb')
+            tb.write_path(path)
+            tb2 = Tablebase.read_path(path)
+        self.assertEqual(tb2.signature, 'KvK')
+        self.assertEqual(tb2.entries, tb.entries)
+        squares = [G.alg_to_npos('f6'), G.alg_to_npos('f9')]
+        self.assertEqual(tb2.probe_squares(Player.White, squares), (TB_DRAW, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import tempfile
+import unittest
+
+from src.board import Board
+from src.geometry import Geometry as G
+from src.piece import Piece
+from src.piece_type import PieceType
+from src.player import Player
+from src.tablebase import TB_UNUSED, TablebaseGenerator
+from src.tablebase_probe import TablebaseProbe
+
+
+class TestTablebaseProbe(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tb = TablebaseGenerator(self.tmp_dir.name).get_tablebase('KvK')
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    @classmethod
+    def get_board(cls, player: Player, placements) -> Board:
+        layout = G.get_layout_dict_empty()
+        for piece_player, pt, alg in placements:
+            layout[piece_player][pt].append(G.alg_to_pos(alg))
+        board = Board(layout)
+        board.init_defaults(player)
+        return board
+
+    def test_probe_matches_tablebase(self):
+        with TablebaseProbe(self.tmp_dir.name, page_entry_count=64, cache_page_count=2) as probe:
+            for player in [Player.White, Player.Black]:
+                for ind in range(self.tb.entry_count):
+                    entry = self.tb.get_entry(player, ind)
+                    if entry[0] == TB_UNUSED:
+                        continue
+                    white_king, black_king = self.tb.get_squares(ind)
+                    board = Board(G.get_layout_dict_empty())
+                    board.init_defaults(player)
+                    board.pieces[white_king] = Piece(Player.White, PieceType.King)
+                    board.pieces[black_king] = Piece(Player.Black, PieceType.King)
+                    self.assertEqual(probe.probe(board), entry)
+            self.assertLessEqual(len(probe.pages), 2)
+            self.assertGreater(probe.page_hit_count, 0)
+
+    def test_probe_uncovered(self):
+        with TablebaseProbe(self.tmp_dir.name) as probe:
+            self.assertIsNone(probe.probe(Board()))
+            K, Q, P = PieceType.King, PieceType.Queen, PieceType.Pawn
+            board = self.get_board(Player.White, [(Player.White, K, 'f1'), (Player.White, Q, 'f2'),
+                                                  (Player.Black, K, 'f11')])
+            self.assertIsNone(probe.probe(board))
+            self.assertIsNone(probe.files['KQvK'])
+            board = self.get_board(Player.White, [(Player.White, K, 'f1'), (Player.White, P, 'f5'),
+                                                  (Player.Black, K, 'f11')])
+            self.assertIsNone(probe.probe(board))
+
+
+if __name__ == '__main__':
+    unittest.main()
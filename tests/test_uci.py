@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# by Jay M. Coskey, 2026
+
+import io
+import time
+import unittest
+
+from src.board import Board
+from src.uci import UciEngine
+
+
+class TestUci(unittest.TestCase):
+    def setUp(self):
+        self.out = io.StringIO()
+        self.engine = UciEngine(self.out)
+
+    def get_lines(self):
+        return self.out.getvalue().splitlines()
+
+    def test_handshake(self):
+        self.assertTrue(self.engine.handle_line('uci'))
+        self.assertEqual(self.get_lines()[-1], 'uciok')
+        self.engine.handle_line('isready')
+        self.assertEqual(self.get_lines()[-1], 'readyok')
+        self.assertFalse(self.engine.handle_line('quit'))
+
+    def test_position(self):
+        self.engine.handle_line('position startpos moves e4e5 e7e6')
+        self.assertEqual(self.engine.board.halfmove_count, 2)
+        fen = self.engine.board.get_fen()
+        self.engine.handle_line('position fen ' + fen + ' moves f5f6')
+        self.assertEqual(self.engine.board.halfmove_count, 3)
+
+        self.engine.handle_line('position startpos moves e4e8')
+        self.assertEqual(self.get_lines()[-1], 'info string Illegal move: e4e8')
+        self.assertEqual(self.engine.board.halfmove_count, 3)
+
+    def test_go_depth(self):
+        # Fool's mate, before White's last move, Qc3xBf9#
+        self.engine.handle_line('position startpos moves e1c3 e10c6 b1b2 b7b6 f3b1 e7e6')
+        self.engine.handle_line('go depth 2')
+        self.engine.search_thread.join(timeout=60)
+        lines = self.get_lines()
+        self.assertTrue(lines[-2].startswith('info depth 2 score mate 1 nodes '))
+        self.assertIn(' nps ', lines[-2])
+        self.assertEqual(lines[-1], 'bestmove c3f9')
+
+    def test_stop(self):
+        self.engine.handle_line('go infinite')
+        self.engine.handle_line('isready')
+        self.assertIn('readyok', self.get_lines())
+        time.sleep(0.2)
+        time_start = time.perf_counter()
+        self.engine.handle_line('stop')
+        self.assertLess(time.perf_counter() - time_start, 1.0)
+        self.assertTrue(self.get_lines()[-1].startswith('bestmove '))
+        self.assertEqual(self.engine.board.get_fen(), Board().get_fen())
+
+
+if __name__ == '__main__':
+    unittest.main()